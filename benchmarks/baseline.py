@@ -0,0 +1,97 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+"""
+Store benchmark results and compare them with a baseline.
+
+Shared by the benchmark scripts, which all report a mapping of benchmark name to
+measurements and accept the same `--json`, `--output`, `--baseline`, `--threshold`
+and `--save-baseline` options.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+from typing import Dict, List
+
+Results = Dict[str, dict]
+
+def add_arguments(parser: argparse.ArgumentParser, threshold: float) -> None:
+    """Add the options to output, store and check results."""
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    parser.add_argument("--output", help="Write machine-readable results to this file")
+    parser.add_argument("--baseline", help="Fail if slower than the results stored in this file")
+    parser.add_argument("--threshold", type=float, default=threshold,
+                        help=f"Allowed slowdown over the baseline, as a fraction (default: {threshold}). "
+                             "Benchmarks that declare a larger threshold use that one")
+    parser.add_argument("--save-baseline", help="Store the results as a new baseline in this file")
+
+def merge(runs: List[Results], key: str) -> Results:
+    """
+    Combine the results of several processes into one.
+
+    Each measurement becomes the median over the processes, and the spread of `key` between
+    the fastest and slowest process is recorded to show how noisy the machine is.
+    """
+    merged = {}
+    for name in runs[0]:
+        measured = [run[name] for run in runs if name in run]
+        result = dict(measured[0], processes=len(measured))
+        for field, value in measured[0].items():
+            if isinstance(value, float):
+                result[field] = statistics.median(m[field] for m in measured)
+        values = [m[key] for m in measured]
+        result["spread"] = max(values) / min(values) - 1
+        merged[name] = result
+    return merged
+
+def compare(results: Results, baseline: Results, key: str, threshold: float) -> List[str]:
+    """Return a description of every benchmark slower than its baseline by more than its threshold."""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        allowed = max(threshold, reference.get("threshold") or 0.0)
+        if reference.get("spread", 0.0) > allowed:
+            print(f"WARNING {name}: the baseline varied by {reference['spread']:.0%} between processes, "
+                  f"more than the {allowed:.0%} threshold", file=sys.stderr)
+        ratio = result[key] / reference[key]
+        if ratio > 1 + allowed:
+            regressions.append(f"{name}: {ratio:.2f}x the baseline {key} ({result[key]:.6g} vs {reference[key]:.6g}, "
+                               f"allowed {1 + allowed:.2f}x)")
+    return regressions
+
+def finish(args: argparse.Namespace, results: Results, key: str) -> None:
+    """Print, write and store `results` as asked by `args`, and exit with an error on regressions."""
+    report = {"python": platform.python_version(), "platform": platform.platform(), "results": results}
+    if args.json:
+        print(json.dumps(report, indent=2))
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+                f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, key, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,217 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+"""
+Benchmark the client's hot paths and compare them with a stored baseline.
+
+Covers model parsing of large listings and DOIs, serialization of large transfer
+requests, `get_transfer_field` value conversion and the per-request overhead of
+`EOSCClient.request` against a local `APIEmulator`. Results are times per operation.
+
+Each sample loops over the benchmark for at least `--min-time` seconds, and the fastest
+of `--runs` samples is kept. With `--processes`, the suite runs in several fresh
+interpreters and the median of their results is reported, along with the spread between
+them. With `--baseline`, the run fails if any benchmark is slower than in the baseline by
+more than `--threshold`, or more for the microbenchmarks, and warns about benchmarks whose
+baseline varied between processes by more than that. Baselines depend on the machine, so
+compare runs made on the same, quiet hardware.
+
+    python benchmarks/bench_client.py
+    python benchmarks/bench_client.py --quick --json --output results.json
+    python benchmarks/bench_client.py --quick --processes 3 --baseline benchmarks/baselines/client.json
+    python benchmarks/bench_client.py --processes 5 --save-baseline benchmarks/baselines/client.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from baseline import Results, add_arguments, finish, merge
+
+# Import the package from this checkout, so the script runs without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.emulator import APIEmulator
+from eosc_data_transfer_client.endpoints import _parse_field
+from eosc_data_transfer_client.models import (
+    FileTransfer,
+    StorageContent,
+    TransferParameters,
+    TransferRequest,
+    TransferStatusList,
+)
+
+# (setup, number of operations per call, threshold); setup returns the function to time,
+# and a threshold of None uses --threshold
+Benchmark = Tuple[Callable[[], Callable[[], None]], int, Optional[float]]
+
+# Sub-microsecond and loopback timings swing much more between runs than parsing large bodies
+MICRO_THRESHOLD = 0.5
+
+def make_status(i: int) -> dict:
+    return {
+        "kind": "transfer", "jobId": f"job-{i}", "jobState": "ACTIVE", "source_se": "https://zenodo.org",
+        "destination_se": "s3s://play.min.io", "verifyChecksum": "both", "overwrite": True, "priority": 3,
+        "retry": 0, "retryDelay": 0, "cancel": False, "submittedAt": "2025-01-01T00:00:00",
+        "submittedTo": "fts.example.org", "finishedAt": None, "reason": "", "vo_name": "my-vo",
+        "user_dn": "/CN=user", "cred_id": "cred",
+    }
+
+def make_element(i: int) -> dict:
+    return {
+        "kind": "StorageElement", "name": f"file-{i}.dat", "path": f"/data/file-{i}.dat", "isFolder": False,
+        "isAccessible": True, "size": 1 << 20, "mediaType": "application/octet-stream",
+        "accessUrl": f"https://zenodo.org/records/1/files/file-{i}.dat",
+        "downloadUrl": f"https://zenodo.org/records/1/files/file-{i}.dat?download=1", "checksum": f"md5:{i:032x}",
+    }
+
+def bench_status_list(count: int) -> Benchmark:
+    def setup() -> Callable[[], None]:
+        client = EOSCClient("http://localhost")
+        raw = json.dumps({"kind": "TransferStatusList", "count": count,
+                          "transfers": [make_status(i) for i in range(count)]}).encode()
+        return lambda: TransferStatusList(**client.json_backend.loads(raw))
+    return setup, 1, None
+
+def bench_storage_content(count: int) -> Benchmark:
+    def setup() -> Callable[[], None]:
+        client = EOSCClient("http://localhost")
+        raw = json.dumps({"kind": "StorageContent", "count": count,
+                          "elements": [make_element(i) for i in range(count)]}).encode()
+        return lambda: StorageContent(**client.json_backend.loads(raw))
+    return setup, 1, None
+
+def bench_transfer_request(count: int) -> Benchmark:
+    def setup() -> Callable[[], None]:
+        files = [FileTransfer(sources=[f"https://zenodo.org/files/{i}"], destinations=[f"s3s://play.min.io/bucket/{i}"],
+                              checksum="ADLER32:deadbeef", filesize=1 << 20) for i in range(count)]
+        transfer = TransferRequest(files=files, params=TransferParameters())
+        return lambda: transfer.model_dump_json().encode("utf-8")
+    return setup, 1, None
+
+FIELD_VALUES = {"jobState": "ACTIVE", "priority": "3", "cancel": "false", "submittedAt": "2025-01-01T00:00:00",
+                "finishedAt": "2025-01-01T01:00:00", "overwrite": "true", "retry": 2}
+
+def bench_field_conversion(count: int) -> Benchmark:
+    def setup() -> Callable[[], None]:
+        responses = [(name, {"entity": value}) for name, value in FIELD_VALUES.items()] * (count // len(FIELD_VALUES))
+
+        def run() -> None:
+            for name, response in responses:
+                _parse_field(name, response)
+        return run
+    return setup, count // len(FIELD_VALUES) * len(FIELD_VALUES), MICRO_THRESHOLD
+
+def bench_request(count: int, emulator: APIEmulator) -> Benchmark:
+    def setup() -> Callable[[], None]:
+        client = EOSCClient(emulator.url)
+        client.request("GET", "/user/info")
+
+        def run() -> None:
+            for _ in range(count):
+                client.request("GET", "/user/info")
+        return run
+    return setup, count, MICRO_THRESHOLD
+
+def benchmarks(quick: bool, emulator: APIEmulator) -> Dict[str, Benchmark]:
+    # The quick suite is a subset of the full one, so both compare with the same baseline
+    sizes = [10000] if quick else [10000, 100000]
+    suite = {f"status_list_parse[{size}]": bench_status_list(size) for size in [1000] + sizes}
+    suite.update({f"storage_content_parse[{size}]": bench_storage_content(size) for size in sizes})
+    suite.update({f"transfer_request_serialize[{size}]": bench_transfer_request(size) for size in sizes})
+    suite["get_transfer_field_convert[7000]"] = bench_field_conversion(7000)
+    suite["client_request[50]"] = bench_request(50, emulator)
+    return suite
+
+def run(setup: Callable[[], Callable[[], None]], ops: int, runs: int, min_time: float) -> Dict[str, float]:
+    """Time `runs` samples of the function returned by `setup`, in seconds per operation."""
+    func = setup()
+    # Like timeit.autorange, loop enough for each sample to outlast timer and scheduler noise
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - start >= min_time:
+            break
+        loops *= 2
+    samples: List[float] = []
+    # Like timeit, keep the garbage collector from adding pauses that depend on earlier benchmarks
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(runs):
+            start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            samples.append((time.perf_counter() - start) / (loops * ops))
+    finally:
+        gc.enable()
+    # The fastest sample is the least affected by noise from the rest of the system
+    return {"median_s": statistics.median(samples), "min_s": min(samples), "runs": runs, "loops": loops, "ops": ops}
+
+def run_processes(args: argparse.Namespace) -> Results:
+    """Run the suite in `args.processes` fresh interpreters and merge their results."""
+    command = [sys.executable, os.path.abspath(__file__), "--json", "--processes", "1",
+               "--runs", str(args.runs), "--min-time", str(args.min_time)]
+    if args.quick:
+        command.append("--quick")
+    if args.filter:
+        command += ["--filter", args.filter]
+    runs = []
+    for i in range(args.processes):
+        output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+        runs.append(json.loads(output)["results"])
+        if not args.json:
+            print(f"process {i + 1}/{args.processes} done", file=sys.stderr)
+    return merge(runs, "min_s")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Number of timed samples per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.1, help="Minimum duration of a sample, in seconds")
+    parser.add_argument("--processes", type=int, default=1, help="Number of fresh interpreters to run the suite in")
+    parser.add_argument("--quick", action="store_true", help="Skip the largest input sizes")
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this string")
+    add_arguments(parser, threshold=0.2)
+    args = parser.parse_args()
+
+    if args.processes > 1:
+        results = run_processes(args)
+    else:
+        results = {}
+        with APIEmulator() as emulator:
+            for name, (setup, ops, threshold) in benchmarks(args.quick, emulator).items():
+                if args.filter and args.filter not in name:
+                    continue
+                results[name] = run(setup, ops, args.runs, args.min_time)
+                if threshold is not None:
+                    results[name]["threshold"] = threshold
+    if not args.json:
+        for name, result in results.items():
+            spread = f", spread {result['spread']:.0%}" if "spread" in result else ""
+            print(f"{name}: median {result['median_s'] * 1e6:.2f} us/op (min {result['min_s'] * 1e6:.2f}{spread})")
+
+    finish(args, results, "min_s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+"""
+Measure the time needed to import the package in a fresh interpreter.
+
+Each run starts a new Python process, so the numbers include everything a
+short-lived script or cron job pays at startup. With `--baseline`, the run fails if
+the median import time of any module is slower than in the baseline by more than
+`--threshold`.
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --module eosc_data_transfer_client.endpoints --runs 50 --json
+    python benchmarks/bench_import.py --baseline benchmarks/baselines/import.json
+    python benchmarks/bench_import.py --runs 50 --save-baseline benchmarks/baselines/import.json
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+from baseline import add_arguments, finish
+
+# The interpreters start in the checkout, so they import the package from it without installing it
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def time_import(module: str) -> float:
+    """Return the time, in milliseconds, needed to import `module` in a new interpreter."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; "
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return float(output)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", action="append", help="Module to import (repeatable)")
+    parser.add_argument("--runs", type=int, default=20, help="Number of fresh interpreters per module")
+    add_arguments(parser, threshold=0.25)
+    args = parser.parse_args()
+
+    results = {}
+    for module in args.module or ["eosc_data_transfer_client", "eosc_data_transfer_client.endpoints"]:
+        samples = [time_import(module) for _ in range(args.runs)]
+        median = statistics.median(samples)
+        results[module] = {
+            "median_ms": median,
+            "min_ms": min(samples),
+            "max_ms": max(samples),
+            "runs": args.runs,
+        }
+
+    if not args.json:
+        for module, result in results.items():
+            print(f"{module}: median {result['median_ms']:.2f} ms (min {result['min_ms']:.2f}, max {result['max_ms']:.2f})")
+
+    # Each sample is a separate interpreter, so the median is already robust to a slow process
+    finish(args, results, "median_ms")
+
+if __name__ == "__main__":
+    main()
@@ -12,9 +12,34 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from .client import EOSCClient
-from .models import TransferRequest, TransferResponse, TransferStatus, TransferStatusList, TransferParameters, FileTransfer, UserInfo
-from .endpoints import create_transfer, list_transfers, get_transfer_status, get_transfer_field, cancel_transfer, parse_doi, get_user_info
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Submodules are imported on first attribute access, so `import eosc_data_transfer_client`
+# does not pay for loading requests and pydantic or building the model schemas.
+_LAZY_ATTRIBUTES = {
+    "EOSCClient": "client",
+    "TransferRequest": "models",
+    "TransferResponse": "models",
+    "TransferStatus": "models",
+    "TransferStatusList": "models",
+    "TransferParameters": "models",
+    "FileTransfer": "models",
+    "UserInfo": "models",
+    "create_transfer": "endpoints",
+    "list_transfers": "endpoints",
+    "get_transfer_status": "endpoints",
+    "get_transfer_field": "endpoints",
+    "cancel_transfer": "endpoints",
+    "parse_doi": "endpoints",
+    "get_user_info": "endpoints",
+}
+
+if TYPE_CHECKING:
+    from .client import EOSCClient
+    from .models import TransferRequest, TransferResponse, TransferStatus, TransferStatusList, TransferParameters, FileTransfer, UserInfo
+    from .endpoints import create_transfer, list_transfers, get_transfer_status, get_transfer_field, cancel_transfer, parse_doi, get_user_info
 
 __all__ = [
     "EOSCClient",
@@ -25,9 +50,20 @@ __all__ = [
     "create_transfer",
     "list_transfers",
     "get_transfer_status",
-    "get_transfer_filed",
+    "get_transfer_field",
     "cancel_transfer",
     "parse_doi",
     "get_user_info"
 ]
 
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,222 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import asyncio
+import contextvars
+import httpx
+import time
+from typing import TYPE_CHECKING, Any, Optional, Union
+from .client import DEFAULT_TIMEOUT, Timeout
+from .cache import DOICache, StatusCache
+from .coalesce import RequestCoalescer
+from .exceptions import EOSCError, EOSCRequestError
+from .metrics import Metrics, record_attempt
+from .ratelimit import RateLimiter
+from .serialization import JSONBackend, default_backend
+from .retry import RetryPolicy, RetryStats
+from .utils import raise_for_status, decode_response, endpoint_template
+
+if TYPE_CHECKING:
+    from .journal import TransferJournal
+
+class AsyncEOSCClient:
+    """
+    An asyncio client for interacting with the EOSC Data Transfer API.
+
+    Mirrors `EOSCClient` but sends requests through a pooled, keep-alive
+    `httpx.AsyncClient`, so many requests can be in flight on one event loop
+    without a thread per request. Errors are mapped to the same exceptions.
+
+    The client should be closed with `aclose()` or used as an async context manager.
+    """
+    def __init__(self, base_url: str, token: str = None, max_connections: int = 100,
+                 max_keepalive_connections: int = 20, keepalive_expiry: Optional[float] = 5.0,
+                 timeout: Timeout = DEFAULT_TIMEOUT, retry: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[RateLimiter] = None, doi_cache: Optional[DOICache] = None,
+                 status_cache: Optional[StatusCache] = None, coalescer: Optional[RequestCoalescer] = None,
+                 journal: Optional["TransferJournal"] = None, metrics: Optional[Metrics] = None,
+                 trusted_responses: bool = False,
+                 json_backend: Optional[JSONBackend] = None, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        Initializes the AsyncEOSCClient.
+
+        Args:
+            base_url (str): The base URL of the EOSC API.
+            token (str, optional): Bearer token for authorization.
+            max_connections (int, optional): Maximum number of concurrent connections in the pool.
+            max_keepalive_connections (int, optional): Maximum number of idle connections kept alive.
+            keepalive_expiry (float, optional): Time after which an idle connection is closed, in seconds.
+            timeout (Union[float, Tuple[float, float], None], optional): Default timeout in seconds,
+                either one value or a `(connect, read)` pair. `None` waits forever.
+            retry (RetryPolicy, optional): Policy used to retry failed requests. No retries by default.
+            rate_limiter (RateLimiter, optional): Client-side rate and concurrency limits per endpoint group.
+            doi_cache (DOICache, optional): Cache for `parse_doi` results.
+            status_cache (StatusCache, optional): Cache for transfer job statuses.
+            coalescer (RequestCoalescer, optional): Merges identical concurrent GET requests into one.
+            journal (TransferJournal, optional): Persistent record of submitted jobs and their latest statuses.
+            metrics (Metrics, optional): Records latency histograms of requests, JSON decoding and validation.
+            trusted_responses (bool, optional): Validate response models straight from the raw JSON
+                body with pydantic's compiled validator, skipping the intermediate dict. This is
+                several times faster for large responses but assumes the service returns JSON:
+                a non-JSON body raises `pydantic.ValidationError` instead of being returned as text.
+            json_backend (JSONBackend, optional): Encoder and decoder for JSON bodies. Defaults to
+                orjson when it is installed and the standard library otherwise.
+            transport (httpx.AsyncBaseTransport, optional): Custom transport, mainly useful for testing.
+        """
+        self.base_url = base_url.rstrip('/')
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections,
+                              keepalive_expiry=keepalive_expiry)
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        self.session = httpx.AsyncClient(headers=headers, limits=limits, timeout=timeout, transport=transport)
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.doi_cache = doi_cache
+        self.status_cache = status_cache
+        self.coalescer = coalescer
+        self.journal = journal
+        self.metrics = metrics
+        self.trusted_responses = trusted_responses
+        self.json_backend = json_backend if json_backend is not None else default_backend()
+        self._retry_stats = contextvars.ContextVar("retry_stats", default=None)
+
+    @property
+    def last_retry_stats(self) -> Optional[RetryStats]:
+        """Retry counters of the last request made from the current task, or None."""
+        return self._retry_stats.get()
+
+    async def request(self, method, endpoint, **kwargs: Any) -> Union[dict, str]:
+        """
+        Send a request to the API and handle errors.
+
+        Args:
+            method (str): HTTP method (e.g., 'GET', 'POST').
+            endpoint (str): API endpoint path.
+            **kwargs: Additional request options, see `send`.
+
+        Returns:
+            Union[dict, str]: Parsed response from the API.
+
+        Raises:
+            EOSCClientError: For 4xx errors.
+            EOSCServerError: For 5xx errors.
+            EOSCRequestError: For network issues.
+        """
+        return self._decode(await self.send(method, endpoint, **kwargs), endpoint)
+
+    def _decode(self, response: httpx.Response, endpoint: str) -> Union[dict, str]:
+        if self.metrics is None:
+            return decode_response(response, self.json_backend.loads)
+        start = time.perf_counter()
+        data = decode_response(response, self.json_backend.loads)
+        self.metrics.observe("decode", time.perf_counter() - start, endpoint=endpoint_template(endpoint))
+        return data
+
+    async def send(self, method, endpoint, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request to the API and return the raw response.
+
+        Each attempt waits for the client's `RateLimiter`, if any, and failed requests
+        are retried according to the client's `RetryPolicy`, if any. With a `RequestCoalescer`,
+        identical concurrent GETs share one response. Use this instead of `request` to read
+        response headers or stream the body.
+
+        Args:
+            method (str): HTTP method (e.g., 'GET', 'POST').
+            endpoint (str): API endpoint path.
+            **kwargs: Additional request options, as accepted by `httpx.AsyncClient.request`.
+                The client's default `timeout` is used unless one is given, and a `json`
+                body is encoded with the client's `json_backend`.
+
+        Returns:
+            httpx.Response: The successful (non-4xx/5xx) response.
+
+        Raises:
+            EOSCClientError: For 4xx errors.
+            EOSCServerError: For 5xx errors.
+            EOSCRequestError: For network issues.
+        """
+        if self.coalescer is not None:
+            # Keyed by server and credentials too, as a coalescer may be shared between clients
+            identity = (self.base_url, self.session.headers.get("Authorization"))
+            key = self.coalescer.key(method, endpoint, kwargs, identity)
+            if key is not None:
+                return await self.coalescer.run_async(key, lambda: self._send_with_retries(method, endpoint, **kwargs))
+        return await self._send_with_retries(method, endpoint, **kwargs)
+
+    async def _send_with_retries(self, method: str, endpoint: str, **kwargs: Any) -> httpx.Response:
+        if "json" in kwargs:
+            kwargs["content"] = self.json_backend.dumps(kwargs.pop("json"))
+        stats = RetryStats(calls=1)
+        self._retry_stats.set(stats)
+        try:
+            while True:
+                stats.attempts += 1
+                try:
+                    return await self._send_once(method, endpoint, **kwargs)
+                except EOSCError as e:
+                    delay = self.retry.next_delay(method, e, stats) if self.retry is not None else None
+                    if delay is None:
+                        raise
+                stats.retries += 1
+                stats.backoff += delay
+                await asyncio.sleep(delay)
+        finally:
+            if self.retry is not None:
+                self.retry.record(stats)
+
+    async def _send_once(self, method: str, endpoint: str, **kwargs: Any) -> httpx.Response:
+        url = f"{self.base_url}{endpoint}"
+        if self.rate_limiter is None:
+            response = await self._send(method, url, **kwargs)
+        else:
+            async with self.rate_limiter.async_limit(method, endpoint):
+                response = await self._send(method, url, **kwargs)
+        raise_for_status(response)
+        return response
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> Any:
+        if self.metrics is not None:
+            return await self._send_measured(method, url, **kwargs)
+        try:
+            return await self.session.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            raise EOSCRequestError(str(e)) from e
+
+    async def _send_measured(self, method: str, url: str, **kwargs: Any) -> Any:
+        # httpx only reports the time to the end of the body, so there is no headers/body split
+        endpoint = url[len(self.base_url):]
+        start = time.perf_counter()
+        try:
+            response = await self.session.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            record_attempt(self.metrics, method, endpoint, time.perf_counter() - start, error=e)
+            raise EOSCRequestError(str(e)) from e
+        record_attempt(self.metrics, method, endpoint, time.perf_counter() - start, response)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncEOSCClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
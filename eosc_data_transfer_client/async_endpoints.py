@@ -0,0 +1,217 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from .async_client import AsyncEOSCClient
+from .endpoints import ModelT, _field_converter, _parse_field, _parse_model, _validate
+from .exceptions import EOSCClientError, EOSCServerError
+from .models import TransferRequest, TransferResponse, TransferStatus, TransferStatusList, StorageContent, UserInfo
+from datetime import datetime
+from typing import Optional, Any, Type, Union
+
+async def _request_model(client: AsyncEOSCClient, model: Type[ModelT], method: str, endpoint: str, **kwargs: Any) -> ModelT:
+    if client.trusted_responses:
+        return _validate(client, model, endpoint, (await client.send(method, endpoint, **kwargs)).content)
+    return _validate(client, model, endpoint, await client.request(method, endpoint, **kwargs))
+
+async def create_transfer(client: AsyncEOSCClient, transfer: TransferRequest) -> TransferResponse:
+    """
+    Initiate a new data transfer.
+
+    Async version of `endpoints.create_transfer`.
+
+    Arguments:
+        client: An instance of `AsyncEOSCClient` configured with base URL and authentication.
+        transfer: A `TransferRequest` object describing the files to transfer and transfer parameters.
+
+    Returns:
+        TransferResponse: An object containing details about the submitted transfer, including job ID and status.
+
+    Raises:
+        EOSCClientError: If the API returns a 4xx error (e.g., invalid input).
+        EOSCServerError: If the API returns a 5xx error (e.g., internal server error).
+    """
+    # Serialized by pydantic-core directly to bytes, without an intermediate dict
+    body = transfer.model_dump_json().encode("utf-8")
+    journal = client.journal
+    if journal is None:
+        return await _request_model(client, TransferResponse, "POST", "/transfers", content=body)
+    # Recorded before sending, so a crash before the response leaves a trace of the job
+    submission = journal.begin_submission(transfer)
+    try:
+        response = await _request_model(client, TransferResponse, "POST", "/transfers", content=body)
+    except (EOSCClientError, EOSCServerError):
+        journal.abort_submission(submission)
+        raise
+    journal.record_submission(transfer, response, submission)
+    return response
+
+async def get_transfer_status(client: AsyncEOSCClient, transfer_id: str) -> TransferStatus:
+    """
+    Retrieve the status of a transfer job.
+
+    Async version of `endpoints.get_transfer_status`.
+
+    If the client has a `StatusCache`, terminal jobs and recently fetched active jobs are
+    answered from it without a request.
+
+    Arguments:
+        client: An instance of `AsyncEOSCClient` for making authenticated requests.
+        transfer_id: The ID of the transfer job to retrieve.
+
+    Returns:
+        TransferStatus: An object with detailed information about the job, including state, timestamps, and metadata.
+
+    Raises:
+        EOSCClientError: If the job ID is invalid or not found.
+        EOSCServerError: If the API encounters an internal issue.
+    """
+    cache = client.status_cache
+    if cache is not None:
+        status = cache.get(transfer_id)
+        if status is not None:
+            return status
+    status = await _request_model(client, TransferStatus, "GET", f"/transfer/{transfer_id}")
+    if cache is not None:
+        cache.put(status)
+    if client.journal is not None:
+        client.journal.update((status,))
+    return status
+
+async def get_transfer_field(client: AsyncEOSCClient, job_id: str, field_name: str) -> Union[str, int, bool, dict, datetime]:
+    """
+    Retrieve a specific field from a transfer job, using TransferStatus model for type resolution.
+
+    Async version of `endpoints.get_transfer_field`.
+
+    Args:
+        client: The async API client.
+        job_id: Transfer job ID.
+        field_name: Field to retrieve.
+
+    Returns:
+        The value of the requested field, properly typed.
+
+    Raises:
+        ValueError: If the field name is invalid or type conversion fails.
+    """
+    # Reject unknown fields before sending the request
+    _field_converter(field_name)
+    raw_response = await client.request("GET", f"/transfer/{job_id}/{field_name}")
+    return _parse_field(field_name, raw_response)
+
+async def cancel_transfer(client: AsyncEOSCClient, job_id: str) -> TransferStatus:
+    """
+    Cancel a transfer job with a job_id
+
+    Async version of `endpoints.cancel_transfer`.
+
+    Args:
+        client: The async API client.
+        job_id: Transfer job ID.
+
+    Returns:
+        TransferStatus: The canceled transfer with its current status (canceled or any other final status).
+    """
+    status = await _request_model(client, TransferStatus, "DELETE", f"/transfer/{job_id}")
+    if client.status_cache is not None:
+        client.status_cache.put(status)
+    if client.journal is not None:
+        client.journal.update((status,))
+    return status
+
+async def list_transfers(client: AsyncEOSCClient, **filters: Optional[Any]) -> TransferStatusList:
+    """
+    Find transfers matching search criteria.
+
+    Async version of `endpoints.list_transfers`.
+
+    Args:
+        client: The async API client.
+        **filters: Optional query parameters to filter the search.
+
+    Returns:
+        TransferStatusList: A list of transfers matching the criteria.
+    """
+    # Filter out None values
+    query_params = {k: v for k, v in filters.items() if v is not None}
+    transfers = await _request_model(client, TransferStatusList, "GET", "/transfers", params=query_params)
+    if client.status_cache is not None:
+        client.status_cache.update(transfers.transfers)
+    if client.journal is not None:
+        client.journal.update(transfers.transfers)
+    return transfers
+
+async def parse_doi(client: AsyncEOSCClient, doi: str) -> StorageContent:
+    """
+    Parse a PID (e.g., DOI) and retrieve associated file metadata.
+
+    Async version of `endpoints.parse_doi`.
+
+    If the client has a `DOICache`, fresh cached results are returned without a request,
+    and expired ones are revalidated with a conditional request when possible.
+
+    Args:
+        client: The async API client.
+        doi (str): The persistent identifier to parse.
+
+    Returns:
+        StorageContent: Parsed metadata including a list of files
+
+    Raises:
+        EOSCClientError: For 4xx errors.
+        EOSCServerError: For 5xx errors.
+        EOSCRequestError: For network issues.
+    """
+    cache = client.doi_cache
+    if cache is None:
+        return await _request_model(client, StorageContent, "GET", "/parser", params={"doi": doi})
+
+    entry = cache.get(doi)
+    if entry is not None and entry.fresh:
+        return entry.content
+    headers = entry.validators() if entry is not None else {}
+    response = await client.send("GET", "/parser", params={"doi": doi}, headers=headers)
+    if response.status_code == 304 and entry is not None:
+        cache.revalidated(doi)
+        return entry.content
+    content = _parse_model(client, StorageContent, "/parser", response)
+    cache.put(doi, content, etag=response.headers.get("ETag"), last_modified=response.headers.get("Last-Modified"))
+    return content
+
+async def list_folder(client: AsyncEOSCClient, se_url: str) -> StorageContent:
+    """
+    List the content of a folder on a storage element.
+
+    Async version of `endpoints.list_folder`.
+
+    Args:
+        client: The async API client.
+        se_url (str): The URL of the folder, e.g. the `accessUrl` of a folder `StorageElement`.
+
+    Returns:
+        StorageContent: The files and folders directly inside the folder.
+    """
+    return await _request_model(client, StorageContent, "GET", "/storage/folder/list", params={"seUrl": se_url})
+
+async def get_user_info(client: AsyncEOSCClient) -> UserInfo:
+    """
+    Retrieve user information from the EOSC Data Transfer service.
+
+    Async version of `endpoints.get_user_info`.
+
+    Returns:
+        UserInfo: Metadata about the current user, including identity, VO membership, and permissions.
+    """
+    return await _request_model(client, UserInfo, "GET", "/user/info")
@@ -0,0 +1,312 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import itertools
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+from .client import EOSCClient
+from .endpoints import create_transfer, get_transfer_status, list_folder, _field_converter, _parse_field
+from .models import FileTransfer, StorageContent, StorageElement, TransferRequest, TransferResponse, TransferStatus
+
+T = TypeVar("T")
+
+def _imap_unordered(func: Callable[[T], Any], items: Iterable[T], max_workers: int) -> Iterator[Tuple[T, Any]]:
+    """
+    Run `func` over `items` on a bounded thread pool and yield `(item, result)` as each call completes.
+
+    At most `2 * max_workers` calls are queued at any time, so `items` may be a
+    lazy iterable of any length. Exceptions raised by `func` propagate to the caller.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    items = iter(items)
+    pending = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for item in itertools.islice(items, 2 * max_workers):
+                pending[executor.submit(func, item)] = item
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+                for item in itertools.islice(items, len(done)):
+                    pending[executor.submit(func, item)] = item
+        finally:
+            # Drop queued work if the caller stops iterating early
+            for future in pending:
+                future.cancel()
+
+def get_transfer_statuses(client: EOSCClient, job_ids: Iterable[str],
+                          max_workers: int = 8) -> Iterator[Tuple[str, Union[TransferStatus, Exception]]]:
+    """
+    Retrieve the status of many transfer jobs concurrently.
+
+    Requests are spread over a bounded pool of worker threads that share the
+    client's connection pool. Results are yielded in completion order, and
+    only a small window of jobs is in flight at any time, so `job_ids` can be
+    a lazy iterable of any size.
+
+    Arguments:
+        client: An instance of `EOSCClient` for making authenticated requests.
+        job_ids: The IDs of the transfer jobs to retrieve.
+        max_workers: Maximum number of concurrent requests. Keep this at or below the
+            client's `pool_maxsize` to avoid reopening connections.
+
+    Yields:
+        Tuple[str, Union[TransferStatus, Exception]]: The job ID with either its status or the
+        error raised while fetching it, such as an `EOSCError` or a `ValidationError` for a
+        malformed response. A failing job does not stop the batch.
+    """
+    def fetch(job_id: str) -> Union[TransferStatus, Exception]:
+        try:
+            return get_transfer_status(client, job_id)
+        except Exception as e:
+            return e
+
+    return _imap_unordered(fetch, job_ids, max_workers)
+
+def get_transfer_fields(client: EOSCClient, job_ids: Iterable[str], fields: Sequence[str], max_workers: int = 8,
+                        max_field_requests: int = 1) -> Iterator[Tuple[str, Union[Dict[str, Any], Exception]]]:
+    """
+    Retrieve selected fields of many transfer jobs concurrently.
+
+    For each job, the fields are read either with one `GET /transfer/{id}/{field}`
+    request per field, or with a single `get_transfer_status` call when more than
+    `max_field_requests` fields are asked for, whichever needs fewer round trips.
+    Values are converted to the type declared on `TransferStatus`; a field with no
+    value (e.g. `finishedAt` of an active job) is returned as None.
+
+    Arguments:
+        client: An instance of `EOSCClient` for making authenticated requests.
+        job_ids: The IDs of the transfer jobs to read.
+        fields: The `TransferStatus` field names to read.
+        max_workers: Maximum number of concurrent requests.
+        max_field_requests: Largest number of fields read with per-field requests.
+
+    Yields:
+        Tuple[str, Union[Dict[str, Any], Exception]]: The job ID with either a mapping of field
+        name to value, or the error raised while reading it, such as an `EOSCError`, a
+        `ValueError` for a value that cannot be converted, or an `AttributeError` for a
+        non-JSON body. A failing job does not stop the batch.
+
+    Raises:
+        ValueError: If a field name is not a `TransferStatus` field.
+    """
+    fields = list(fields)
+    for field_name in fields:
+        _field_converter(field_name)
+    per_field = len(fields) <= max_field_requests
+
+    def fetch(job_id: str) -> Union[Dict[str, Any], Exception]:
+        try:
+            if per_field:
+                return {
+                    field_name: _parse_field(field_name, client.request("GET", f"/transfer/{job_id}/{field_name}"), required=False)
+                    for field_name in fields
+                }
+            status = get_transfer_status(client, job_id)
+            return {field_name: getattr(status, field_name) for field_name in fields}
+        except Exception as e:
+            return e
+
+    return _imap_unordered(fetch, job_ids, max_workers)
+
+def split_transfer_request(transfer: TransferRequest, max_files: Optional[int] = None,
+                           max_bytes: Optional[int] = None) -> List[TransferRequest]:
+    """
+    Split a transfer request into smaller requests with the same parameters.
+
+    Files are kept in their original order. A new chunk is started whenever adding
+    the next file would exceed `max_files` files or `max_bytes` total `filesize`.
+    A single file larger than `max_bytes` gets a chunk of its own.
+
+    Arguments:
+        transfer: The `TransferRequest` to split.
+        max_files: Maximum number of files per chunk.
+        max_bytes: Maximum total file size per chunk, in bytes.
+
+    Returns:
+        List[TransferRequest]: The chunks, each sharing `transfer.params`.
+    """
+    if max_files is not None and max_files < 1:
+        raise ValueError("max_files must be at least 1")
+    chunks: List[List[FileTransfer]] = []
+    current: List[FileTransfer] = []
+    current_bytes = 0
+    for file in transfer.files:
+        if current and ((max_files is not None and len(current) >= max_files) or
+                        (max_bytes is not None and current_bytes + file.filesize > max_bytes)):
+            chunks.append(current)
+            current, current_bytes = [], 0
+        current.append(file)
+        current_bytes += file.filesize
+    if current:
+        chunks.append(current)
+    return [TransferRequest(files=files, params=transfer.params) for files in chunks]
+
+@dataclass
+class ChunkResult:
+    """
+    The outcome of submitting one chunk of a split transfer request.
+
+    Attributes:
+        index (int): Position of the chunk in the split request.
+        request (TransferRequest): The chunk that was submitted.
+        response (Optional[TransferResponse]): The API response, if the submission succeeded.
+        error (Optional[Exception]): The error raised, if the submission failed.
+    """
+    index: int
+    request: TransferRequest
+    response: Optional[TransferResponse] = None
+    error: Optional[Exception] = None
+
+    @property
+    def jobId(self) -> Optional[str]:
+        """The job ID of the submitted chunk, or None if it failed."""
+        return self.response.jobId if self.response is not None else None
+
+@dataclass
+class ChunkedSubmission:
+    """
+    The grouped result of a chunked transfer submission.
+
+    Attributes:
+        chunks (List[ChunkResult]): One result per chunk, in chunk order.
+    """
+    chunks: List[ChunkResult] = field(default_factory=list)
+
+    @property
+    def job_ids(self) -> Dict[int, str]:
+        """Mapping of chunk index to job ID for every chunk that was submitted."""
+        return {chunk.index: chunk.jobId for chunk in self.chunks if chunk.response is not None}
+
+    @property
+    def failed(self) -> List[ChunkResult]:
+        """The chunks whose submission failed."""
+        return [chunk for chunk in self.chunks if chunk.error is not None]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every chunk was submitted."""
+        return not self.failed
+
+def create_transfer_chunked(client: EOSCClient, transfer: TransferRequest, max_files: Optional[int] = 1000,
+                            max_bytes: Optional[int] = None, max_workers: int = 4) -> ChunkedSubmission:
+    """
+    Submit a large transfer request as several smaller jobs in parallel.
+
+    The files are split with `split_transfer_request` and every chunk is submitted
+    concurrently with the same `TransferParameters`. A failing chunk does not stop
+    the others; check `ChunkedSubmission.failed` to find and resubmit them.
+
+    Arguments:
+        client: An instance of `EOSCClient` configured with base URL and authentication.
+        transfer: The `TransferRequest` to submit.
+        max_files: Maximum number of files per job.
+        max_bytes: Maximum total file size per job, in bytes.
+        max_workers: Maximum number of concurrent submissions.
+
+    Returns:
+        ChunkedSubmission: The result of every chunk, including its job ID or error.
+    """
+    chunks = split_transfer_request(transfer, max_files=max_files, max_bytes=max_bytes)
+
+    def submit(item: Tuple[int, TransferRequest]) -> ChunkResult:
+        index, request = item
+        try:
+            return ChunkResult(index, request, response=create_transfer(client, request))
+        except Exception as e:
+            return ChunkResult(index, request, error=e)
+
+    results = [result for _, result in _imap_unordered(submit, enumerate(chunks), max_workers)]
+    return ChunkedSubmission(sorted(results, key=lambda result: result.index))
+
+def expand_folders(client: EOSCClient, elements: Iterable[StorageElement], max_depth: int = 10,
+                   max_in_flight: int = 8, lister: Optional[Callable[[StorageElement], StorageContent]] = None,
+                   on_error: Optional[Callable[[StorageElement, Exception], None]] = None) -> Iterator[StorageElement]:
+    """
+    Recursively expand folder elements into the files they contain, crawling folders concurrently.
+
+    Files are yielded as soon as they are found, while up to `max_in_flight` folders are
+    listed in the background, so the first files of a very large tree can be submitted
+    before the crawl ends. Only the folders still waiting to be listed are kept in memory.
+    Elements are deduplicated by `accessUrl`, so a folder or file reachable twice (e.g.
+    through a link) is only visited once.
+
+    Arguments:
+        client: An instance of `EOSCClient` for making authenticated requests.
+        elements: The elements to expand, e.g. `parse_doi(client, doi).elements`. May be lazy.
+        max_depth: Maximum folder nesting to expand. The given elements are at depth 0; folders
+            found at `max_depth` are yielded without being listed.
+        max_in_flight: Maximum number of concurrent folder listings.
+        lister: Lists a folder. Defaults to `list_folder` on the folder's `accessUrl`.
+        on_error: Called with the folder and the exception when a listing fails; the crawl
+            then goes on without that folder. By default the exception is raised.
+
+    Yields:
+        StorageElement: Each file of the tree, and each folder beyond `max_depth`.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    if lister is None:
+        lister = lambda folder: list_folder(client, folder.accessUrl)
+    seen = set()
+    # Folders waiting to be listed, popped last-in first-out to keep this short on deep trees
+    folders: List[Tuple[StorageElement, int]] = []
+
+    def visit(items: Iterable[StorageElement], depth: int) -> Iterator[StorageElement]:
+        for element in items:
+            if element.accessUrl in seen:
+                continue
+            seen.add(element.accessUrl)
+            if element.isFolder and depth < max_depth:
+                folders.append((element, depth))
+            else:
+                yield element
+
+    items = iter(elements)
+    pending = {}
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        try:
+            while True:
+                while folders and len(pending) < max_in_flight:
+                    folder, depth = folders.pop()
+                    pending[executor.submit(lister, folder)] = (folder, depth)
+                # Read the given elements only while there are idle slots
+                if items is not None and len(pending) < max_in_flight:
+                    element = next(items, None)
+                    if element is None:
+                        items = None
+                    else:
+                        yield from visit((element,), 0)
+                    continue
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder, depth = pending.pop(future)
+                    try:
+                        content = future.result()
+                    except Exception as e:
+                        if on_error is None:
+                            raise
+                        on_error(folder, e)
+                        continue
+                    yield from visit(content.elements, depth + 1)
+        finally:
+            # Drop queued listings if the caller stops iterating early
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,312 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+from .models import StorageContent, TransferStatus, TERMINAL_JOB_STATES
+from .utils import normalize_doi
+
+@dataclass
+class CacheStats:
+    """
+    Counters of a cache.
+
+    `revalidations` only applies to `DOICache`.
+
+    Attributes:
+        hits (int): Lookups answered from a fresh entry.
+        misses (int): Lookups with no entry at all.
+        stale (int): Lookups that found an expired entry.
+        revalidations (int): Expired entries confirmed unchanged by the server (HTTP 304).
+        evictions (int): Entries dropped from memory to respect `max_size`.
+    """
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered without downloading the content again."""
+        lookups = self.hits + self.misses + self.stale
+        return (self.hits + self.revalidations) / lookups if lookups else 0.0
+
+@dataclass
+class CacheEntry:
+    """
+    A cached `parse_doi` result with the validators needed to revalidate it.
+
+    Attributes:
+        content (StorageContent): The cached result.
+        stored_at (float): When the entry was stored or last revalidated, as a UNIX timestamp.
+        etag (Optional[str]): The `ETag` header of the response, if any.
+        last_modified (Optional[str]): The `Last-Modified` header of the response, if any.
+        fresh (bool): Whether the entry was within its TTL when it was looked up.
+    """
+    content: StorageContent
+    stored_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fresh: bool = True
+
+    def validators(self) -> Dict[str, str]:
+        """The conditional request headers to revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+class DOICache:
+    """
+    A cache for `parse_doi` results, keyed by normalized DOI.
+
+    Entries are kept in an in-memory LRU of at most `max_size` items and are fresh
+    for `ttl` seconds. Expired entries are kept so they can be revalidated with a
+    conditional request (`If-None-Match`/`If-Modified-Since`) when the server sent
+    an `ETag` or `Last-Modified` header. With `path`, entries are also written to an
+    SQLite file so they survive restarts.
+
+    Cached `StorageContent` objects are shared between callers and should not be modified.
+
+    Example:
+        client = EOSCClient(base_url, token=token, doi_cache=DOICache(ttl=3600, path="doi-cache.sqlite"))
+    """
+    def __init__(self, ttl: float = 3600.0, max_size: int = 1024, path: Optional[str] = None):
+        """
+        Initializes the DOICache.
+
+        Args:
+            ttl (float, optional): Time during which an entry is used without asking the server, in seconds.
+            max_size (int, optional): Maximum number of entries kept in memory.
+            path (str, optional): Path of an SQLite file to persist entries to.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.path = path
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS doi_cache ("
+                "key TEXT PRIMARY KEY, stored_at REAL, etag TEXT, last_modified TEXT, content TEXT)"
+            )
+            self._db.commit()
+
+    def get(self, doi: str) -> Optional[CacheEntry]:
+        """
+        Look up a DOI.
+
+        Args:
+            doi (str): The DOI, in any of its usual spellings.
+
+        Returns:
+            Optional[CacheEntry]: The entry, with `fresh` telling whether it is within its TTL,
+            or None if the DOI is not cached.
+        """
+        key = normalize_doi(doi)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            elif self._db is not None:
+                entry = self._load(key)
+                if entry is not None:
+                    self._remember(key, entry)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            entry.fresh = time.time() - entry.stored_at < self.ttl
+            if entry.fresh:
+                self.stats.hits += 1
+            else:
+                self.stats.stale += 1
+            return entry
+
+    def put(self, doi: str, content: StorageContent, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """
+        Store the result of parsing a DOI.
+
+        Args:
+            doi (str): The DOI, in any of its usual spellings.
+            content (StorageContent): The parsed content.
+            etag (str, optional): The `ETag` header of the response.
+            last_modified (str, optional): The `Last-Modified` header of the response.
+        """
+        key = normalize_doi(doi)
+        entry = CacheEntry(content, time.time(), etag, last_modified)
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO doi_cache VALUES (?, ?, ?, ?, ?)",
+                    (key, entry.stored_at, etag, last_modified, content.model_dump_json()),
+                )
+                self._db.commit()
+
+    def revalidated(self, doi: str) -> None:
+        """
+        Mark the entry of a DOI as fresh again after the server answered 304 Not Modified.
+
+        Args:
+            doi (str): The DOI, in any of its usual spellings.
+        """
+        key = normalize_doi(doi)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.stored_at = now
+                entry.fresh = True
+            self.stats.revalidations += 1
+            if self._db is not None:
+                self._db.execute("UPDATE doi_cache SET stored_at = ? WHERE key = ?", (now, key))
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Remove every entry, from memory and disk."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM doi_cache")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the on-disk store, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        row = self._db.execute(
+            "SELECT stored_at, etag, last_modified, content FROM doi_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        stored_at, etag, last_modified, content = row
+        return CacheEntry(StorageContent.model_validate_json(content), stored_at, etag, last_modified)
+
+class StatusCache:
+    """
+    A cache for `TransferStatus` objects that knows about terminal job states.
+
+    Once a job is terminal (see `TERMINAL_JOB_STATES`) its status can no longer
+    change, so it is kept until evicted by the LRU bound. Statuses of active jobs
+    are only reused for `active_ttl` seconds.
+
+    The cache is filled by `get_transfer_status`, `cancel_transfer`, `list_transfers`
+    and `iter_transfers`, and consulted by `get_transfer_status`. Cached `TransferStatus`
+    objects are shared between callers and should not be modified.
+
+    Example:
+        client = EOSCClient(base_url, token=token, status_cache=StatusCache(active_ttl=5))
+    """
+    def __init__(self, max_size: int = 10000, active_ttl: float = 5.0):
+        """
+        Initializes the StatusCache.
+
+        Args:
+            max_size (int, optional): Maximum number of statuses kept.
+            active_ttl (float, optional): Time during which the status of an active job is reused, in seconds.
+        """
+        self.max_size = max_size
+        self.active_ttl = active_ttl
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Tuple[TransferStatus, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job_id: str) -> Optional[TransferStatus]:
+        """
+        Look up the status of a job.
+
+        Args:
+            job_id (str): The ID of the transfer job.
+
+        Returns:
+            Optional[TransferStatus]: The cached status if it is terminal or recent enough, None otherwise.
+        """
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            status, stored_at = entry
+            if status.jobState not in TERMINAL_JOB_STATES and time.monotonic() - stored_at >= self.active_ttl:
+                self.stats.stale += 1
+                return None
+            self._entries.move_to_end(job_id)
+            self.stats.hits += 1
+            return status
+
+    def put(self, status: TransferStatus) -> None:
+        """
+        Store the latest status of a job.
+
+        Args:
+            status (TransferStatus): The status, as returned by the API.
+        """
+        self.update((status,))
+
+    def update(self, statuses: Iterable[TransferStatus]) -> None:
+        """
+        Store the latest status of several jobs.
+
+        Args:
+            statuses (Iterable[TransferStatus]): The statuses, as returned by the API.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for status in statuses:
+                self._entries[status.jobId] = (status, now)
+                self._entries.move_to_end(status.jobId)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, job_id: str) -> None:
+        """
+        Forget the status of a job.
+
+        Args:
+            job_id (str): The ID of the transfer job.
+        """
+        with self._lock:
+            self._entries.pop(job_id, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
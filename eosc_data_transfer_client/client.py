@@ -12,28 +12,137 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+import contextvars
 import requests
-from typing import Any, Union
-from .exceptions import EOSCClientError, EOSCServerError, EOSCRequestError
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Union
+from .cache import DOICache, StatusCache
+from .coalesce import RequestCoalescer
+from .exceptions import EOSCError, EOSCRequestError
+from .metrics import Metrics, record_attempt
+from .ratelimit import RateLimiter
+from .serialization import JSONBackend, default_backend
+from .retry import RetryPolicy, RetryStats
+from .utils import raise_for_status, decode_response, endpoint_template
+
+if TYPE_CHECKING:
+    from .journal import TransferJournal
+
+Timeout = Union[float, Tuple[float, float], None]
+
+DEFAULT_TIMEOUT: Timeout = (10.0, 60.0)
+"""Default (connect, read) timeout in seconds, so a stuck socket cannot hang a caller forever."""
 
 class EOSCClient:
     """
     A client for interacting with the EOSC Data Transfer API.
     Handles authentication, request sending, and error parsing.
+
+    A client can be shared by many threads. All requests go through one pooled
+    `HTTPAdapter`; size it with `pool_maxsize` to at least the number of threads
+    that send requests at the same time, otherwise connections are discarded and
+    reopened. With `per_thread_session=True`, each thread gets its own
+    `requests.Session` (headers and cookies are not shared), while connections
+    still come from the same pool.
     """
-    def __init__(self, base_url: str, token: str = None):
+    def __init__(self, base_url: str, token: str = None, retry: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[RateLimiter] = None, doi_cache: Optional[DOICache] = None,
+                 status_cache: Optional[StatusCache] = None, coalescer: Optional[RequestCoalescer] = None,
+                 journal: Optional["TransferJournal"] = None, metrics: Optional[Metrics] = None,
+                 trusted_responses: bool = False,
+                 json_backend: Optional[JSONBackend] = None, timeout: Timeout = DEFAULT_TIMEOUT,
+                 pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                 keep_alive: bool = True, per_thread_session: bool = False):
         """
         Initializes the EOSCClient.
 
         Args:
             base_url (str): The base URL of the EOSC API.
             token (str, optional): Bearer token for authorization.
+            retry (RetryPolicy, optional): Policy used to retry failed requests. No retries by default.
+            rate_limiter (RateLimiter, optional): Client-side rate and concurrency limits per endpoint group.
+            doi_cache (DOICache, optional): Cache for `parse_doi` results.
+            status_cache (StatusCache, optional): Cache for transfer job statuses.
+            coalescer (RequestCoalescer, optional): Merges identical concurrent GET requests into one.
+            journal (TransferJournal, optional): Persistent record of submitted jobs and their latest statuses.
+            metrics (Metrics, optional): Records latency histograms of requests, JSON decoding and validation.
+            trusted_responses (bool, optional): Validate response models straight from the raw JSON
+                body with pydantic's compiled validator, skipping the intermediate dict. This is
+                several times faster for large responses but assumes the service returns JSON:
+                a non-JSON body raises `pydantic.ValidationError` instead of being returned as text.
+            json_backend (JSONBackend, optional): Encoder and decoder for JSON bodies. Defaults to
+                orjson when it is installed and the standard library otherwise.
+            timeout (Union[float, Tuple[float, float], None], optional): Default timeout in seconds,
+                either one value or a `(connect, read)` pair. `None` waits forever.
+            pool_connections (int, optional): Number of per-host connection pools to keep.
+            pool_maxsize (int, optional): Maximum number of connections kept per host.
+            pool_block (bool, optional): Whether to wait for a free connection instead of opening
+                a temporary one when the pool is exhausted.
+            keep_alive (bool, optional): Whether to reuse connections between requests.
+            per_thread_session (bool, optional): Whether each thread gets its own session sharing the pool.
         """
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+        self.timeout = timeout
+        self.per_thread_session = per_thread_session
+        self.headers = {"Content-Type": "application/json"}
         if token:
-            self.session.headers.update({"Authorization": f"Bearer {token}"})
-        self.session.headers.update({"Content-Type": "application/json"})
+            self.headers["Authorization"] = f"Bearer {token}"
+        if not keep_alive:
+            self.headers["Connection"] = "close"
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self._local = threading.local()
+        self._session = None if per_thread_session else self._new_session()
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.doi_cache = doi_cache
+        self.status_cache = status_cache
+        self.coalescer = coalescer
+        self.journal = journal
+        self.metrics = metrics
+        self.trusted_responses = trusted_responses
+        self.json_backend = json_backend if json_backend is not None else default_backend()
+        self._retry_stats = contextvars.ContextVar("retry_stats", default=None)
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """The session used by the calling thread."""
+        if not self.per_thread_session:
+            return self._session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._new_session()
+        return session
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        if self.per_thread_session:
+            self._local.session = session
+        else:
+            self._session = session
+
+    def close(self) -> None:
+        """Close the connection pool."""
+        self.adapter.close()
+
+    def __enter__(self) -> "EOSCClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def last_retry_stats(self) -> Optional[RetryStats]:
+        """Retry counters of the last request made from the current thread, or None."""
+        return self._retry_stats.get()
 
     def request(self, method, endpoint, **kwargs: Any) -> Union[dict, str]:
         """
@@ -42,7 +151,7 @@ class EOSCClient:
         Args:
             method (str): HTTP method (e.g., 'GET', 'POST').
             endpoint (str): API endpoint path.
-            **kwargs: Additional request options.
+            **kwargs: Additional request options, see `send`.
 
         Returns:
             Union[dict, str]: Parsed response from the API.
@@ -52,30 +161,97 @@ class EOSCClient:
             EOSCServerError: For 5xx errors.
             EOSCRequestError: For network issues.
         """
-        url = f"{self.base_url}{endpoint}"
+        return self._decode(self.send(method, endpoint, **kwargs), endpoint)
+
+    def _decode(self, response: requests.Response, endpoint: str) -> Union[dict, str]:
+        if self.metrics is None:
+            return decode_response(response, self.json_backend.loads)
+        start = time.perf_counter()
+        data = decode_response(response, self.json_backend.loads)
+        self.metrics.observe("decode", time.perf_counter() - start, endpoint=endpoint_template(endpoint))
+        return data
+
+    def send(self, method, endpoint, **kwargs: Any) -> requests.Response:
+        """
+        Send a request to the API and return the raw response.
+
+        Each attempt waits for the client's `RateLimiter`, if any, and failed requests
+        are retried according to the client's `RetryPolicy`, if any. With a `RequestCoalescer`,
+        identical concurrent GETs share one response. Use this instead of `request` to read
+        response headers or stream the body.
+
+        Args:
+            method (str): HTTP method (e.g., 'GET', 'POST').
+            endpoint (str): API endpoint path.
+            **kwargs: Additional request options, as accepted by `requests.Session.request`.
+                The client's default `timeout` is used unless one is given, and a `json`
+                body is encoded with the client's `json_backend`.
+
+        Returns:
+            requests.Response: The successful (non-4xx/5xx) response.
+
+        Raises:
+            EOSCClientError: For 4xx errors.
+            EOSCServerError: For 5xx errors.
+            EOSCRequestError: For network issues.
+        """
+        if self.coalescer is not None:
+            # Keyed by server and credentials too, as a coalescer may be shared between clients
+            identity = (self.base_url, self.session.headers.get("Authorization"))
+            key = self.coalescer.key(method, endpoint, kwargs, identity)
+            if key is not None:
+                return self.coalescer.run(key, lambda: self._send_with_retries(method, endpoint, **kwargs))
+        return self._send_with_retries(method, endpoint, **kwargs)
+
+    def _send_with_retries(self, method: str, endpoint: str, **kwargs: Any) -> requests.Response:
+        if "json" in kwargs:
+            kwargs["data"] = self.json_backend.dumps(kwargs.pop("json"))
+        stats = RetryStats(calls=1)
+        self._retry_stats.set(stats)
         try:
-            response = self.session.request(method, url, **kwargs)
-            if 400 <= response.status_code < 500:
+            while True:
+                stats.attempts += 1
                 try:
-                    message = response.json()
-                except ValueError:
-                    message = response.text
-                raise EOSCClientError(response.status_code, message, response=response)
+                    return self._send_once(method, endpoint, **kwargs)
+                except EOSCError as e:
+                    delay = self.retry.next_delay(method, e, stats) if self.retry is not None else None
+                    if delay is None:
+                        raise
+                stats.retries += 1
+                stats.backoff += delay
+                time.sleep(delay)
+        finally:
+            if self.retry is not None:
+                self.retry.record(stats)
 
-            elif 500 <= response.status_code < 600:
-                try:
-                    message = response.json()
-                except ValueError:
-                    message = response.text
-                raise EOSCServerError(response.status_code, message, response=response)
+    def _send_once(self, method: str, endpoint: str, **kwargs: Any) -> requests.Response:
+        url = f"{self.base_url}{endpoint}"
+        if self.rate_limiter is None:
+            response = self._send(method, url, **kwargs)
+        else:
+            with self.rate_limiter.limit(method, endpoint):
+                response = self._send(method, url, **kwargs)
+        raise_for_status(response)
+        return response
 
-            if response.content:
-                try:
-                    return response.json()
-                except ValueError:
-                    return response.text
-            else:
-                return {}
+    def _send(self, method: str, url: str, **kwargs: Any) -> Any:
+        kwargs.setdefault("timeout", self.timeout)
+        if self.metrics is not None:
+            return self._send_measured(method, url, **kwargs)
+        try:
+            return self.session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException as e:
+            raise EOSCRequestError(str(e)) from e
 
+    def _send_measured(self, method: str, url: str, **kwargs: Any) -> Any:
+        endpoint = url[len(self.base_url):]
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
         except requests.exceptions.RequestException as e:
+            record_attempt(self.metrics, method, endpoint, time.perf_counter() - start, error=e)
             raise EOSCRequestError(str(e)) from e
+        # `elapsed` stops at the response headers; a streamed body is read later by the caller
+        headers = None if kwargs.get("stream") else response.elapsed.total_seconds()
+        record_attempt(self.metrics, method, endpoint, time.perf_counter() - start, response, headers_seconds=headers)
+        return response
\ No newline at end of file
@@ -0,0 +1,164 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+@dataclass
+class CoalescingStats:
+    """
+    Counters of a `RequestCoalescer`.
+
+    Attributes:
+        requests (int): Number of coalescable requests made by callers.
+        saved (int): Number of those requests answered by another caller's in-flight request.
+    """
+    requests: int = 0
+    saved: int = 0
+
+class _Flight:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+class _LeaderCancelled(Exception):
+    """The task sending a coalesced request was cancelled before the response arrived."""
+
+class RequestCoalescer:
+    """
+    Merges identical concurrent GET requests into one.
+
+    While a GET for an endpoint and query parameters is in flight, other callers
+    asking for the same thing wait for its response instead of sending their own.
+    Only plain GETs with at most a `params` option are coalesced; requests with
+    custom headers, streaming or bodies are always sent.
+
+    Works for threads with `EOSCClient` and for tasks with `AsyncEOSCClient`.
+    Callers share the same response object, and errors are raised in every caller.
+    Requests are keyed by the client's base URL and `Authorization` header too, so a
+    coalescer shared by several clients never hands one user's response to another.
+
+    Example:
+        client = EOSCClient(base_url, token=token, coalescer=RequestCoalescer())
+    """
+    def __init__(self):
+        self.stats = CoalescingStats()
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._async_flights: Dict[Hashable, "asyncio.Future"] = {}
+
+    @staticmethod
+    def key(method: str, endpoint: str, options: Dict[str, Any], identity: Hashable = None) -> Optional[Hashable]:
+        """
+        Compute the key identifying a request, or None if it must not be coalesced.
+
+        Args:
+            method (str): HTTP method of the request.
+            endpoint (str): API endpoint path.
+            options (Dict[str, Any]): Additional request options.
+            identity (Hashable, optional): The server and credentials the request is sent
+                with; only requests with the same identity are merged.
+
+        Returns:
+            Optional[Hashable]: The key of the request.
+        """
+        if method.upper() != "GET" or set(options) - {"params"}:
+            return None
+        params = options.get("params") or {}
+        return identity, endpoint, tuple(sorted((str(k), str(v)) for k, v in params.items()))
+
+    def run(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Call `func`, unless a call with the same key is in flight, in which case wait for its result.
+
+        Args:
+            key (Hashable): The key of the request.
+            func (Callable): Sends the request.
+
+        Returns:
+            The result of the in-flight or new call.
+        """
+        with self._lock:
+            self.stats.requests += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.stats.saved += 1
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = func()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.event.set()
+
+    async def run_async(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Async version of `run`, for tasks on one event loop.
+
+        Args:
+            key (Hashable): The key of the request.
+            func (Callable): Returns an awaitable sending the request.
+
+        Returns:
+            The result of the in-flight or new call.
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+        with self._lock:
+            self.stats.requests += 1
+        while key in self._async_flights:
+            future = self._async_flights[key]
+            # Waiting does not cancel the shared request if this follower is cancelled
+            await asyncio.wait((future,))
+            if isinstance(future.exception(), _LeaderCancelled):
+                # Only the sending task was cancelled: resend, or join another follower's request
+                continue
+            with self._lock:
+                self.stats.saved += 1
+            return future.result()
+        future = self._async_flights[key] = loop.create_future()
+        try:
+            result = await func()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case no other task was waiting
+            future.exception()
+            raise
+        finally:
+            del self._async_flights[key]
@@ -0,0 +1,296 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import itertools
+import operator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Union
+from .models import TransferStatus, TransferStatusList
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+MISSING_TIME = -(2 ** 63)
+"""Value of a missing timestamp in int64 time columns; it reads as NaT when viewed as `datetime64[us]`."""
+
+FAILED_STATES = frozenset({"FAILED"})
+"""Job states counted as failures by `TransferColumns.failure_rates`."""
+
+SUCCEEDED_STATES = frozenset({"FINISHED", "FINISHEDDIRTY"})
+"""Job states counted as successes by `TransferColumns.failure_rates`."""
+
+# Column name -> kind; categorical columns are dictionary-encoded
+_COLUMNS = {
+    "jobId": "string",
+    "jobState": "category",
+    "source_se": "category",
+    "destination_se": "category",
+    "vo_name": "category",
+    "submittedTo": "category",
+    "priority": "int",
+    "retry": "int",
+    "cancel": "bool",
+    "submittedAt": "time",
+    "finishedAt": "time",
+}
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Columnar export requires the 'numpy' package")
+
+@dataclass
+class Categorical:
+    """
+    A dictionary-encoded string column.
+
+    Attributes:
+        codes (numpy.ndarray): The int32 index of each row's value in `categories`.
+        categories (List[str]): The distinct values, in order of first appearance.
+    """
+    codes: Any
+    categories: List[str]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def values(self) -> Any:
+        """The decoded values, as a NumPy object array."""
+        return np.asarray(self.categories, dtype=object)[self.codes]
+
+    def code(self, value: str) -> int:
+        """The code of a value, or -1 if it does not occur."""
+        try:
+            return self.categories.index(value)
+        except ValueError:
+            return -1
+
+class TransferColumns:
+    """
+    Transfer job statuses stored column by column in NumPy arrays, for vectorized analytics.
+
+    Built with `to_columns`. Columns are named after the `TransferStatus` fields and
+    accessed with `columns["jobState"]`:
+
+    - `jobId`: object array of strings.
+    - `jobState`, `source_se`, `destination_se`, `vo_name`, `submittedTo`: `Categorical`
+      (a missing `destination_se` is the empty string).
+    - `priority`, `retry`: int32 arrays; `cancel`: bool array.
+    - `submittedAt`, `finishedAt`: int64 microseconds since the UNIX epoch in UTC
+      (naive datetimes are taken as UTC), with `MISSING_TIME` where there is no value.
+
+    Example:
+        columns = to_columns(iter_transfers(client, vo_name="my-vo"))
+        print(columns.queue_time_stats(by="vo_name"))
+        print(columns.failure_rates(by="source_se"))
+    """
+    def __init__(self, columns: Dict[str, Any]):
+        """
+        Initializes the TransferColumns.
+
+        Args:
+            columns (Dict[str, Any]): The arrays of every column, all of the same length.
+        """
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns["jobId"])
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    def times(self, name: str) -> Any:
+        """A time column as a `datetime64[us]` array, with NaT where there is no value."""
+        return self.columns[name].view("datetime64[us]")
+
+    def queue_time(self) -> Any:
+        """
+        The time from submission to the end of each job.
+
+        Returns:
+            numpy.ndarray: float64 seconds, NaN for jobs that have not finished.
+        """
+        submitted, finished = self.columns["submittedAt"], self.columns["finishedAt"]
+        valid = (submitted != MISSING_TIME) & (finished != MISSING_TIME)
+        seconds = np.full(len(self), np.nan)
+        seconds[valid] = (finished[valid] - submitted[valid]) / 1e6
+        return seconds
+
+    def queue_time_stats(self, by: Optional[str] = None,
+                         percentiles: Iterable[float] = (50, 90, 99)) -> Union[Dict[str, float], Dict[str, Dict[str, float]]]:
+        """
+        Summarize the queue time (`submittedAt` to `finishedAt`) of finished jobs.
+
+        Args:
+            by (str, optional): A categorical column to group by, e.g. "vo_name".
+            percentiles (Iterable[float], optional): The percentiles to compute.
+
+        Returns:
+            The statistics `count`, `mean`, `min`, `max` and `p<percentile>`, in seconds; with
+            `by`, a mapping of each value of the column to its statistics.
+        """
+        percentiles = list(percentiles)
+        seconds = self.queue_time()
+        if by is None:
+            return _time_stats(seconds[~np.isnan(seconds)], percentiles)
+        column = self.columns[by]
+        valid = ~np.isnan(seconds)
+        codes, seconds = column.codes[valid], seconds[valid]
+        # Sort once by group, then split, instead of masking the array for each group
+        order = np.argsort(codes, kind="stable")
+        bounds = np.cumsum(np.bincount(codes, minlength=len(column.categories)))[:-1]
+        groups = np.split(seconds[order], bounds)
+        return {category: _time_stats(group, percentiles)
+                for category, group in zip(column.categories, groups) if len(group)}
+
+    def counts(self, by: str = "vo_name") -> Dict[str, int]:
+        """
+        Count jobs per value of a categorical column.
+
+        Args:
+            by (str, optional): The column to group by.
+
+        Returns:
+            Dict[str, int]: The number of jobs for each value.
+        """
+        column = self.columns[by]
+        counts = np.bincount(column.codes, minlength=len(column.categories))
+        return {category: int(count) for category, count in zip(column.categories, counts) if count}
+
+    def failure_rates(self, by: str = "source_se") -> Dict[str, Dict[str, float]]:
+        """
+        Compute the failure rate of ended jobs per value of a categorical column.
+
+        Only jobs in `FAILED_STATES` or `SUCCEEDED_STATES` are counted; active and
+        canceled jobs are left out.
+
+        Args:
+            by (str, optional): The column to group by, e.g. "source_se" or "destination_se".
+
+        Returns:
+            Dict[str, Dict[str, float]]: For each value, the number of `failed` and `succeeded`
+            jobs and the `failure_rate` (failed / (failed + succeeded)).
+        """
+        column, states = self.columns[by], self.columns["jobState"]
+        size = len(column.categories)
+        failed_codes = [states.code(state) for state in FAILED_STATES]
+        succeeded_codes = [states.code(state) for state in SUCCEEDED_STATES]
+        failed = np.bincount(column.codes[np.isin(states.codes, failed_codes)], minlength=size)
+        succeeded = np.bincount(column.codes[np.isin(states.codes, succeeded_codes)], minlength=size)
+        rates = {}
+        for category, f, s in zip(column.categories, failed, succeeded):
+            if f + s:
+                rates[category] = {"failed": int(f), "succeeded": int(s), "failure_rate": f / (f + s)}
+        return rates
+
+    def to_arrow(self) -> Any:
+        """
+        Convert to an Arrow table.
+
+        Categorical columns become dictionary arrays and time columns become
+        `timestamp[us, UTC]` arrays with nulls where there is no value.
+
+        Returns:
+            pyarrow.Table: The table.
+        """
+        if pa is None:
+            raise ImportError("Arrow export requires the 'pyarrow' package")
+        arrays = {}
+        for name, kind in _COLUMNS.items():
+            column = self.columns[name]
+            if kind == "category":
+                arrays[name] = pa.DictionaryArray.from_arrays(pa.array(column.codes), pa.array(column.categories))
+            elif kind == "time":
+                arrays[name] = pa.array(column, mask=column == MISSING_TIME).cast(pa.timestamp("us", tz="UTC"))
+            else:
+                arrays[name] = pa.array(column)
+        return pa.table(arrays)
+
+def _time_stats(seconds: Any, percentiles: List[float]) -> Dict[str, float]:
+    if not len(seconds):
+        return {"count": 0}
+    stats = {"count": int(len(seconds)), "mean": float(seconds.mean()),
+             "min": float(seconds.min()), "max": float(seconds.max())}
+    for percentile, value in zip(percentiles, np.percentile(seconds, percentiles)):
+        stats[f"p{percentile:g}"] = float(value)
+    return stats
+
+_EPOCH = datetime(1970, 1, 1)
+
+_GETTERS = {name: operator.attrgetter(name) for name in _COLUMNS}
+
+_CHUNK_SIZE = 8192
+
+def _to_micros(value: Optional[datetime]) -> int:
+    if value is None:
+        return MISSING_TIME
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+def to_columns(transfers: Union[TransferStatusList, Iterable[TransferStatus]]) -> TransferColumns:
+    """
+    Convert transfer job statuses into columns of NumPy arrays.
+
+    Statuses are read in a single pass, so a streamed iterator such as `iter_transfers`
+    is converted without keeping the `TransferStatus` objects in memory.
+
+    Args:
+        transfers (Union[TransferStatusList, Iterable[TransferStatus]]): The statuses.
+
+    Returns:
+        TransferColumns: The columns.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    _require_numpy()
+    if isinstance(transfers, TransferStatusList):
+        transfers = transfers.transfers
+    # Read the statuses in chunks, one column at a time, so a stream is consumed
+    # lazily while each column is gathered by a tight loop
+    values: Dict[str, List[Any]] = {name: [] for name in _COLUMNS}
+    transfers = iter(transfers)
+    while True:
+        chunk = list(itertools.islice(transfers, _CHUNK_SIZE))
+        if not chunk:
+            break
+        for name, getter in _GETTERS.items():
+            values[name].extend(map(getter, chunk))
+
+    columns: Dict[str, Any] = {}
+    for name, kind in _COLUMNS.items():
+        column = values.pop(name)
+        if kind == "category":
+            index: Dict[str, int] = {}
+            codes = [index.setdefault(value or "", len(index)) for value in column]
+            columns[name] = Categorical(np.array(codes, dtype=np.int32), list(index))
+        elif kind == "time":
+            columns[name] = np.array([_to_micros(value) for value in column], dtype=np.int64)
+        elif kind == "int":
+            columns[name] = np.array(column, dtype=np.int32)
+        elif kind == "bool":
+            columns[name] = np.array(column, dtype=bool)
+        else:
+            columns[name] = np.array(column, dtype=object)
+    return TransferColumns(columns)
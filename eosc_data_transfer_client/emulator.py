@@ -0,0 +1,346 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from .models import TransferStatus
+
+# Draws a duration in seconds
+Distribution = Callable[[random.Random], float]
+
+def fixed_latency(seconds: float) -> Distribution:
+    """Always the same duration, in seconds."""
+    return lambda rng: seconds
+
+def uniform_latency(low: float, high: float) -> Distribution:
+    """A duration drawn uniformly between `low` and `high` seconds."""
+    return lambda rng: rng.uniform(low, high)
+
+def exponential_latency(mean: float) -> Distribution:
+    """An exponentially distributed duration with the given mean, in seconds."""
+    return lambda rng: rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> Distribution:
+    """A log-normally distributed duration with the given median, in seconds; `sigma` sets the tail."""
+    return lambda rng: rng.lognormvariate(math.log(median), sigma)
+
+@dataclass
+class EmulatorConfig:
+    """
+    Behaviour of an `APIEmulator`.
+
+    Attributes:
+        latency (Distribution): Time taken to answer each request.
+        queued (Distribution): Time a new job stays SUBMITTED.
+        active (Distribution): Time a job then stays ACTIVE before it ends.
+        job_failure_rate (float): Fraction of jobs that end FAILED instead of FINISHED.
+        error_rate (float): Fraction of requests answered with `error_status`.
+        error_status (int): Status code of injected errors.
+        throttle_rate (float): Fraction of requests answered with 429 Too Many Requests.
+        retry_after (Optional[float]): `Retry-After` header of 429 responses, in seconds.
+        files_per_doi (Callable[[str], int]): Number of files returned by `/parser` for a DOI.
+        file_size (Distribution): Size of the files returned by `/parser`, in bytes.
+        token (Optional[str]): Bearer token required on every request, if any.
+        seed (Optional[int]): Seed of the random generator, for reproducible runs.
+    """
+    latency: Distribution = fixed_latency(0.0)
+    queued: Distribution = fixed_latency(1.0)
+    active: Distribution = fixed_latency(5.0)
+    job_failure_rate: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    throttle_rate: float = 0.0
+    retry_after: Optional[float] = 1.0
+    files_per_doi: Callable[[str], int] = lambda doi: 10
+    file_size: Distribution = fixed_latency(1 << 20)
+    token: Optional[str] = None
+    seed: Optional[int] = None
+
+@dataclass
+class EmulatorStats:
+    """
+    Counters of an `APIEmulator`.
+
+    Attributes:
+        requests (int): Requests received.
+        errors (int): Requests answered with an injected error.
+        throttled (int): Requests answered with an injected 429.
+        submitted (int): Transfer jobs created.
+    """
+    requests: int = 0
+    errors: int = 0
+    throttled: int = 0
+    submitted: int = 0
+
+@dataclass
+class _Job:
+    job_id: str
+    request: Dict[str, Any]
+    submitted_at: float
+    queued: float
+    active: float
+    fails: bool
+    canceled_at: Optional[float] = None
+
+class APIEmulator:
+    """
+    An in-process emulator of the EOSC Data Transfer API, for load and latency testing.
+
+    Serves `POST /transfers`, `GET /transfers`, `GET|DELETE /transfer/{id}`,
+    `GET /transfer/{id}/{field}`, `GET /parser` and `GET /user/info` from a local
+    threaded HTTP server with keep-alive. Jobs go through SUBMITTED, ACTIVE and then
+    FINISHED or FAILED as time passes, and latency, errors and 429s are injected at
+    random according to an `EmulatorConfig`.
+
+    Example:
+        config = EmulatorConfig(latency=lognormal_latency(0.02), throttle_rate=0.01)
+        with APIEmulator(config) as emulator:
+            client = EOSCClient(emulator.url, retry=RetryPolicy())
+            job = create_transfer(client, request)
+    """
+    def __init__(self, config: Optional[EmulatorConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initializes the APIEmulator.
+
+        Args:
+            config (EmulatorConfig, optional): Behaviour of the emulator.
+            host (str, optional): Address to listen on.
+            port (int, optional): Port to listen on; 0 picks a free one.
+        """
+        self.config = config if config is not None else EmulatorConfig()
+        self.stats = EmulatorStats()
+        self._jobs: Dict[str, _Job] = {}
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """The base URL to pass to `EOSCClient`."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "APIEmulator":
+        """Start serving in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), name="eosc-api-emulator", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "APIEmulator":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def _draw(self, distribution: Distribution) -> float:
+        with self._lock:
+            return max(0.0, distribution(self._rng))
+
+    def _inject(self) -> Optional[Tuple[int, Dict[str, str]]]:
+        config = self.config
+        with self._lock:
+            self.stats.requests += 1
+            roll = self._rng.random()
+            if roll < config.throttle_rate:
+                self.stats.throttled += 1
+                headers = {"Retry-After": f"{config.retry_after:g}"} if config.retry_after is not None else {}
+                return 429, headers
+            if roll < config.throttle_rate + config.error_rate:
+                self.stats.errors += 1
+                return config.error_status, {}
+        return None
+
+    def _status(self, job: _Job, now: float) -> Dict[str, Any]:
+        elapsed = now - job.submitted_at
+        finished_at = None
+        if job.canceled_at is not None:
+            state, finished_at = "CANCELED", job.canceled_at
+        elif elapsed < job.queued:
+            state = "SUBMITTED"
+        elif elapsed < job.queued + job.active:
+            state = "ACTIVE"
+        else:
+            state = "FAILED" if job.fails else "FINISHED"
+            finished_at = job.submitted_at + job.queued + job.active
+        files = job.request.get("files") or [{}]
+        params = job.request.get("params") or {}
+        return {
+            "kind": "transfer",
+            "jobId": job.job_id,
+            "jobState": state,
+            "source_se": _host(files[0].get("sources")),
+            "destination_se": _host(files[0].get("destinations")),
+            "verifyChecksum": "both" if params.get("verifyChecksum") else "none",
+            "overwrite": bool(params.get("overwrite")),
+            "priority": params.get("priority", 3),
+            "retry": params.get("retry", 0),
+            "retryDelay": 0,
+            "cancel": job.canceled_at is not None,
+            "submittedAt": _timestamp(job.submitted_at),
+            "finishedAt": _timestamp(finished_at) if finished_at is not None else None,
+            "reason": "Emulated failure" if state == "FAILED" else "",
+            "submittedTo": "fts.emulator",
+            "vo_name": "emulator",
+            "user_dn": "/CN=emulator",
+            "cred_id": "emulator",
+        }
+
+    def _submit(self, body: Dict[str, Any]) -> Tuple[int, Any]:
+        if not isinstance(body, dict) or not body.get("files"):
+            return 400, {"message": "A transfer request needs at least one file"}
+        job = _Job(str(uuid.uuid4()), body, time.time(), self._draw(self.config.queued),
+                   self._draw(self.config.active), self._draw(lambda rng: rng.random()) < self.config.job_failure_rate)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self.stats.submitted += 1
+        return 200, {"kind": "TransferResponse", "jobId": job.job_id}
+
+    def _list(self, query: Dict[str, List[str]]) -> Tuple[int, Any]:
+        offset = int(query.pop("offset", ["0"])[0])
+        limit = query.pop("limit", [None])[0]
+        now = time.time()
+        with self._lock:
+            jobs = list(self._jobs.values())
+        statuses = [self._status(job, now) for job in jobs]
+        # Other query parameters filter on status fields
+        for name, values in query.items():
+            statuses = [status for status in statuses if str(status.get(name)) in values]
+        statuses = statuses[offset:offset + int(limit)] if limit is not None else statuses[offset:]
+        return 200, {"kind": "TransferStatusList", "count": len(statuses), "transfers": statuses}
+
+    def _job(self, method: str, job_id: str, field_name: Optional[str]) -> Tuple[int, Any]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and method == "DELETE" and job.canceled_at is None:
+                if self._status(job, time.time())["jobState"] in ("SUBMITTED", "ACTIVE"):
+                    job.canceled_at = time.time()
+        if job is None:
+            return 404, {"message": f"Transfer job '{job_id}' not found"}
+        status = self._status(job, time.time())
+        if field_name is None:
+            return 200, status
+        if field_name not in TransferStatus.model_fields:
+            return 400, {"message": f"Unknown field '{field_name}'"}
+        return 200, {"entity": status.get(field_name)}
+
+    def _parse(self, query: Dict[str, List[str]]) -> Tuple[int, Any]:
+        doi = query.get("doi", [""])[0]
+        if not doi:
+            return 400, {"message": "Missing 'doi' parameter"}
+        record = doi.rstrip("/").rsplit("/", 1)[-1]
+        count = self.config.files_per_doi(doi)
+        elements = []
+        for i in range(count):
+            url = f"https://repository.emulator/records/{record}/files/file-{i}.dat"
+            elements.append({
+                "kind": "StorageElement", "name": f"file-{i}.dat", "path": f"/file-{i}.dat", "isFolder": False,
+                "isAccessible": True, "size": int(self._draw(self.config.file_size)), "mediaType": "application/octet-stream",
+                "accessUrl": url, "downloadUrl": url + "?download=1", "checksum": f"md5:{i:032x}",
+            })
+        return 200, {"kind": "StorageContent", "count": count, "elements": elements}
+
+    def _route(self, method: str, path: str, query: Dict[str, List[str]], body: Any) -> Tuple[int, Any]:
+        parts = [part for part in path.split("/") if part]
+        if parts == ["transfers"]:
+            if method == "POST":
+                return self._submit(body)
+            if method == "GET":
+                return self._list(query)
+        elif len(parts) in (2, 3) and parts[0] == "transfer":
+            if method in ("GET", "DELETE") and (len(parts) == 2 or method == "GET"):
+                return self._job(method, parts[1], parts[2] if len(parts) == 3 else None)
+        elif parts == ["parser"] and method == "GET":
+            return self._parse(query)
+        elif parts == ["user", "info"] and method == "GET":
+            return 200, {"kind": "UserInfo", "base_id": "emulator", "user_dn": "/CN=emulator",
+                         "delegation_id": "emulator", "vos": ["emulator"], "vos_id": ["emulator"]}
+        else:
+            return 404, {"message": f"No such endpoint: {path}"}
+        return 405, {"message": f"Method {method} not allowed on {path}"}
+
+def _host(urls: Optional[List[str]]) -> str:
+    return urlsplit(urls[0]).netloc if urls else ""
+
+def _timestamp(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, timezone.utc).replace(tzinfo=None).isoformat(timespec="seconds")
+
+def _make_handler(emulator: APIEmulator):
+    class Handler(BaseHTTPRequestHandler):
+        # HTTP/1.1 keeps connections open between requests, like the real service
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately; without this, Nagle's algorithm delays the body
+        disable_nagle_algorithm = True
+
+        def _handle(self, method: str) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            config = emulator.config
+            time.sleep(emulator._draw(config.latency))
+            injected = emulator._inject()
+            headers: Dict[str, str] = {}
+            if config.token is not None and self.headers.get("Authorization") != f"Bearer {config.token}":
+                status, payload = 401, {"message": "Unauthorized"}
+            elif injected is not None:
+                (status, headers), payload = injected, {"message": "Injected error"}
+            else:
+                parts = urlsplit(self.path)
+                try:
+                    body = json.loads(raw) if raw else None
+                except ValueError:
+                    status, payload = 400, {"message": "Invalid JSON body"}
+                else:
+                    status, payload = emulator._route(method, parts.path, parse_qs(parts.query), body)
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            self._handle("GET")
+
+        def do_POST(self) -> None:
+            self._handle("POST")
+
+        def do_DELETE(self) -> None:
+            self._handle("DELETE")
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
@@ -13,9 +13,39 @@
 #   limitations under the License.
 
 from .client import EOSCClient
-from .models import TransferRequest, TransferResponse, TransferStatus, TransferStatusList, StorageContent, UserInfo
+from .exceptions import EOSCClientError, EOSCServerError
+from .models import TransferRequest, TransferResponse, TransferStatus, TransferStatusList, StorageContent, StorageElement, UserInfo
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
-from typing import Optional, Any, Union
+import time
+from pydantic import BaseModel
+from typing import Optional, Any, Callable, Dict, Iterator, Tuple, Type, TypeVar, Union
+from .utils import endpoint_template, iter_json_array
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+def _validate(client: Any, model: Type[ModelT], endpoint: str, payload: Any) -> ModelT:
+    # Trusted responses are validated straight from the raw bytes by pydantic-core,
+    # skipping the intermediate dict and keyword expansion
+    if client.metrics is None:
+        return model.model_validate_json(payload) if client.trusted_responses else model(**payload)
+    start = time.perf_counter()
+    result = model.model_validate_json(payload) if client.trusted_responses else model(**payload)
+    client.metrics.observe("validate", time.perf_counter() - start, model=model.__name__,
+                           endpoint=endpoint_template(endpoint))
+    return result
+
+def _parse_model(client: Any, model: Type[ModelT], endpoint: str, response: Any) -> ModelT:
+    payload = response.content if client.trusted_responses else client._decode(response, endpoint)
+    return _validate(client, model, endpoint, payload)
+
+def _request_model(client: EOSCClient, model: Type[ModelT], method: str, endpoint: str, **kwargs: Any) -> ModelT:
+    if client.trusted_responses:
+        return _validate(client, model, endpoint, client.send(method, endpoint, **kwargs).content)
+    return _validate(client, model, endpoint, client.request(method, endpoint, **kwargs))
 
 def create_transfer(client: EOSCClient, transfer: TransferRequest) -> TransferResponse:
     """
@@ -23,6 +53,8 @@ def create_transfer(client: EOSCClient, transfer: TransferRequest) -> TransferRe
 
     This function sends a `POST` request to the EOSC Data Transfer API to create a new transfer job.
 
+    If the client has a `TransferJournal`, the submitted job is recorded in it.
+
     Arguments:
         client: An instance of `EOSCClient` configured with base URL and authentication.
         transfer: A `TransferRequest` object describing the files to transfer and transfer parameters.
@@ -34,8 +66,20 @@ def create_transfer(client: EOSCClient, transfer: TransferRequest) -> TransferRe
         EOSCClientError: If the API returns a 4xx error (e.g., invalid input).
         EOSCServerError: If the API returns a 5xx error (e.g., internal server error).
     """
-    response = client.request("POST", "/transfers", json=transfer.model_dump())
-    return TransferResponse(**response)
+    # Serialized by pydantic-core directly to bytes, without an intermediate dict
+    body = transfer.model_dump_json().encode("utf-8")
+    journal = client.journal
+    if journal is None:
+        return _request_model(client, TransferResponse, "POST", "/transfers", data=body)
+    # Recorded before sending, so a crash before the response leaves a trace of the job
+    submission = journal.begin_submission(transfer)
+    try:
+        response = _request_model(client, TransferResponse, "POST", "/transfers", data=body)
+    except (EOSCClientError, EOSCServerError):
+        journal.abort_submission(submission)
+        raise
+    journal.record_submission(transfer, response, submission)
+    return response
 
 def get_transfer_status(client: EOSCClient, transfer_id: str) -> TransferStatus:
     """
@@ -44,6 +88,9 @@ def get_transfer_status(client: EOSCClient, transfer_id: str) -> TransferStatus:
     This function sends a `GET` request to the API to fetch full details about a specific transfer job
     using its job ID.
 
+    If the client has a `StatusCache`, terminal jobs and recently fetched active jobs are
+    answered from it without a request.
+
     Arguments:
         client: An instance of `EOSCClient` for making authenticated requests.
         transfer_id: The ID of the transfer job to retrieve.
@@ -55,8 +102,17 @@ def get_transfer_status(client: EOSCClient, transfer_id: str) -> TransferStatus:
         EOSCClientError: If the job ID is invalid or not found.
         EOSCServerError: If the API encounters an internal issue.
     """
-    response = client.request("GET", f"/transfer/{transfer_id}")
-    return TransferStatus(**response)
+    cache = client.status_cache
+    if cache is not None:
+        status = cache.get(transfer_id)
+        if status is not None:
+            return status
+    status = _request_model(client, TransferStatus, "GET", f"/transfer/{transfer_id}")
+    if cache is not None:
+        cache.put(status)
+    if client.journal is not None:
+        client.journal.update((status,))
+    return status
 
 def get_transfer_field(client: EOSCClient, job_id: str, field_name: str) -> Union[str, int, bool, dict, datetime]:
     """
@@ -73,32 +129,48 @@ def get_transfer_field(client: EOSCClient, job_id: str, field_name: str) -> Unio
     Raises:
         ValueError: If the field name is invalid or type conversion fails.
     """
-    model_fields = TransferStatus.model_fields
-    if field_name not in model_fields:
-        raise ValueError(f"Unsupported field name: '{field_name}'. Must be one of: {list(model_fields.keys())}")
-
-    expected_type = model_fields[field_name].annotation
+    # Reject unknown fields before sending the request
+    _field_converter(field_name)
     raw_response = client.request("GET", f"/transfer/{job_id}/{field_name}")
+    return _parse_field(field_name, raw_response)
+
+def _to_bool(value: Any) -> bool:
+    return str(value).lower() in {"true", "1", "yes"}
+
+def _to_dict(value: Any) -> dict:
+    return value if isinstance(value, dict) else {}
+
+_CONVERTERS = {int: int, float: float, datetime: datetime.fromisoformat, bool: _to_bool, dict: _to_dict}
+
+# Built once per field on first use, instead of inspecting the model on every call
+_FIELD_CONVERTERS: Dict[str, Tuple[Any, Callable[[Any], Any]]] = {}
+
+def _field_converter(field_name: str) -> Tuple[Any, Callable[[Any], Any]]:
+    converter = _FIELD_CONVERTERS.get(field_name)
+    if converter is None:
+        model_fields = TransferStatus.model_fields
+        if field_name not in model_fields:
+            raise ValueError(f"Unsupported field name: '{field_name}'. Must be one of: {list(model_fields.keys())}")
+        expected_type = model_fields[field_name].annotation
+        # Optional[X] fields are converted as X
+        args = [arg for arg in getattr(expected_type, "__args__", ()) if arg is not type(None)]
+        if getattr(expected_type, "__origin__", None) is Union and len(args) == 1:
+            expected_type = args[0]
+        converter = _FIELD_CONVERTERS[field_name] = (expected_type, _CONVERTERS.get(expected_type, str))
+    return converter
+
+def _parse_field(field_name: str, raw_response: dict, required: bool = True) -> Union[str, int, bool, dict, datetime, None]:
+    expected_type, convert = _field_converter(field_name)
 
     # Extract from "entity"
     value = raw_response.get("entity", None)
     if value is None:
+        if not required:
+            return None
         raise ValueError(f"No 'entity' found in response for field '{field_name}'")
 
-    # Parse value based on expected type
     try:
-        if expected_type is int:
-            return int(value)
-        elif expected_type is float:
-            return float(value)
-        elif expected_type is datetime:
-            return datetime.fromisoformat(value)
-        elif expected_type is bool:
-            return str(value).lower() in {"true", "1", "yes"}
-        elif expected_type is dict:
-            return value if isinstance(value, dict) else {}
-        else:
-            return str(value)
+        return convert(value)
     except Exception as e:
         raise ValueError(f"Failed to convert value for field '{field_name}' to {expected_type}: {e}")
 
@@ -113,8 +185,12 @@ def cancel_transfer(client: EOSCClient, job_id: str) -> TransferStatus:
     Returns:
         TransferStatus: The canceled transfer with its current status (canceled or any other final status).
     """
-    response = client.request("DELETE", f"/transfer/{job_id}")
-    return TransferStatus(**response)
+    status = _request_model(client, TransferStatus, "DELETE", f"/transfer/{job_id}")
+    if client.status_cache is not None:
+        client.status_cache.put(status)
+    if client.journal is not None:
+        client.journal.update((status,))
+    return status
 
 def list_transfers(client: EOSCClient, **filters: Optional[Any]) -> TransferStatusList:
     """
@@ -129,13 +205,129 @@ def list_transfers(client: EOSCClient, **filters: Optional[Any]) -> TransferStat
     """
     # Filter out None values
     query_params = {k: v for k, v in filters.items() if v is not None}
-    response = client.request("GET", "/transfers", params=query_params)
-    return TransferStatusList(**response)
+    transfers = _request_model(client, TransferStatusList, "GET", "/transfers", params=query_params)
+    if client.status_cache is not None:
+        client.status_cache.update(transfers.transfers)
+    if client.journal is not None:
+        client.journal.update(transfers.transfers)
+    return transfers
+
+def iter_transfer_pages(client: EOSCClient, page_size: int = 1000, prefetch: bool = True,
+                        offset_param: str = "offset", limit_param: str = "limit",
+                        **filters: Optional[Any]) -> Iterator[TransferStatusList]:
+    """
+    Find transfers matching search criteria, one page at a time.
+
+    Pages are requested with offset/limit query parameters until a page comes back
+    with fewer than `page_size` transfers, or until a page only holds jobs of the previous
+    one (as happens when the server ignores the offset). Jobs repeated from the previous
+    page, e.g. when a job submitted during the scan shifts the window, are dropped.
+    With `prefetch`, the next page is fetched
+    in a background thread while the caller handles the current one, so a full scan
+    costs about one round trip in total rather than one per page.
+
+    Args:
+        client: The API client.
+        page_size: Number of transfers per page.
+        prefetch: Whether to fetch the next page in the background.
+        offset_param: Name of the query parameter holding the offset.
+        limit_param: Name of the query parameter holding the page size.
+        **filters: Optional query parameters to filter the search.
+
+    Yields:
+        TransferStatusList: Each page of transfers matching the criteria.
+
+    Raises:
+        EOSCClientError: For 4xx errors.
+        EOSCServerError: For 5xx errors.
+        EOSCRequestError: For network issues.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+    def fetch(offset: int) -> TransferStatusList:
+        return list_transfers(client, **{**filters, offset_param: offset, limit_param: page_size})
+
+    # Only the previous page is remembered, so memory stays bounded on full-history scans
+    previous: set = set()
+
+    def unseen(page: TransferStatusList) -> Optional[TransferStatusList]:
+        nonlocal previous
+        ids = [t.jobId for t in page.transfers]
+        # A server that ignores the offset returns the same full page forever
+        if ids and all(job_id in previous for job_id in ids):
+            return None
+        fresh = [t for t in page.transfers if t.jobId not in previous]
+        previous = set(ids)
+        return page if len(fresh) == len(ids) else page.model_copy(update={"transfers": fresh})
+
+    if not prefetch:
+        offset = 0
+        while True:
+            page = fetch(offset)
+            fresh = unseen(page)
+            if fresh is None:
+                return
+            yield fresh
+            if len(page.transfers) < page_size:
+                return
+            offset += page_size
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(fetch, 0)
+        offset = 0
+        try:
+            while True:
+                page = future.result()
+                fresh = unseen(page)
+                if fresh is None:
+                    return
+                offset += page_size
+                last = len(page.transfers) < page_size
+                if not last:
+                    future = executor.submit(fetch, offset)
+                yield fresh
+                if last:
+                    return
+        finally:
+            future.cancel()
+
+def iter_transfers(client: EOSCClient, **filters: Optional[Any]) -> Iterator[TransferStatus]:
+    """
+    Find transfers matching search criteria, streaming the results.
+
+    Streaming version of `list_transfers`: the response body is parsed incrementally
+    and each transfer is validated and yielded on its own, so memory stays bounded
+    for listings with tens of thousands of jobs.
+
+    Args:
+        client: The API client.
+        **filters: Optional query parameters to filter the search.
+
+    Yields:
+        TransferStatus: Each transfer matching the criteria.
+
+    Raises:
+        EOSCClientError: For 4xx errors.
+        EOSCServerError: For 5xx errors.
+        EOSCRequestError: For network issues.
+    """
+    query_params = {k: v for k, v in filters.items() if v is not None}
+    response = client.send("GET", "/transfers", params=query_params, stream=True)
+    with closing(response):
+        for item in iter_json_array(response.iter_content(STREAM_CHUNK_SIZE), "transfers"):
+            status = TransferStatus(**item)
+            if client.status_cache is not None:
+                client.status_cache.put(status)
+            yield status
 
 def parse_doi(client: EOSCClient, doi: str) -> StorageContent:
     """
     Parse a PID (e.g., DOI) and retrieve associated file metadata.
 
+    If the client has a `DOICache`, fresh cached results are returned without a request,
+    and expired ones are revalidated with a conditional request when possible.
+
     Args:
         pid (str): The persistent identifier to parse.
 
@@ -147,8 +339,70 @@ def parse_doi(client: EOSCClient, doi: str) -> StorageContent:
         EOSCServerError: For 5xx errors.
         EOSCRequestError: For network issues.
     """
-    response = client.request("GET", "/parser", params={"doi": doi})
-    return StorageContent(**response)
+    cache = client.doi_cache
+    if cache is None:
+        return _request_model(client, StorageContent, "GET", "/parser", params={"doi": doi})
+
+    entry = cache.get(doi)
+    if entry is not None and entry.fresh:
+        return entry.content
+    headers = entry.validators() if entry is not None else {}
+    response = client.send("GET", "/parser", params={"doi": doi}, headers=headers)
+    if response.status_code == 304 and entry is not None:
+        cache.revalidated(doi)
+        return entry.content
+    content = _parse_model(client, StorageContent, "/parser", response)
+    cache.put(doi, content, etag=response.headers.get("ETag"), last_modified=response.headers.get("Last-Modified"))
+    return content
+
+def iter_storage_elements(client: EOSCClient, doi: str) -> Iterator[StorageElement]:
+    """
+    Parse a PID (e.g., DOI), streaming the associated file metadata.
+
+    Streaming version of `parse_doi`: the response body is parsed incrementally and
+    each element is validated and yielded on its own, so memory stays bounded for
+    DOIs with huge file lists. A fresh entry in the client's `DOICache` is used if
+    present, but streamed results are not added to the cache.
+
+    Args:
+        client: The API client.
+        doi (str): The persistent identifier to parse.
+
+    Yields:
+        StorageElement: Each file or folder item of the DOI.
+
+    Raises:
+        EOSCClientError: For 4xx errors.
+        EOSCServerError: For 5xx errors.
+        EOSCRequestError: For network issues.
+    """
+    if client.doi_cache is not None:
+        entry = client.doi_cache.get(doi)
+        if entry is not None and entry.fresh:
+            yield from entry.content.elements
+            return
+    response = client.send("GET", "/parser", params={"doi": doi}, stream=True)
+    with closing(response):
+        for item in iter_json_array(response.iter_content(STREAM_CHUNK_SIZE), "elements"):
+            yield StorageElement(**item)
+
+def list_folder(client: EOSCClient, se_url: str) -> StorageContent:
+    """
+    List the content of a folder on a storage element.
+
+    Args:
+        client: The API client.
+        se_url (str): The URL of the folder, e.g. the `accessUrl` of a folder `StorageElement`.
+
+    Returns:
+        StorageContent: The files and folders directly inside the folder.
+
+    Raises:
+        EOSCClientError: For 4xx errors.
+        EOSCServerError: For 5xx errors.
+        EOSCRequestError: For network issues.
+    """
+    return _request_model(client, StorageContent, "GET", "/storage/folder/list", params={"seUrl": se_url})
 
 def get_user_info(client: EOSCClient) -> UserInfo:
     """
@@ -157,5 +411,4 @@ def get_user_info(client: EOSCClient) -> UserInfo:
     Returns:
         UserInfo: Metadata about the current user, including identity, VO membership, and permissions.
     """
-    response = client.request("GET", "/user/info")
-    return UserInfo(**response)
+    return _request_model(client, UserInfo, "GET", "/user/info")
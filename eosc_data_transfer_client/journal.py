@@ -0,0 +1,280 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import hashlib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+from .bulk import get_transfer_statuses
+from .client import EOSCClient
+from .models import TransferRequest, TransferResponse, TransferStatus, TERMINAL_JOB_STATES
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS jobs ("
+    "id INTEGER PRIMARY KEY, job_id TEXT UNIQUE, digest TEXT NOT NULL, submitted_at REAL NOT NULL, "
+    "state TEXT, vo_name TEXT, updated_at REAL, status TEXT)",
+    "CREATE INDEX IF NOT EXISTS jobs_digest ON jobs (digest)",
+    "CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state)",
+    "CREATE INDEX IF NOT EXISTS jobs_vo_name ON jobs (vo_name)",
+    "CREATE INDEX IF NOT EXISTS jobs_submitted_at ON jobs (submitted_at)",
+)
+
+_COLUMNS = "job_id, digest, submitted_at, state, vo_name, updated_at, status"
+
+@dataclass
+class JournalEntry:
+    """
+    A transfer job recorded in a `TransferJournal`.
+
+    Attributes:
+        job_id (Optional[str]): The ID of the transfer job. None while its submission is in
+            flight, or if the process stopped before the response arrived: the job may then
+            exist on the server without the journal knowing its ID.
+        digest (str): SHA-256 digest of the submitted `TransferRequest`.
+        submitted_at (float): When the job was submitted, as a UNIX timestamp.
+        state (Optional[str]): The latest known job state, None until a status was recorded.
+        vo_name (Optional[str]): The VO of the job, None until a status was recorded.
+        updated_at (Optional[float]): When the latest status was recorded, as a UNIX timestamp.
+        status (Optional[TransferStatus]): The latest known status.
+    """
+    job_id: Optional[str]
+    digest: str
+    submitted_at: float
+    state: Optional[str] = None
+    vo_name: Optional[str] = None
+    updated_at: Optional[float] = None
+    status: Optional[TransferStatus] = None
+
+    @property
+    def terminal(self) -> bool:
+        """Whether the job reached one of the `TERMINAL_JOB_STATES`."""
+        return self.state in TERMINAL_JOB_STATES
+
+class TransferJournal:
+    """
+    A persistent record of submitted transfer jobs, backed by an SQLite file.
+
+    Every job submitted with `create_transfer` is recorded with the digest of its
+    `TransferRequest` before the request is sent, and its ID is filled in once the
+    server answers, so a crash in between leaves an entry without job ID rather
+    than no entry at all. Its row is updated with the latest `TransferStatus`
+    returned by `get_transfer_status`, `cancel_transfer` and `list_transfers`.
+    Statuses of jobs that were not submitted through the journal are ignored.
+    Jobs are indexed by job ID, state, VO and submit time, so the journal answers
+    "what happened to yesterday's batch" without listing transfers on the server,
+    and after a crash `resume` re-polls only the jobs that were not yet terminal.
+
+    Example:
+        client = EOSCClient(base_url, token=token, journal=TransferJournal("transfers.sqlite"))
+        for job_id, status in client.journal.resume(client):
+            print(job_id, status)
+    """
+    def __init__(self, path: str):
+        """
+        Initializes the TransferJournal.
+
+        Args:
+            path (str): Path of the SQLite file, created if missing. Use ":memory:" for a
+                journal that does not outlive the process.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        # Write-ahead logging keeps committed rows safe if the process dies mid-write; with
+        # it, synchronous=NORMAL only syncs at checkpoints instead of on every status write
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        self._db.commit()
+
+    @staticmethod
+    def digest(transfer: TransferRequest) -> str:
+        """
+        Compute the digest identifying a transfer request.
+
+        Args:
+            transfer (TransferRequest): The transfer request.
+
+        Returns:
+            str: The hex SHA-256 digest of the request's JSON serialization.
+        """
+        return hashlib.sha256(transfer.model_dump_json().encode("utf-8")).hexdigest()
+
+    def begin_submission(self, transfer: TransferRequest) -> int:
+        """
+        Record a transfer request that is about to be submitted.
+
+        Args:
+            transfer (TransferRequest): The transfer request.
+
+        Returns:
+            int: The submission, to pass to `record_submission` or `abort_submission`.
+        """
+        with self._lock, self._db:
+            return self._db.execute(
+                "INSERT INTO jobs (digest, submitted_at) VALUES (?, ?)", (self.digest(transfer), time.time())
+            ).lastrowid
+
+    def record_submission(self, transfer: TransferRequest, response: TransferResponse,
+                          submission: Optional[int] = None) -> None:
+        """
+        Record a submitted transfer job.
+
+        Args:
+            transfer (TransferRequest): The submitted transfer request.
+            response (TransferResponse): The response of `create_transfer`.
+            submission (int, optional): The entry returned by `begin_submission`, which gets the job ID.
+                Without it a new entry is recorded.
+        """
+        with self._lock, self._db:
+            if submission is not None:
+                self._db.execute("UPDATE jobs SET job_id = ? WHERE id = ?", (response.jobId, submission))
+            else:
+                self._db.execute(
+                    "INSERT OR IGNORE INTO jobs (job_id, digest, submitted_at) VALUES (?, ?, ?)",
+                    (response.jobId, self.digest(transfer), time.time()),
+                )
+
+    def abort_submission(self, submission: int) -> None:
+        """
+        Drop the entry of a submission that the server rejected.
+
+        Args:
+            submission (int): The entry returned by `begin_submission`.
+        """
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM jobs WHERE id = ? AND job_id IS NULL", (submission,))
+
+    def update(self, statuses: Iterable[TransferStatus]) -> None:
+        """
+        Record the latest status of recorded jobs.
+
+        Args:
+            statuses (Iterable[TransferStatus]): The statuses, as returned by the API.
+        """
+        now = time.time()
+        rows = [(status.jobState, status.vo_name, now, status.model_dump_json(), status.jobId) for status in statuses]
+        with self._lock:
+            self._db.executemany(
+                "UPDATE jobs SET state = ?, vo_name = ?, updated_at = ?, status = ? WHERE job_id = ?", rows
+            )
+            self._db.commit()
+
+    def get(self, job_id: str) -> Optional[JournalEntry]:
+        """
+        Look up a recorded job.
+
+        Args:
+            job_id (str): The ID of the transfer job.
+
+        Returns:
+            Optional[JournalEntry]: The entry, or None if the job was not recorded.
+        """
+        entries = self._select("WHERE job_id = ?", (job_id,))
+        return entries[0] if entries else None
+
+    def find(self, transfer: TransferRequest) -> List[JournalEntry]:
+        """
+        Find the jobs already submitted for a transfer request, e.g. to avoid submitting it twice after a crash.
+
+        Args:
+            transfer (TransferRequest): The transfer request.
+
+        Returns:
+            List[JournalEntry]: The jobs submitted with the same request, oldest first. Entries
+            without job ID may or may not have reached the server.
+        """
+        return self._select("WHERE digest = ? ORDER BY submitted_at", (self.digest(transfer),))
+
+    def query(self, state: Optional[str] = None, vo_name: Optional[str] = None,
+              since: Optional[float] = None, until: Optional[float] = None) -> List[JournalEntry]:
+        """
+        Find recorded jobs by state, VO and submit time.
+
+        Args:
+            state (str, optional): Only jobs whose latest known state is this one.
+            vo_name (str, optional): Only jobs of this VO.
+            since (float, optional): Only jobs submitted at or after this UNIX timestamp.
+            until (float, optional): Only jobs submitted before this UNIX timestamp.
+
+        Returns:
+            List[JournalEntry]: The matching jobs, oldest first.
+        """
+        conditions, args = [], []
+        for condition, value in (("state = ?", state), ("vo_name = ?", vo_name),
+                                 ("submitted_at >= ?", since), ("submitted_at < ?", until)):
+            if value is not None:
+                conditions.append(condition)
+                args.append(value)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        return self._select(where + "ORDER BY submitted_at", tuple(args))
+
+    def pending(self) -> List[str]:
+        """
+        List the recorded jobs that are not known to be terminal.
+
+        Returns:
+            List[str]: The job IDs, oldest first.
+        """
+        placeholders = ", ".join("?" * len(TERMINAL_JOB_STATES))
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT job_id FROM jobs WHERE job_id IS NOT NULL AND (state IS NULL OR state NOT IN ({placeholders})) "
+                "ORDER BY submitted_at",
+                tuple(TERMINAL_JOB_STATES),
+            ).fetchall()
+        return [job_id for job_id, in rows]
+
+    def resume(self, client: EOSCClient, max_workers: int = 8) -> Iterator[Tuple[str, Union[TransferStatus, Exception]]]:
+        """
+        Re-poll the jobs that are not known to be terminal and record their statuses.
+
+        Jobs already recorded in a terminal state are skipped and cost no request; query them
+        with `get` or `query` instead.
+
+        Args:
+            client (EOSCClient): The API client.
+            max_workers (int, optional): Maximum number of concurrent requests.
+
+        Yields:
+            Tuple[str, Union[TransferStatus, Exception]]: The job ID with either its status or the
+            error raised while fetching it, in completion order.
+        """
+        for job_id, result in get_transfer_statuses(client, self.pending(), max_workers=max_workers):
+            # The endpoint already recorded the status if the client uses this journal
+            if isinstance(result, TransferStatus) and client.journal is not self:
+                self.update((result,))
+            yield job_id, result
+
+    def close(self) -> None:
+        """Close the SQLite file."""
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def _select(self, clause: str, args: tuple) -> List[JournalEntry]:
+        with self._lock:
+            rows = self._db.execute(f"SELECT {_COLUMNS} FROM jobs {clause}", args).fetchall()
+        return [
+            JournalEntry(job_id, digest, submitted_at, state, vo_name, updated_at,
+                         TransferStatus.model_validate_json(status) if status is not None else None)
+            for job_id, digest, submitted_at, state, vo_name, updated_at, status in rows
+        ]
@@ -0,0 +1,214 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import bisect
+import threading
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+from .utils import endpoint_template
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+"""Default histogram bucket bounds, in seconds."""
+
+# Short name -> (Prometheus metric name, help text)
+METRICS = {
+    "request": ("eosc_client_request_seconds",
+                "Time of each HTTP attempt, from sending the request to having the whole body."),
+    "headers": ("eosc_client_response_headers_seconds",
+                "Time until the response headers were parsed, including connection setup and server time."),
+    "download": ("eosc_client_response_body_seconds",
+                 "Time spent downloading the response body after the headers."),
+    "decode": ("eosc_client_decode_seconds", "Time spent decoding JSON response bodies."),
+    "validate": ("eosc_client_validate_seconds", "Time spent validating responses into models."),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+class MetricsSink:
+    """
+    Receives every observation of a `Metrics` instance, e.g. to forward it to StatsD or OpenTelemetry.
+
+    Subclasses override `observe`. It is called from the thread that made the request,
+    so it should be fast and thread-safe.
+    """
+    def observe(self, name: str, labels: Dict[str, str], seconds: float) -> None:
+        """
+        Record one observation.
+
+        Args:
+            name (str): Short name of the metric, one of the keys of `METRICS`.
+            labels (Dict[str, str]): The labels of the observation.
+            seconds (float): The observed duration, in seconds.
+        """
+        raise NotImplementedError
+
+class Histogram:
+    """
+    A cumulative histogram of durations for one set of labels.
+
+    Attributes:
+        buckets (Sequence[float]): Upper bounds of the buckets, in seconds.
+        counts (List[int]): Number of observations in each bucket (not cumulative), plus one for +Inf.
+        count (int): Total number of observations.
+        sum (float): Sum of the observed durations, in seconds.
+    """
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+class Metrics:
+    """
+    Latency histograms of the client's requests, by templated endpoint, status and exception.
+
+    Pass an instance to `EOSCClient` or `AsyncEOSCClient` to record, for every HTTP
+    attempt, the total time, the time to the response headers (connection setup and
+    server time) and the body download time, labelled by method, templated endpoint
+    (e.g. `/transfer/{id}`), HTTP status and exception type; plus the time spent
+    decoding JSON and validating models, by endpoint. Request counts are the `_count`
+    of each histogram. Clients without metrics skip all of this.
+
+    The `requests` library does not report DNS and connection times separately, so they
+    are part of the headers time.
+
+    Example:
+        metrics = Metrics()
+        client = EOSCClient(base_url, token=token, metrics=metrics)
+        ...
+        print(metrics.to_prometheus())
+    """
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, sinks: Iterable[MetricsSink] = ()):
+        """
+        Initializes the Metrics.
+
+        Args:
+            buckets (Sequence[float], optional): Histogram bucket bounds, in seconds.
+            sinks (Iterable[MetricsSink], optional): Sinks receiving every observation.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.sinks = list(sinks)
+        self._series: Dict[Tuple[str, Labels], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """
+        Record a duration.
+
+        Args:
+            name (str): Short name of the metric, one of the keys of `METRICS`.
+            seconds (float): The observed duration, in seconds.
+            **labels: The labels of the observation.
+        """
+        key = (name, tuple(labels.items()))
+        with self._lock:
+            histogram = self._series.get(key)
+            if histogram is None:
+                histogram = self._series[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+        for sink in self.sinks:
+            sink.observe(name, labels, seconds)
+
+    def get(self, name: str, **labels: str) -> Optional[Histogram]:
+        """
+        Look up the histogram of a metric for a set of labels.
+
+        Args:
+            name (str): Short name of the metric.
+            **labels: The labels, in the order they are recorded with.
+
+        Returns:
+            Optional[Histogram]: The histogram, or None if nothing was recorded.
+        """
+        return self._series.get((name, tuple(labels.items())))
+
+    def series(self, name: str) -> Dict[Labels, Histogram]:
+        """
+        All the histograms of a metric.
+
+        Args:
+            name (str): Short name of the metric.
+
+        Returns:
+            Dict[Labels, Histogram]: The histogram of each set of labels.
+        """
+        with self._lock:
+            return {labels: histogram for (metric, labels), histogram in self._series.items() if metric == name}
+
+    def reset(self) -> None:
+        """Forget every observation."""
+        with self._lock:
+            self._series.clear()
+
+    def to_prometheus(self) -> str:
+        """
+        Export the histograms in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, ready to be served on a `/metrics` endpoint.
+        """
+        lines = []
+        for name, (metric, help_text) in METRICS.items():
+            series = self.series(name)
+            if not series:
+                continue
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} histogram")
+            for labels, histogram in sorted(series.items()):
+                cumulative = 0
+                bounds = [f"{bound:g}" for bound in histogram.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, histogram.counts):
+                    cumulative += count
+                    lines.append(f"{metric}_bucket{_format_labels(labels + (('le', bound),))} {cumulative}")
+                lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.sum:.9g}")
+                lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n") for _, value in labels)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(labels, escaped)) + "}"
+
+def record_attempt(metrics: Metrics, method: str, endpoint: str, seconds: float, response: Any = None,
+                   error: Optional[BaseException] = None, headers_seconds: Optional[float] = None) -> None:
+    """
+    Record one HTTP attempt of a client.
+
+    Args:
+        metrics (Metrics): Where to record it.
+        method (str): HTTP method of the request.
+        endpoint (str): API endpoint path, templated before recording.
+        seconds (float): Total time of the attempt.
+        response (optional): The response, if one was received.
+        error (BaseException, optional): The network error, if no response was received.
+        headers_seconds (float, optional): Time until the response headers, if known.
+    """
+    labels = {
+        "method": method.upper(),
+        "endpoint": endpoint_template(endpoint),
+        "status": str(response.status_code) if response is not None else "",
+        "exception": type(error).__name__ if error is not None else "",
+    }
+    metrics.observe("request", seconds, **labels)
+    if headers_seconds is not None:
+        metrics.observe("headers", headers_seconds, **labels)
+        metrics.observe("download", max(0.0, seconds - headers_seconds), **labels)
@@ -71,6 +71,9 @@ class TransferResponse(BaseModel):
     kind: str
     jobId: str
 
+TERMINAL_JOB_STATES = frozenset({"FINISHED", "FINISHEDDIRTY", "FAILED", "CANCELED"})
+"""Job states after which a transfer job can no longer change."""
+
 class TransferStatus(BaseModel):
     """
     Represents the status of an ongoing or completed transfer job.
@@ -0,0 +1,216 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+from .client import EOSCClient
+from .endpoints import create_transfer, parse_doi
+from .models import FileTransfer, StorageContent, StorageElement, TransferParameters, TransferRequest, TransferResponse
+from .utils import normalize_doi
+
+Destination = Union[str, Callable[[str, StorageElement], str]]
+
+# How often blocked stages check whether the consumer stopped iterating, in seconds
+_POLL_INTERVAL = 0.1
+
+@dataclass
+class PipelineResult:
+    """
+    The outcome of one DOI in `run_pipeline`.
+
+    Attributes:
+        doi (str): The DOI, as given.
+        content (Optional[StorageContent]): The parsed content, if parsing succeeded.
+        request (Optional[TransferRequest]): The submitted transfer request, if it could be built.
+        response (Optional[TransferResponse]): The response of `create_transfer`, if submission succeeded.
+        error (Optional[Exception]): The error that stopped this DOI, if any.
+        stage (Optional[str]): The stage that failed: "parse", "build" or "submit".
+    """
+    doi: str
+    content: Optional[StorageContent] = None
+    request: Optional[TransferRequest] = None
+    response: Optional[TransferResponse] = None
+    error: Optional[Exception] = None
+    stage: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the DOI was submitted."""
+        return self.error is None
+
+def build_transfer_request(doi: str, content: StorageContent, destination: Destination,
+                           params: Optional[TransferParameters] = None) -> TransferRequest:
+    """
+    Build the transfer request copying the files of a parsed DOI to a destination.
+
+    Folders and inaccessible elements are skipped.
+
+    Arguments:
+        doi: The DOI the content was parsed from.
+        content: The result of `parse_doi`.
+        destination: Either a template formatted with the fields `doi` (normalized DOI),
+            `record` (its last path segment, e.g. "zenodo.10157504"), `name` and `path`
+            (the element's path without the leading slash), or a callable taking the DOI and
+            the `StorageElement` and returning the destination URL. A template without any
+            field is used as a prefix for the file name.
+        params: Parameters of the transfer job. Defaults to `TransferParameters()`.
+
+    Returns:
+        TransferRequest: The transfer request.
+
+    Raises:
+        ValueError: If the DOI has no accessible file.
+    """
+    if isinstance(destination, str):
+        template = destination if "{" in destination else destination + "{name}"
+        normalized = normalize_doi(doi)
+        record = normalized.rstrip("/").rsplit("/", 1)[-1]
+        destination = lambda doi, element: template.format(
+            doi=normalized, record=record, name=element.name, path=element.path.lstrip("/"))
+    files = [
+        FileTransfer(sources=[element.downloadUrl], destinations=[destination(doi, element)],
+                     checksum=element.checksum, filesize=element.size)
+        for element in content.elements
+        if not element.isFolder and element.isAccessible
+    ]
+    if not files:
+        raise ValueError(f"DOI '{doi}' has no accessible files")
+    return TransferRequest(files=files, params=params if params is not None else TransferParameters())
+
+def run_pipeline(client: EOSCClient, dois: Iterable[str], destination: Destination,
+                 params: Optional[TransferParameters] = None, parse_workers: int = 4,
+                 submit_workers: int = 2, queue_size: int = 16) -> Iterator[PipelineResult]:
+    """
+    Parse DOIs and submit a transfer job for each of them, as overlapped stages.
+
+    DOIs are parsed with `parse_doi` by up to `parse_workers` threads, turned into
+    transfer requests with `build_transfer_request`, and submitted with `create_transfer`
+    by up to `submit_workers` threads. Stages are connected by queues of `queue_size`
+    items: when submission or the caller falls behind, parsing pauses, and `dois` is
+    only read as fast as it is processed, so it can be a lazy stream of any size.
+
+    A failing DOI does not stop the pipeline; its result carries the error and the stage
+    that failed. Results are yielded in completion order. Stopping the iteration stops
+    the pipeline after the calls already in progress.
+
+    Arguments:
+        client: An instance of `EOSCClient` for making authenticated requests.
+        dois: The DOIs to transfer.
+        destination: Where to copy the files, see `build_transfer_request`.
+        params: Parameters of the transfer jobs.
+        parse_workers: Maximum number of concurrent `parse_doi` calls.
+        submit_workers: Maximum number of concurrent `create_transfer` calls.
+        queue_size: Capacity of the queues between stages.
+
+    Yields:
+        PipelineResult: The outcome of each DOI.
+
+    Example:
+        for result in run_pipeline(client, dois, "s3s://bucket/{record}/{path}"):
+            print(result.doi, result.response.jobId if result.ok else result.error)
+    """
+    if parse_workers < 1 or submit_workers < 1:
+        raise ValueError("parse_workers and submit_workers must be at least 1")
+    stop = threading.Event()
+    parsed: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+    results: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+    done = object()
+
+    def put(q: queue.Queue, item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def parse(doi: str, slots: threading.Semaphore) -> None:
+        try:
+            result = PipelineResult(doi)
+            try:
+                result.content = parse_doi(client, doi)
+            except Exception as e:
+                result.error, result.stage = e, "parse"
+                put(results, result)
+                return
+            try:
+                result.request = build_transfer_request(doi, result.content, destination, params)
+            except Exception as e:
+                result.error, result.stage = e, "build"
+                put(results, result)
+                return
+            put(parsed, result)
+        finally:
+            slots.release()
+
+    def feed() -> None:
+        slots = threading.Semaphore(parse_workers)
+        try:
+            with ThreadPoolExecutor(max_workers=parse_workers) as executor:
+                for doi in dois:
+                    # One slot per running parse, so DOIs are not read ahead of the workers
+                    while not slots.acquire(timeout=_POLL_INTERVAL):
+                        if stop.is_set():
+                            return
+                    if stop.is_set():
+                        return
+                    executor.submit(parse, doi, slots)
+        except Exception as e:
+            # Errors of the DOI stream itself are raised to the caller
+            put(results, e)
+        finally:
+            for _ in range(submit_workers):
+                put(parsed, done)
+
+    def submit() -> None:
+        try:
+            while True:
+                try:
+                    result = parsed.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    if stop.is_set():
+                        return
+                    continue
+                if result is done:
+                    return
+                try:
+                    result.response = create_transfer(client, result.request)
+                except Exception as e:
+                    result.error, result.stage = e, "submit"
+                if not put(results, result):
+                    return
+        finally:
+            put(results, done)
+
+    threads = [threading.Thread(target=feed, daemon=True)]
+    threads += [threading.Thread(target=submit, daemon=True) for _ in range(submit_workers)]
+    for thread in threads:
+        thread.start()
+    try:
+        remaining = submit_workers
+        while remaining:
+            item = results.get()
+            if item is done:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        stop.set()
@@ -0,0 +1,216 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import heapq
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+from .bulk import ChunkResult, ChunkedSubmission, _imap_unordered
+from .client import EOSCClient
+from .endpoints import create_transfer
+from .models import FileTransfer, TransferParameters, TransferRequest
+
+@dataclass
+class PlannedJob:
+    """
+    One transfer job of a `TransferPlan`.
+
+    Attributes:
+        index (int): Position of the job in the plan.
+        source_host (str): Host of the files' first source URL.
+        destination_host (str): Host of the files' first destination URL.
+        activity (str): Activity share of the files.
+        files (List[FileTransfer]): The files of the job.
+        priority (int): The priority the job is submitted with.
+        reason (str): Why the job was split from its group and given its priority.
+    """
+    index: int
+    source_host: str
+    destination_host: str
+    activity: str
+    files: List[FileTransfer] = field(default_factory=list)
+    priority: int = 3
+    reason: str = ""
+
+    @property
+    def total_bytes(self) -> int:
+        """Total `filesize` of the job's files."""
+        return sum(file.filesize for file in self.files)
+
+    def request(self, params: TransferParameters) -> TransferRequest:
+        """
+        Build the transfer request of the job.
+
+        Args:
+            params (TransferParameters): Parameters shared by every job; `priority` is replaced by the job's.
+
+        Returns:
+            TransferRequest: The transfer request.
+        """
+        return TransferRequest(files=self.files, params=params.model_copy(update={"priority": self.priority}))
+
+PriorityPolicy = Callable[[PlannedJob], int]
+
+def small_jobs_first(small_bytes: int = 1 << 30, large_bytes: int = 100 << 30,
+                     high: int = 5, normal: int = 3, low: int = 1) -> PriorityPolicy:
+    """
+    A priority policy that lets small jobs overtake large ones.
+
+    Args:
+        small_bytes (int, optional): Jobs of at most this total size get the `high` priority.
+        large_bytes (int, optional): Jobs of at least this total size get the `low` priority.
+        high (int, optional): Priority of small jobs.
+        normal (int, optional): Priority of the other jobs.
+        low (int, optional): Priority of large jobs.
+
+    Returns:
+        PriorityPolicy: The policy, to pass to `plan_transfers`.
+    """
+    def policy(job: PlannedJob) -> int:
+        total = job.total_bytes
+        if total <= small_bytes:
+            return high
+        if total >= large_bytes:
+            return low
+        return normal
+    return policy
+
+@dataclass
+class TransferPlan:
+    """
+    How a list of files is split into transfer jobs, before anything is submitted.
+
+    Attributes:
+        jobs (List[PlannedJob]): The planned jobs.
+        params (TransferParameters): Parameters shared by every job, except `priority`.
+    """
+    jobs: List[PlannedJob]
+    params: TransferParameters
+
+    def requests(self) -> List[TransferRequest]:
+        """The transfer request of every job, in plan order."""
+        return [job.request(self.params) for job in self.jobs]
+
+    def explain(self) -> str:
+        """A human-readable description of every job and why it was planned that way."""
+        lines = [f"{len(self.jobs)} jobs, {sum(len(job.files) for job in self.jobs)} files, "
+                 f"{sum(job.total_bytes for job in self.jobs)} bytes"]
+        for job in self.jobs:
+            lines.append(
+                f"job {job.index}: {job.source_host} -> {job.destination_host} [{job.activity}] "
+                f"{len(job.files)} files, {job.total_bytes} bytes, priority {job.priority}: {job.reason}"
+            )
+        return "\n".join(lines)
+
+def _host(url: str) -> str:
+    parts = urlsplit(url)
+    return (parts.netloc.rsplit("@", 1)[-1] or parts.path).lower()
+
+def _pack(files: List[FileTransfer], max_files: int, max_bytes: Optional[int]) -> List[List[FileTransfer]]:
+    # Longest-processing-time first: place the largest files first, each into the bin
+    # with the smallest total so far, opening a new bin when even that one is too full
+    total = sum(file.filesize for file in files)
+    count = max(math.ceil(len(files) / max_files), math.ceil(total / max_bytes) if max_bytes else 1, 1)
+    bins: List[List[FileTransfer]] = [[] for _ in range(count)]
+    heap: List[Tuple[int, int]] = [(0, i) for i in range(count)]
+    for file in sorted(files, key=lambda file: file.filesize, reverse=True):
+        size, i = heapq.heappop(heap) if heap else (0, -1)
+        if i < 0 or (max_bytes is not None and bins[i] and size + file.filesize > max_bytes):
+            if i >= 0:
+                heapq.heappush(heap, (size, i))
+            i, size = len(bins), 0
+            bins.append([])
+        bins[i].append(file)
+        # Full bins leave the heap
+        if len(bins[i]) < max_files:
+            heapq.heappush(heap, (size + file.filesize, i))
+    return [files for files in bins if files]
+
+def plan_transfers(files: Iterable[FileTransfer], max_files: int = 1000, max_bytes: Optional[int] = None,
+                   params: Optional[TransferParameters] = None,
+                   priority: Optional[PriorityPolicy] = None) -> TransferPlan:
+    """
+    Split files into transfer jobs that the transfer service can schedule efficiently.
+
+    Files are grouped by (source host, destination host) pair and `activity`, so no
+    job mixes storage endpoints or activity shares. Each group is then bin-packed into
+    as few jobs as `max_files` and `max_bytes` allow, balancing the total `filesize` of
+    the jobs, so that one huge file does not end up next to thousands of tiny ones
+    while other jobs stay small. The priority of each job is set by `priority`.
+
+    Arguments:
+        files: The files to transfer.
+        max_files: Maximum number of files per job.
+        max_bytes: Target maximum total file size per job, in bytes. A single file larger than
+            this gets a job of its own.
+        params: Parameters shared by every job. Defaults to `TransferParameters()`.
+        priority: Returns the priority of a planned job, e.g. `small_jobs_first()`. By default
+            every job keeps `params.priority`.
+
+    Returns:
+        TransferPlan: The planned jobs, to inspect with `explain` and submit with `submit_plan`.
+    """
+    if max_files < 1:
+        raise ValueError("max_files must be at least 1")
+    if max_bytes is not None and max_bytes < 1:
+        raise ValueError("max_bytes must be at least 1")
+    params = params if params is not None else TransferParameters()
+    groups: Dict[Tuple[str, str, str], List[FileTransfer]] = {}
+    for file in files:
+        key = (_host(file.sources[0]), _host(file.destinations[0]), file.activity or "default")
+        groups.setdefault(key, []).append(file)
+
+    jobs: List[PlannedJob] = []
+    for (source_host, destination_host, activity), group in groups.items():
+        bins = _pack(group, max_files, max_bytes)
+        limits = [f"max_files={max_files}"] + ([f"max_bytes={max_bytes}"] if max_bytes is not None else [])
+        for i, chosen in enumerate(bins):
+            job = PlannedJob(len(jobs), source_host, destination_host, activity, chosen)
+            if priority is None:
+                job.priority = params.priority
+                origin = "from params"
+            else:
+                job.priority = priority(job)
+                origin = "from policy"
+            job.reason = (f"bin {i + 1}/{len(bins)} of {len(group)} files packed by size ({', '.join(limits)}); "
+                          f"priority {origin}")
+            jobs.append(job)
+    return TransferPlan(jobs, params)
+
+def submit_plan(client: EOSCClient, plan: TransferPlan, max_workers: int = 4) -> ChunkedSubmission:
+    """
+    Submit every job of a plan in parallel.
+
+    A failing job does not stop the others; check `ChunkedSubmission.failed` to find
+    and resubmit them. Chunk indexes are the job indexes of the plan.
+
+    Arguments:
+        client: An instance of `EOSCClient` configured with base URL and authentication.
+        plan: The plan, as returned by `plan_transfers`.
+        max_workers: Maximum number of concurrent submissions.
+
+    Returns:
+        ChunkedSubmission: The result of every job, including its job ID or error.
+    """
+    def submit(job: PlannedJob) -> ChunkResult:
+        request = job.request(plan.params)
+        try:
+            return ChunkResult(job.index, request, response=create_transfer(client, request))
+        except Exception as e:
+            return ChunkResult(job.index, request, error=e)
+
+    results = [result for _, result in _imap_unordered(submit, plan.jobs, max_workers)]
+    return ChunkedSubmission(sorted(results, key=lambda result: result.index))
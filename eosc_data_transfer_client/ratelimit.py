@@ -0,0 +1,266 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
+from .utils import endpoint_template
+
+class TokenBucket:
+    """
+    A thread-safe token bucket rate limiter.
+
+    Tokens are refilled continuously at `rate` per second, up to `burst`.
+    Each call to `acquire` consumes one token, blocking until one is available.
+    `acquire_async` does the same without blocking the event loop, so one bucket
+    can be shared by threads and asyncio tasks.
+    """
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Initializes the TokenBucket.
+
+        Args:
+            rate (float): Number of tokens added per second.
+            burst (float, optional): Maximum number of tokens that can accumulate. Defaults to `max(rate, 1)`.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        # Take the tokens now and return how long the caller must wait for them
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until `tokens` are available and consume them.
+
+        Args:
+            tokens (float, optional): Number of tokens to consume.
+
+        Returns:
+            float: The time spent waiting, in seconds.
+        """
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        Wait until `tokens` are available and consume them, without blocking the event loop.
+
+        Args:
+            tokens (float, optional): Number of tokens to consume.
+
+        Returns:
+            float: The time spent waiting, in seconds.
+        """
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+class EndpointLimit:
+    """
+    Rate and concurrency limits for one group of endpoints.
+
+    Attributes:
+        rate (Optional[float]): Maximum number of requests per second, or None for no rate limit.
+        burst (Optional[float]): Number of requests that may be sent at once before the rate applies.
+        max_in_flight (Optional[int]): Maximum number of concurrent requests, or None for no limit.
+            Threads and asyncio tasks share the same count.
+    """
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None, max_in_flight: Optional[int] = None):
+        """
+        Initializes the EndpointLimit.
+
+        Args:
+            rate (float, optional): Maximum number of requests per second.
+            burst (float, optional): Number of requests that may be sent at once. Defaults to `max(rate, 1)`.
+            max_in_flight (int, optional): Maximum number of concurrent requests.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self._bucket = TokenBucket(rate, burst) if rate is not None else None
+        self._semaphore = threading.BoundedSemaphore(max_in_flight) if max_in_flight is not None else None
+        # Tasks waiting for a slot in async_slot, with the event loop each one runs in
+        self._waiters: deque = deque()
+        self._waiters_lock = threading.Lock()
+
+    def _release(self) -> None:
+        self._semaphore.release()
+        self._wake_waiter()
+
+    def _wake_waiter(self) -> None:
+        # Threads blocked in slot() are woken by the semaphore itself, tasks need a nudge
+        # in their own event loop, after which they try the semaphore again
+        with self._waiters_lock:
+            if not self._waiters:
+                return
+            loop, waiter = self._waiters.popleft()
+        loop.call_soon_threadsafe(lambda: waiter.done() or waiter.set_result(None))
+
+    def _forget_waiter(self, entry: tuple) -> None:
+        with self._waiters_lock:
+            try:
+                self._waiters.remove(entry)
+                return
+            except ValueError:
+                pass
+        # The waiter was woken but will not take the slot, so pass the wakeup on
+        self._wake_waiter()
+
+    async def _acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._semaphore.acquire(blocking=False):
+            entry = (loop, loop.create_future())
+            with self._waiters_lock:
+                self._waiters.append(entry)
+            # A slot released before the waiter was queued would not have woken it
+            if self._semaphore.acquire(blocking=False):
+                self._forget_waiter(entry)
+                return
+            try:
+                await entry[1]
+            except asyncio.CancelledError:
+                self._forget_waiter(entry)
+                raise
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Block until a request may be sent, and hold a concurrency slot while it runs."""
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        try:
+            if self._bucket is not None:
+                self._bucket.acquire()
+            yield
+        finally:
+            if self._semaphore is not None:
+                self._release()
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Wait until a request may be sent, and hold a concurrency slot while it runs."""
+        if self._semaphore is not None:
+            await self._acquire_async()
+        try:
+            if self._bucket is not None:
+                await self._bucket.acquire_async()
+            yield
+        finally:
+            if self._semaphore is not None:
+                self._release()
+
+class RateLimiter:
+    """
+    Client-side rate and concurrency limits, configured per endpoint group.
+
+    Groups are keyed by templated endpoint path, optionally prefixed with an HTTP
+    method, for example `"POST /transfers"`, `"GET /transfer/{id}"` or `"/parser"`.
+    A request uses the most specific matching group, then `default`. Requests that
+    match no group are not limited.
+
+    A limiter is thread-safe and can be shared between several clients, including
+    `AsyncEOSCClient`: both the request rate and the number of requests in flight are
+    counted across all of them, whichever thread or event loop they run in.
+
+    Example:
+        limiter = RateLimiter({
+            "POST /transfers": EndpointLimit(rate=2, max_in_flight=2),
+            "GET /transfer/{id}": EndpointLimit(rate=50, max_in_flight=16),
+        }, default=EndpointLimit(rate=20))
+        client = EOSCClient(base_url, token=token, rate_limiter=limiter)
+    """
+    def __init__(self, limits: Optional[Dict[str, EndpointLimit]] = None, default: Optional[EndpointLimit] = None):
+        """
+        Initializes the RateLimiter.
+
+        Args:
+            limits (Dict[str, EndpointLimit], optional): Limits per endpoint group.
+            default (EndpointLimit, optional): Limit for requests that match no group.
+        """
+        self.limits = {self._normalize(key): limit for key, limit in (limits or {}).items()}
+        self.default = default
+        self._resolved: Dict[Tuple[str, str], Optional[EndpointLimit]] = {}
+
+    @staticmethod
+    def _normalize(key: str) -> str:
+        method, _, path = key.strip().rpartition(" ")
+        return f"{method.upper()} {path}" if method else path
+
+    def limit_for(self, method: str, endpoint: str) -> Optional[EndpointLimit]:
+        """
+        Find the limit that applies to a request.
+
+        Args:
+            method (str): HTTP method of the request.
+            endpoint (str): API endpoint path.
+
+        Returns:
+            Optional[EndpointLimit]: The matching limit, or None if the request is not limited.
+        """
+        template = endpoint_template(endpoint)
+        key = (method.upper(), template)
+        if key not in self._resolved:
+            limit = self.limits.get(f"{key[0]} {template}", self.limits.get(template, self.default))
+            self._resolved[key] = limit
+        return self._resolved[key]
+
+    @contextmanager
+    def limit(self, method: str, endpoint: str) -> Iterator[None]:
+        """
+        Block until a request may be sent, and hold its concurrency slot while it runs.
+
+        Args:
+            method (str): HTTP method of the request.
+            endpoint (str): API endpoint path.
+        """
+        limit = self.limit_for(method, endpoint)
+        if limit is None:
+            yield
+        else:
+            with limit.slot():
+                yield
+
+    @asynccontextmanager
+    async def async_limit(self, method: str, endpoint: str) -> AsyncIterator[None]:
+        """
+        Async version of `limit`.
+
+        Args:
+            method (str): HTTP method of the request.
+            endpoint (str): API endpoint path.
+        """
+        limit = self.limit_for(method, endpoint)
+        if limit is None:
+            yield
+        else:
+            async with limit.async_slot():
+                yield
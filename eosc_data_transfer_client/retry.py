@@ -0,0 +1,157 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+from .exceptions import EOSCError, EOSCClientError, EOSCServerError, EOSCRequestError
+
+@dataclass
+class RetryStats:
+    """
+    Retry counters for a single call, or aggregated over many calls.
+
+    Attributes:
+        calls (int): Number of calls made.
+        attempts (int): Number of HTTP attempts made, including the first one.
+        retries (int): Number of attempts that were retries.
+        backoff (float): Total time spent sleeping between attempts, in seconds.
+    """
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    backoff: float = 0.0
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request should be retried.
+
+    Server errors, 429 responses and network errors are retried with exponential
+    backoff and full jitter: the delay before retry `n` is drawn uniformly from
+    `[0, min(max_backoff, backoff_factor * 2 ** (n - 1))]`. When the server sends
+    a `Retry-After` header, its value is used instead; if it asks for a longer wait
+    than `max_backoff`, the call gives up and the error is raised right away.
+
+    Only idempotent methods are retried by default. Add `"POST"` to `methods` to
+    retry transfer submissions too; note that a retried POST may create a duplicate
+    job if the first attempt reached the server.
+
+    The policy aggregates counters over every call in `stats`.
+    """
+    def __init__(self, max_retries: int = 3, backoff_factor: float = 0.5, max_backoff: float = 30.0,
+                 methods: Iterable[str] = ("GET", "DELETE"), statuses: Iterable[int] = (429, 500, 502, 503, 504),
+                 respect_retry_after: bool = True):
+        """
+        Initializes the RetryPolicy.
+
+        Args:
+            max_retries (int, optional): Maximum number of retries per call.
+            backoff_factor (float, optional): Base delay for the exponential backoff, in seconds.
+            max_backoff (float, optional): Upper bound for the backoff delay, in seconds. Also the
+                longest `Retry-After` that is waited for.
+            methods (Iterable[str], optional): HTTP methods that may be retried.
+            statuses (Iterable[int], optional): HTTP status codes that may be retried.
+            respect_retry_after (bool, optional): Whether to wait as long as the `Retry-After` header asks.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.methods = frozenset(method.upper() for method in methods)
+        self.statuses = frozenset(statuses)
+        self.respect_retry_after = respect_retry_after
+        self.stats = RetryStats()
+        self._lock = threading.Lock()
+
+    def is_retryable(self, method: str, error: EOSCError) -> bool:
+        """
+        Check whether a failed request may be retried.
+
+        Args:
+            method (str): HTTP method of the request.
+            error (EOSCError): The error raised by the request.
+
+        Returns:
+            bool: True if the method and error are retryable.
+        """
+        if method.upper() not in self.methods:
+            return False
+        if isinstance(error, (EOSCClientError, EOSCServerError)):
+            return error.status_code in self.statuses
+        return isinstance(error, EOSCRequestError)
+
+    def get_delay(self, attempt: int, error: EOSCError) -> float:
+        """
+        Compute the delay before the next attempt.
+
+        Args:
+            attempt (int): Number of attempts made so far.
+            error (EOSCError): The error raised by the last attempt.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        if self.respect_retry_after:
+            retry_after = _retry_after(error)
+            if retry_after is not None:
+                return retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1)))
+
+    def next_delay(self, method: str, error: EOSCError, stats: RetryStats) -> Optional[float]:
+        """
+        Return the delay before retrying a failed call, or None if it should not be retried.
+
+        Args:
+            method (str): HTTP method of the request.
+            error (EOSCError): The error raised by the last attempt.
+            stats (RetryStats): The counters of the current call.
+
+        Returns:
+            Optional[float]: The delay in seconds, or None to give up.
+        """
+        if stats.retries >= self.max_retries or not self.is_retryable(method, error):
+            return None
+        delay = self.get_delay(stats.attempts, error)
+        # A Retry-After beyond max_backoff would outlast any sensible timeout
+        return delay if delay <= self.max_backoff else None
+
+    def record(self, stats: RetryStats) -> None:
+        """
+        Add the counters of a finished call to `stats`.
+
+        Args:
+            stats (RetryStats): The counters of the call.
+        """
+        with self._lock:
+            self.stats.calls += stats.calls
+            self.stats.attempts += stats.attempts
+            self.stats.retries += stats.retries
+            self.stats.backoff += stats.backoff
+
+def _retry_after(error: EOSCError) -> Optional[float]:
+    response = getattr(error, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
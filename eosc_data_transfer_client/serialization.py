@@ -0,0 +1,78 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class JSONBackend:
+    """
+    Encodes request bodies and decodes response bodies.
+
+    The default implementation uses the standard library `json` module. Subclass it
+    and pass an instance as `json_backend` to `EOSCClient` to plug in another library.
+    """
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data (Union[bytes, str]): The encoded document.
+
+        Returns:
+            Any: The decoded value.
+
+        Raises:
+            ValueError: If the document is not valid JSON.
+        """
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encode a value as a compact UTF-8 JSON document.
+
+        Args:
+            value (Any): The value to encode.
+
+        Returns:
+            bytes: The encoded document.
+        """
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+class OrjsonBackend(JSONBackend):
+    """A `JSONBackend` using [orjson](https://github.com/ijl/orjson), which is several times faster."""
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonBackend requires the 'orjson' package")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+def default_backend() -> JSONBackend:
+    """
+    Return the fastest available backend: `OrjsonBackend` if orjson is installed, `JSONBackend` otherwise.
+    """
+    return OrjsonBackend() if orjson is not None else JSONBackend()
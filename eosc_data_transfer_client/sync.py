@@ -0,0 +1,250 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from .client import EOSCClient
+from .endpoints import create_transfer, get_transfer_status, parse_doi
+from .models import StorageContent, StorageElement, TransferParameters, TransferRequest, TransferResponse
+from .pipeline import build_transfer_request
+from .utils import normalize_doi
+
+# (size, checksum) of each synced path
+ManifestState = Dict[str, Tuple[int, str]]
+
+@dataclass
+class SyncDiff:
+    """
+    The difference between the files of a DOI and what was last synced to a destination.
+
+    Attributes:
+        new (List[StorageElement]): Files that were never synced.
+        changed (List[StorageElement]): Files whose size or checksum changed since they were synced.
+        removed (List[str]): Paths that were synced but are no longer part of the DOI.
+        unchanged (int): Number of files that are already up to date.
+    """
+    new: List[StorageElement] = field(default_factory=list)
+    changed: List[StorageElement] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def to_transfer(self) -> List[StorageElement]:
+        """The files to transfer: new ones, then changed ones."""
+        return self.new + self.changed
+
+@dataclass
+class SyncResult:
+    """
+    The outcome of `sync_doi`.
+
+    Attributes:
+        doi (str): The DOI, as given.
+        destination (str): The destination template.
+        content (StorageContent): The current content of the DOI.
+        diff (SyncDiff): The files that changed since the last sync.
+        request (Optional[TransferRequest]): The submitted transfer request, None if nothing changed.
+        response (Optional[TransferResponse]): The response of `create_transfer`, None if nothing changed.
+    """
+    doi: str
+    destination: str
+    content: StorageContent
+    diff: SyncDiff
+    request: Optional[TransferRequest] = None
+    response: Optional[TransferResponse] = None
+
+class SyncManifest:
+    """
+    The files last synced for each DOI and destination, stored in an SQLite file.
+
+    For every (DOI, destination) pair the manifest keeps the path, size and checksum
+    of each synced file, so that `sync_doi` can tell which files changed.
+
+    Example:
+        manifest = SyncManifest("sync-manifest.sqlite")
+        result = sync_doi(client, doi, "s3s://bucket/{record}/{path}", manifest)
+        # ... once the job is done
+        commit_sync(client, manifest, result)
+    """
+    def __init__(self, path: str):
+        """
+        Initializes the SyncManifest.
+
+        Args:
+            path (str): Path of the SQLite file, created if missing. Use ":memory:" for a
+                manifest that does not outlive the process.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS manifest ("
+            "doi TEXT NOT NULL, destination TEXT NOT NULL, path TEXT NOT NULL, size INTEGER, checksum TEXT, "
+            "PRIMARY KEY (doi, destination, path))"
+        )
+        self._db.commit()
+
+    def load(self, doi: str, destination: str) -> ManifestState:
+        """
+        Read what was last synced.
+
+        Args:
+            doi (str): The DOI, in any of its usual spellings.
+            destination (str): The destination template.
+
+        Returns:
+            ManifestState: The size and checksum of each synced path.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT path, size, checksum FROM manifest WHERE doi = ? AND destination = ?",
+                (normalize_doi(doi), destination),
+            ).fetchall()
+        return {path: (size, checksum) for path, size, checksum in rows}
+
+    def save(self, doi: str, destination: str, elements: Iterable[StorageElement]) -> None:
+        """
+        Record the files now synced, replacing what was recorded before.
+
+        Folders and inaccessible elements are ignored.
+
+        Args:
+            doi (str): The DOI, in any of its usual spellings.
+            destination (str): The destination template.
+            elements (Iterable[StorageElement]): All the elements of the DOI now present at the destination.
+        """
+        key = (normalize_doi(doi), destination)
+        rows = [key + (element.path, element.size, element.checksum) for element in _syncable(elements)]
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM manifest WHERE doi = ? AND destination = ?", key)
+            self._db.executemany("INSERT OR REPLACE INTO manifest VALUES (?, ?, ?, ?, ?)", rows)
+
+    def forget(self, doi: str, destination: str) -> None:
+        """
+        Drop what was recorded, so that the next sync transfers every file again.
+
+        Args:
+            doi (str): The DOI, in any of its usual spellings.
+            destination (str): The destination template.
+        """
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM manifest WHERE doi = ? AND destination = ?", (normalize_doi(doi), destination))
+
+    def close(self) -> None:
+        """Close the SQLite file."""
+        with self._lock:
+            self._db.close()
+
+def _syncable(elements: Iterable[StorageElement]) -> List[StorageElement]:
+    # Same selection as `build_transfer_request`
+    return [element for element in elements if not element.isFolder and element.isAccessible]
+
+def diff_storage_content(previous: ManifestState, elements: Iterable[StorageElement]) -> SyncDiff:
+    """
+    Compare the files of a DOI with what was last synced.
+
+    Files are matched by path through a hash index, so the diff runs in linear time.
+    Folders and inaccessible elements are ignored.
+
+    Args:
+        previous (ManifestState): What was last synced, as returned by `SyncManifest.load`.
+        elements (Iterable[StorageElement]): The current elements of the DOI.
+
+    Returns:
+        SyncDiff: The new, changed and removed files.
+    """
+    diff = SyncDiff()
+    seen = set()
+    for element in _syncable(elements):
+        seen.add(element.path)
+        synced = previous.get(element.path)
+        if synced is None:
+            diff.new.append(element)
+        elif synced != (element.size, element.checksum):
+            diff.changed.append(element)
+        else:
+            diff.unchanged += 1
+    diff.removed = [path for path in previous if path not in seen]
+    return diff
+
+def sync_doi(client: EOSCClient, doi: str, destination: str, manifest: SyncManifest,
+             params: Optional[TransferParameters] = None, commit: bool = False) -> SyncResult:
+    """
+    Transfer the files of a DOI that changed since it was last synced to a destination.
+
+    The DOI is parsed, compared with the manifest, and a transfer job is submitted for
+    the new and changed files only. Nothing is submitted if every file is up to date.
+    Files removed from the DOI are reported but not deleted at the destination.
+    When the job includes changed files it is submitted with `overwrite` enabled, since
+    their previous version is already at the destination.
+
+    The manifest is not updated by default: call `commit_sync` once the job finished, so
+    that the files of a failed job are transferred again by the next sync.
+
+    Arguments:
+        client: An instance of `EOSCClient` for making authenticated requests.
+        doi: The DOI to sync.
+        destination: The destination template, see `build_transfer_request`. The manifest
+            is kept per DOI and destination template.
+        manifest: The manifest of previous syncs.
+        params: Parameters of the transfer job.
+        commit: Whether to record the files as synced as soon as the job is submitted,
+            without waiting for it to succeed.
+
+    Returns:
+        SyncResult: The diff and the submitted job, if any.
+
+    Raises:
+        EOSCClientError: For 4xx errors.
+        EOSCServerError: For 5xx errors.
+        EOSCRequestError: For network issues.
+    """
+    content = parse_doi(client, doi)
+    diff = diff_storage_content(manifest.load(doi, destination), content.elements)
+    result = SyncResult(doi, destination, content, diff)
+    if diff.to_transfer:
+        if diff.changed:
+            params = (params or TransferParameters()).model_copy(update={"overwrite": True})
+        changes = content.model_copy(update={"elements": diff.to_transfer, "count": len(diff.to_transfer)})
+        result.request = build_transfer_request(doi, changes, destination, params)
+        result.response = create_transfer(client, result.request)
+    if commit and (diff.to_transfer or diff.removed):
+        manifest.save(doi, destination, content.elements)
+    return result
+
+def commit_sync(client: EOSCClient, manifest: SyncManifest, result: SyncResult) -> bool:
+    """
+    Record the files of a sync in the manifest once its job finished.
+
+    Arguments:
+        client: An instance of `EOSCClient` for making authenticated requests.
+        manifest: The manifest passed to `sync_doi`.
+        result: The result of `sync_doi`.
+
+    Returns:
+        bool: True if the manifest was updated, False if the job is not FINISHED yet
+            (or failed), in which case the files stay pending for the next sync.
+
+    Raises:
+        EOSCClientError: For 4xx errors.
+        EOSCServerError: For 5xx errors.
+        EOSCRequestError: For network issues.
+    """
+    if result.response is not None and get_transfer_status(client, result.response.jobId).jobState != "FINISHED":
+        return False
+    manifest.save(result.doi, result.destination, result.content.elements)
+    return True
@@ -12,3 +12,195 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+
+import codecs
+import json
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+from .exceptions import EOSCClientError, EOSCServerError
+
+def _error_message(response: Any) -> Union[dict, str]:
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
+def raise_for_status(response: Any) -> None:
+    """
+    Map an HTTP error response to the matching EOSC exception.
+
+    Works with both `requests` and `httpx` responses, so the sync and async
+    clients report errors in exactly the same way.
+
+    Args:
+        response: The HTTP response to check.
+
+    Raises:
+        EOSCClientError: For 4xx errors.
+        EOSCServerError: For 5xx errors.
+    """
+    if 400 <= response.status_code < 500:
+        raise EOSCClientError(response.status_code, _error_message(response), response=response)
+    elif 500 <= response.status_code < 600:
+        raise EOSCServerError(response.status_code, _error_message(response), response=response)
+
+def decode_response(response: Any, loads: Optional[Callable[[bytes], Any]] = None) -> Union[dict, str]:
+    """
+    Decode the body of a successful response.
+
+    Args:
+        response: The HTTP response to decode.
+        loads: Function decoding the raw JSON body. Defaults to the HTTP library's `response.json()`.
+
+    Returns:
+        Union[dict, str]: The JSON body, the raw text if the body is not JSON,
+        or an empty dict if there is no body.
+    """
+    if response.content:
+        try:
+            return loads(response.content) if loads is not None else response.json()
+        except ValueError:
+            return response.text
+    else:
+        return {}
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Replace the variable parts of an API path with placeholders.
+
+    For example `/transfer/abc-123/jobState` becomes `/transfer/{id}/{field}`, so
+    requests can be grouped by endpoint rather than by URL.
+
+    Args:
+        endpoint (str): API endpoint path, without the base URL.
+
+    Returns:
+        str: The templated endpoint path.
+    """
+    parts = endpoint.split("?", 1)[0].split("/")
+    if len(parts) >= 3 and parts[1] == "transfer":
+        parts[2] = "{id}"
+        if len(parts) >= 4:
+            parts[3] = "{field}"
+    return "/".join(parts)
+
+_DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "http://dx.doi.org/", "doi:")
+
+def normalize_doi(doi: str) -> str:
+    """
+    Normalize a DOI so equivalent spellings share the same key.
+
+    Resolver prefixes (`doi:`, `https://doi.org/`, ...) are removed and, as DOIs
+    are case-insensitive, the result is lower-cased. Other identifiers are only stripped.
+
+    Args:
+        doi (str): The DOI or other persistent identifier.
+
+    Returns:
+        str: The normalized identifier, e.g. `10.5281/zenodo.10157504`.
+    """
+    value = doi.strip()
+    for prefix in _DOI_PREFIXES:
+        if value.lower().startswith(prefix):
+            value = value[len(prefix):]
+            break
+    return value.lower() if value.startswith("10.") else value
+
+class _JSONStream:
+    """A minimal pull parser over a stream of UTF-8 encoded JSON chunks."""
+
+    _WHITESPACE = " \t\n\r"
+    _DELIMITERS = " \t\n\r,:]}"
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            data = self._text.decode(b"", final=True)
+        else:
+            data = self._text.decode(chunk)
+        # Drop what has been consumed so memory stays bounded by one item
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it, or '' at the end."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in self._WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of `chars`."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Invalid JSON: expected one of {chars!r} but found {char or 'end of input'!r}")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode and consume the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number cut by a chunk boundary decodes but continues in the next chunk
+                if self._eof or (end < len(self._buffer) and self._buffer[end] in self._DELIMITERS):
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Incrementally decode the items of an array stored under `key` in a JSON object.
+
+    Only one item is held in memory at a time, which keeps memory bounded for
+    responses such as `{"count": 100000, "transfers": [...]}`. Other members of
+    the object are decoded and discarded.
+
+    Args:
+        chunks (Iterable[bytes]): The response body, as UTF-8 encoded chunks.
+        key (str): The name of the array member.
+
+    Yields:
+        Any: Each decoded item of the array. Nothing is yielded if `key` is missing.
+
+    Raises:
+        ValueError: If the body is not valid JSON or `key` is not an array.
+    """
+    stream = _JSONStream(chunks)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        name = stream.value()
+        stream.expect(":")
+        if name == key:
+            stream.expect("[")
+            if stream.peek() == "]":
+                stream.expect("]")
+            else:
+                while True:
+                    yield stream.value()
+                    if stream.expect(",]") == "]":
+                        break
+        else:
+            stream.value()
+        if stream.expect(",}") == "}":
+            return
@@ -0,0 +1,303 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+from .client import EOSCClient
+from .endpoints import get_transfer_status
+from .exceptions import EOSCError, EOSCClientError
+from .models import TransferStatus, TERMINAL_JOB_STATES
+from .ratelimit import TokenBucket
+
+WatchResult = Union[TransferStatus, Exception]
+
+# Each watch() creates a new _WatchedJob, and schedule entries and in-flight polls refer
+# to it rather than to the job ID, so the ones left over by unwatch() are recognized as stale
+class _WatchedJob:
+    __slots__ = ("job_id", "interval", "state")
+
+    def __init__(self, job_id: str, interval: float):
+        self.job_id = job_id
+        self.interval = interval
+        self.state = None
+
+class TransferWatcher:
+    """
+    Polls any number of transfer jobs until they reach a terminal state.
+
+    All jobs share one background scheduler thread and a small pool of worker
+    threads. Each job is polled on its own adaptive interval: the interval is
+    reset to `min_interval` whenever the job state changes, grows by `backoff`
+    while it stays the same, and is capped lower for `ACTIVE` jobs, which are
+    the ones closest to completion. A global `max_rate` caps the number of
+    status requests per second across all jobs.
+
+    Jobs are dropped once their `jobState` is terminal (see `TERMINAL_JOB_STATES`),
+    when the API rejects them with a 4xx error other than 429, or when the
+    response cannot be parsed; the error is then recorded as the job result.
+    Server and network errors are retried with backoff.
+
+    Example:
+        with TransferWatcher(client) as watcher:
+            watcher.watch(job_id)
+            for job_id, result in watcher.as_completed():
+                print(job_id, result)
+    """
+    def __init__(self, client: EOSCClient, min_interval: float = 2.0, max_interval: float = 60.0,
+                 active_interval: float = 10.0, backoff: float = 1.5, max_rate: float = 10.0,
+                 max_workers: int = 4, on_complete: Optional[Callable[[str, WatchResult], None]] = None):
+        """
+        Initializes the TransferWatcher.
+
+        Args:
+            client (EOSCClient): The API client used to poll job statuses.
+            min_interval (float, optional): Shortest delay between two polls of the same job, in seconds.
+            max_interval (float, optional): Longest delay between two polls of the same job, in seconds.
+            active_interval (float, optional): Longest delay between two polls of an `ACTIVE` job, in seconds.
+            backoff (float, optional): Factor by which the interval grows while a job state is unchanged.
+            max_rate (float, optional): Maximum number of status requests per second across all jobs.
+            max_workers (int, optional): Maximum number of status requests in flight.
+            on_complete (Callable, optional): Called as `on_complete(job_id, result)` from a worker
+                thread when a job finishes or is dropped.
+        """
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.active_interval = active_interval
+        self.backoff = backoff
+        self.max_workers = max_workers
+        self.on_complete = on_complete
+        self._rate = TokenBucket(max_rate)
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._cond = threading.Condition()
+        self._schedule: List[Tuple[float, int, _WatchedJob]] = []
+        self._seq = itertools.count()
+        self._jobs: Dict[str, _WatchedJob] = {}
+        self._results: Dict[str, WatchResult] = {}
+        self._order: List[str] = []
+        self._executor = None
+        self._thread = None
+        self._stopped = False
+
+    def watch(self, *job_ids: str) -> None:
+        """
+        Start tracking one or more jobs. The first poll happens immediately.
+
+        Jobs that are already tracked or completed are ignored. The scheduler is
+        started on first use.
+
+        Args:
+            *job_ids (str): The IDs of the transfer jobs to track.
+        """
+        now = time.monotonic()
+        with self._cond:
+            for job_id in job_ids:
+                if job_id in self._jobs or job_id in self._results:
+                    continue
+                job = self._jobs[job_id] = _WatchedJob(job_id, self.min_interval)
+                heapq.heappush(self._schedule, (now, next(self._seq), job))
+            self._cond.notify_all()
+        self.start()
+
+    def unwatch(self, job_id: str) -> None:
+        """
+        Stop tracking a job without recording a result.
+
+        Args:
+            job_id (str): The ID of the transfer job.
+        """
+        with self._cond:
+            self._jobs.pop(job_id, None)
+            self._cond.notify_all()
+
+    @property
+    def pending(self) -> List[str]:
+        """The IDs of the jobs that have not reached a terminal state yet."""
+        with self._cond:
+            return list(self._jobs)
+
+    @property
+    def results(self) -> Dict[str, WatchResult]:
+        """The final status (or error) of every completed job."""
+        with self._cond:
+            return dict(self._results)
+
+    def start(self) -> None:
+        """Start the background scheduler, if it is not running already."""
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            self._thread = threading.Thread(target=self._run, name="TransferWatcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background scheduler and wait for in-flight requests to finish."""
+        with self._cond:
+            thread, executor = self._thread, self._executor
+            self._stopped = True
+            self._thread = None
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join()
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> "TransferWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def wait_all(self, timeout: Optional[float] = None) -> Dict[str, WatchResult]:
+        """
+        Block until every tracked job has completed.
+
+        Args:
+            timeout (float, optional): Maximum time to wait, in seconds.
+
+        Returns:
+            Dict[str, Union[TransferStatus, Exception]]: The result of every completed job.
+
+        Raises:
+            TimeoutError: If jobs are still pending after `timeout`.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: not self._jobs, timeout):
+                raise TimeoutError(f"{len(self._jobs)} jobs still pending")
+            return dict(self._results)
+
+    def wait_any(self, timeout: Optional[float] = None) -> Dict[str, WatchResult]:
+        """
+        Block until at least one tracked job has completed.
+
+        Args:
+            timeout (float, optional): Maximum time to wait, in seconds.
+
+        Returns:
+            Dict[str, Union[TransferStatus, Exception]]: The result of every completed job.
+            Empty if no job is being tracked.
+
+        Raises:
+            TimeoutError: If no job has completed after `timeout`.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._results or not self._jobs, timeout):
+                raise TimeoutError("No job completed")
+            return dict(self._results)
+
+    def as_completed(self, timeout: Optional[float] = None) -> Iterator[Tuple[str, WatchResult]]:
+        """
+        Iterate over jobs as they complete.
+
+        Jobs that completed before the call are yielded first. Iteration ends
+        once no tracked job is pending.
+
+        Args:
+            timeout (float, optional): Maximum total time to wait, in seconds.
+
+        Yields:
+            Tuple[str, Union[TransferStatus, Exception]]: The job ID and its final status or error.
+
+        Raises:
+            TimeoutError: If jobs are still pending after `timeout`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        index = 0
+        while True:
+            with self._cond:
+                while index >= len(self._order) and self._jobs:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"{len(self._jobs)} jobs still pending")
+                    self._cond.wait(remaining)
+                if index >= len(self._order):
+                    return
+                job_id = self._order[index]
+                result = self._results[job_id]
+            index += 1
+            yield job_id, result
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    if self._schedule:
+                        delay = self._schedule[0][0] - time.monotonic()
+                        if delay <= 0:
+                            break
+                        self._cond.wait(delay)
+                    else:
+                        self._cond.wait()
+                if self._stopped:
+                    return
+                _, _, job = heapq.heappop(self._schedule)
+                if self._jobs.get(job.job_id) is not job:
+                    continue
+            self._slots.acquire()
+            self._rate.acquire()
+            self._executor.submit(self._poll, job)
+
+    def _poll(self, job: _WatchedJob) -> None:
+        try:
+            try:
+                result = get_transfer_status(self.client, job.job_id)
+            except Exception as e:
+                result = e
+            self._update(job, result)
+        finally:
+            self._slots.release()
+
+    def _update(self, job: _WatchedJob, result: WatchResult) -> None:
+        job_id = job.job_id
+        with self._cond:
+            if self._jobs.get(job_id) is not job:
+                return
+            if isinstance(result, TransferStatus):
+                done = result.jobState in TERMINAL_JOB_STATES
+                if not done:
+                    job.interval = self._next_interval(job, result.jobState)
+                    job.state = result.jobState
+            else:
+                # Unknown or forbidden jobs and invalid responses will never succeed,
+                # transient API and network errors are retried
+                if isinstance(result, EOSCClientError):
+                    done = result.status_code != 429
+                else:
+                    done = not isinstance(result, EOSCError)
+                job.interval = min(job.interval * self.backoff, self.max_interval)
+            if done:
+                del self._jobs[job_id]
+                self._results[job_id] = result
+                self._order.append(job_id)
+            else:
+                # Jitter keeps jobs submitted together from being polled in lockstep
+                due = time.monotonic() + job.interval * random.uniform(0.9, 1.1)
+                heapq.heappush(self._schedule, (due, next(self._seq), job))
+            self._cond.notify_all()
+        if done and self.on_complete is not None:
+            self.on_complete(job_id, result)
+
+    def _next_interval(self, job: _WatchedJob, state: str) -> float:
+        if state != job.state:
+            return self.min_interval
+        cap = min(self.active_interval, self.max_interval) if state == "ACTIVE" else self.max_interval
+        return min(job.interval * self.backoff, cap)
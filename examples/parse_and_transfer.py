@@ -14,11 +14,11 @@
 
 import os
 import sys
-import time
 from eosc_data_transfer_client.client import EOSCClient
 from eosc_data_transfer_client.models import TransferRequest, FileTransfer, TransferParameters
 from eosc_data_transfer_client.endpoints import * 
 from eosc_data_transfer_client.exceptions import EOSCError
+from eosc_data_transfer_client.watcher import TransferWatcher
 
 """
     This simple script demonstrates how the EOSC Data Transfer API can be used to transfer
@@ -80,13 +80,13 @@ try:
     response = create_transfer(client, request)
     print(f"Job submitted:\n\tjobId={response.jobId}")
 
-    # Wait before querying the status
-    time.sleep(20)  # Sleep for 5 seconds
-
-    # Query the status of the transfer
-    status = get_transfer_status(client, response.jobId)
+    # Poll the status of the transfer until it reaches a terminal state
+    with TransferWatcher(client) as watcher:
+        watcher.watch(response.jobId)
+        status = watcher.wait_all()[response.jobId]
+    if isinstance(status, Exception):
+        raise status
     print(f"Job status:\n\t{status.model_dump()}")
-    # Final solution should poll the status of the transfers until it reaches a terminal state
 except EOSCError as e:
     print(f"[ERROR] {e}\n")
     sys.exit()
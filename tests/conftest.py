@@ -0,0 +1,44 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import pytest
+
+def _make_status(job_id, state="ACTIVE", **fields):
+    status = {
+        "kind": "transfer",
+        "jobId": job_id,
+        "jobState": state,
+        "source_se": "src",
+        "destination_se": "dst",
+        "verifyChecksum": "true",
+        "overwrite": True,
+        "priority": 1,
+        "retry": 0,
+        "retryDelay": 0,
+        "cancel": False,
+        "submittedAt": "2023-01-01T00:00:00",
+        "submittedTo": "host",
+        "reason": "",
+        "vo_name": "my-vo",
+        "user_dn": "dn",
+        "cred_id": "cred"
+    }
+    status.update(fields)
+    return status
+
+# Builds the JSON body of a transfer job status; keyword arguments override its fields
+@pytest.fixture
+def make_status():
+    return _make_status
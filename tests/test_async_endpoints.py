@@ -0,0 +1,119 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import asyncio
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from eosc_data_transfer_client.async_client import AsyncEOSCClient
+from eosc_data_transfer_client.async_endpoints import (
+    create_transfer,
+    get_transfer_status,
+    get_transfer_field,
+)
+from eosc_data_transfer_client.models import (
+    TransferRequest,
+    FileTransfer,
+    TransferParameters,
+)
+from eosc_data_transfer_client.retry import RetryPolicy
+from eosc_data_transfer_client.exceptions import EOSCClientError, EOSCServerError, EOSCRequestError
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+
+def make_client(handler):
+    return AsyncEOSCClient(BASE_URL, token=TOKEN, transport=httpx.MockTransport(handler))
+
+# Creates a valid transfer request and sends the auth header
+def test_async_create_transfer_success():
+    def handler(request):
+        assert request.headers["Authorization"] == f"Bearer {TOKEN}"
+        assert request.url.path == "/transfers"
+        return httpx.Response(200, json={"kind": "tranferStatus", "jobId": "abc-123"})
+
+    async def run():
+        async with make_client(handler) as client:
+            params = TransferParameters(verifyChecksum=False, overwrite=False)
+            transfer = FileTransfer(sources=["mock://source"], destinations=["mock://destination"],
+                                    checksum="ADLER32:deadbeef", filesize=42)
+            return await create_transfer(client, TransferRequest(files=[transfer], params=params))
+
+    assert asyncio.run(run()).jobId == "abc-123"
+
+# Many status queries share one client concurrently
+def test_async_get_transfer_status_concurrent(make_status):
+    def handler(request):
+        return httpx.Response(200, json=make_status(request.url.path.rsplit("/", 1)[-1]))
+
+    async def run():
+        async with make_client(handler) as client:
+            return await asyncio.gather(*(get_transfer_status(client, f"job-{i}") for i in range(200)))
+
+    statuses = asyncio.run(run())
+    assert [s.jobId for s in statuses] == [f"job-{i}" for i in range(200)]
+
+# Field parsing to int
+def test_async_get_transfer_field_parses_int():
+    def handler(request):
+        return httpx.Response(200, json={"entity": 42})
+
+    async def run():
+        async with make_client(handler) as client:
+            return await get_transfer_field(client, "job-abc", "priority")
+
+    assert asyncio.run(run()) == 42
+
+# 4xx, 5xx and network failures map to the same exceptions as the sync client
+@pytest.mark.parametrize("status_code, exception", [(404, EOSCClientError), (500, EOSCServerError)])
+def test_async_error_mapping(status_code, exception):
+    def handler(request):
+        return httpx.Response(status_code, json={"error": "boom"})
+
+    async def run():
+        async with make_client(handler) as client:
+            await get_transfer_status(client, "job-123")
+
+    with pytest.raises(exception) as e:
+        asyncio.run(run())
+    assert e.value.status_code == status_code
+
+def test_async_network_error():
+    def handler(request):
+        raise httpx.ConnectError("connection refused")
+
+    async def run():
+        async with make_client(handler) as client:
+            await get_transfer_status(client, "job-123")
+
+    with pytest.raises(EOSCRequestError):
+        asyncio.run(run())
+
+# Retries use the same policy as the sync client
+def test_async_retry():
+    responses = iter([httpx.Response(503, json={"error": "Unavailable"}), httpx.Response(200, json={"entity": 7})])
+
+    def handler(request):
+        return next(responses)
+
+    async def run():
+        async with AsyncEOSCClient(BASE_URL, token=TOKEN, retry=RetryPolicy(backoff_factor=0),
+                                   transport=httpx.MockTransport(handler)) as client:
+            return await get_transfer_field(client, "job-abc", "priority"), client.last_retry_stats
+
+    value, stats = asyncio.run(run())
+    assert value == 7
+    assert stats.retries == 1
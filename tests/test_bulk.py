@@ -0,0 +1,261 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import re
+import threading
+import time
+import pytest
+import requests_mock
+from datetime import datetime
+from pydantic import ValidationError
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.bulk import get_transfer_statuses, get_transfer_fields, split_transfer_request, create_transfer_chunked, expand_folders
+from eosc_data_transfer_client.models import TransferStatus, TransferRequest, FileTransfer, TransferParameters, StorageElement, StorageContent
+from eosc_data_transfer_client.exceptions import EOSCClientError, EOSCServerError
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+
+def make_client():
+    return EOSCClient(BASE_URL, token=TOKEN)
+
+@pytest.fixture
+def status_callback(make_status):
+    def callback(request, context):
+        job_id = request.path.rsplit("/", 1)[-1]
+        if job_id == "job-bad":
+            context.status_code = 404
+            return {"error": "Not found"}
+        return make_status(job_id)
+    return callback
+
+# Fetches every job from a lazy iterable, isolating failures per job
+def test_get_transfer_statuses_isolates_errors(status_callback):
+    client = make_client()
+    job_ids = (f"job-{i}" for i in list(range(50)) + ["bad"])
+
+    with requests_mock.Mocker() as m:
+        m.get(re.compile(f"{BASE_URL}/transfer/.*"), json=status_callback)
+        results = dict(get_transfer_statuses(client, job_ids, max_workers=4))
+
+    assert len(results) == 51
+    assert isinstance(results["job-bad"], EOSCClientError)
+    assert all(isinstance(results[f"job-{i}"], TransferStatus) for i in range(50))
+    assert results["job-7"].jobId == "job-7"
+
+# Malformed statuses are reported per job instead of aborting the batch
+def test_get_transfer_statuses_isolates_invalid_payloads(make_status):
+    client = make_client()
+
+    def callback(request, context):
+        job_id = request.path.rsplit("/", 1)[-1]
+        return {"jobId": job_id} if job_id.startswith("job-invalid") else make_status(job_id)
+
+    with requests_mock.Mocker() as m:
+        m.get(re.compile(f"{BASE_URL}/transfer/.*"), json=callback)
+        results = dict(get_transfer_statuses(client, ["job-0", "job-invalid-1", "job-invalid-2", "job-1"]))
+
+    assert isinstance(results["job-invalid-1"], ValidationError)
+    assert isinstance(results["job-invalid-2"], ValidationError)
+    assert results["job-1"].jobId == "job-1"
+
+# Stopping early does not fetch the whole input
+def test_get_transfer_statuses_stops_early(status_callback):
+    client = make_client()
+    job_ids = (f"job-{i}" for i in range(1000))
+
+    with requests_mock.Mocker() as m:
+        m.get(re.compile(f"{BASE_URL}/transfer/.*"), json=status_callback)
+        results = get_transfer_statuses(client, job_ids, max_workers=2)
+        next(results)
+        results.close()
+        assert m.call_count <= 6
+
+# A single field is read with per-field requests, converted to its declared type
+def test_get_transfer_fields_per_field():
+    client = make_client()
+
+    def field_callback(request, context):
+        job_id = request.path.split("/")[-2]
+        return {"entity": None if job_id == "job-1" else "2023-01-01T00:01:00"}
+
+    with requests_mock.Mocker() as m:
+        m.get(re.compile(f"{BASE_URL}/transfer/.*/finishedAt"), json=field_callback)
+        results = dict(get_transfer_fields(client, ["job-0", "job-1"], ["finishedAt"]))
+        assert m.call_count == 2
+
+    assert results == {"job-0": {"finishedAt": datetime(2023, 1, 1, 0, 1)}, "job-1": {"finishedAt": None}}
+
+# Several fields are read from one full status request per job
+def test_get_transfer_fields_full_status(status_callback):
+    client = make_client()
+
+    with requests_mock.Mocker() as m:
+        m.get(re.compile(f"{BASE_URL}/transfer/.*"), json=status_callback)
+        results = dict(get_transfer_fields(client, ["job-0", "job-bad"], ["jobState", "priority", "finishedAt"]))
+        assert m.call_count == 2
+
+    assert results["job-0"] == {"jobState": "ACTIVE", "priority": 1, "finishedAt": None}
+    assert isinstance(results["job-bad"], EOSCClientError)
+
+# A non-JSON body for one job is reported for that job only
+def test_get_transfer_fields_non_json_body():
+    client = make_client()
+
+    def field_callback(request, context):
+        if request.path.split("/")[-2] == "job-1":
+            context.headers["Content-Type"] = "text/html"
+            return "<html>Proxy error</html>"
+        return '{"entity": "ACTIVE"}'
+
+    with requests_mock.Mocker() as m:
+        m.get(re.compile(f"{BASE_URL}/transfer/.*/jobState"), text=field_callback)
+        results = dict(get_transfer_fields(client, ["job-0", "job-1", "job-2"], ["jobState"]))
+
+    assert results["job-0"] == results["job-2"] == {"jobState": "ACTIVE"}
+    assert isinstance(results["job-1"], AttributeError)
+
+# Unknown fields are rejected before any request
+def test_get_transfer_fields_invalid_field():
+    with pytest.raises(ValueError, match="Unsupported field name"):
+        get_transfer_fields(make_client(), ["job-0"], ["jobState", "nonexistentField"])
+
+def make_request(sizes):
+    files = [
+        FileTransfer(sources=[f"mock://source/{i}"], destinations=[f"mock://destination/{i}"],
+                     checksum="ADLER32:deadbeef", filesize=size)
+        for i, size in enumerate(sizes)
+    ]
+    return TransferRequest(files=files, params=TransferParameters(priority=5))
+
+# Files are split by count and by total size, keeping order and parameters
+def test_split_transfer_request():
+    request = make_request([10, 10, 10, 50, 200, 10])
+    by_count = split_transfer_request(request, max_files=4)
+    assert [len(chunk.files) for chunk in by_count] == [4, 2]
+    by_size = split_transfer_request(request, max_bytes=60)
+    assert [[f.filesize for f in chunk.files] for chunk in by_size] == [[10, 10, 10], [50], [200], [10]]
+    assert all(chunk.params.priority == 5 for chunk in by_size)
+
+# Chunks are submitted concurrently and failures are reported per chunk
+def test_create_transfer_chunked_partial_failure():
+    client = make_client()
+    request = make_request([1] * 10)
+
+    def submit_callback(request, context):
+        first = request.json()["files"][0]["sources"][0]
+        if first == "mock://source/4":
+            context.status_code = 500
+            return {"error": "Internal Server Error"}
+        return {"kind": "transferStatus", "jobId": f"job-{first.rsplit('/', 1)[-1]}"}
+
+    with requests_mock.Mocker() as m:
+        m.post(f"{BASE_URL}/transfers", json=submit_callback)
+        result = create_transfer_chunked(client, request, max_files=2)
+
+    assert m.call_count == 5
+    assert result.job_ids == {0: "job-0", 1: "job-2", 3: "job-6", 4: "job-8"}
+    assert [chunk.index for chunk in result.failed] == [2]
+    assert isinstance(result.failed[0].error, EOSCServerError)
+    assert not result.ok
+
+# A malformed response fails its chunk only, keeping the jobs already accepted
+def test_create_transfer_chunked_invalid_response():
+    client = make_client()
+    request = make_request([1] * 6)
+
+    def submit_callback(request, context):
+        first = request.json()["files"][0]["sources"][0]
+        if first == "mock://source/2":
+            return {"kind": "transferStatus"}
+        return {"kind": "transferStatus", "jobId": f"job-{first.rsplit('/', 1)[-1]}"}
+
+    with requests_mock.Mocker() as m:
+        m.post(f"{BASE_URL}/transfers", json=submit_callback)
+        result = create_transfer_chunked(client, request, max_files=2)
+
+    assert result.job_ids == {0: "job-0", 2: "job-4"}
+    assert isinstance(result.failed[0].error, ValidationError)
+
+def make_element(path, folder=False):
+    return {
+        "kind": "StorageElement", "name": path.rsplit("/", 1)[-1], "path": path, "isFolder": folder,
+        "isAccessible": True, "size": 0 if folder else 10, "mediaType": "" if folder else "text/plain",
+        "accessUrl": f"https://storage/{path.lstrip('/')}", "downloadUrl": f"https://storage/{path.lstrip('/')}",
+        "checksum": ""
+    }
+
+# /a/{1.txt, b/{2.txt, c/{3.txt}, link -> /a/b}}, and /x failing to list
+TREE = {
+    "https://storage/a": [make_element("/a/1.txt"), make_element("/a/b", folder=True)],
+    "https://storage/a/b": [make_element("/a/b/2.txt"), make_element("/a/b/c", folder=True), make_element("/a/b", folder=True)],
+    "https://storage/a/b/c": [make_element("/a/b/c/3.txt")],
+}
+
+def folder_callback(request, context):
+    children = TREE.get(request.qs["seurl"][0])
+    if children is None:
+        context.status_code = 404
+        return {"error": "Not found"}
+    return {"kind": "StorageContent", "count": len(children), "elements": children}
+
+# Folders are listed recursively, each element visited once
+def test_expand_folders():
+    roots = [StorageElement(**make_element("/a", folder=True)), StorageElement(**make_element("/top.txt"))]
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/storage/folder/list", json=folder_callback)
+        files = list(expand_folders(make_client(), roots, max_in_flight=2))
+        shallow = list(expand_folders(make_client(), roots, max_depth=2))
+
+    assert sorted(e.path for e in files) == ["/a/1.txt", "/a/b/2.txt", "/a/b/c/3.txt", "/top.txt"]
+    # /a/b/c is at depth 2 and is not listed
+    assert sorted((e.path, e.isFolder) for e in shallow) == [
+        ("/a/1.txt", False), ("/a/b/2.txt", False), ("/a/b/c", True), ("/top.txt", False)]
+
+# Listing errors are raised, or reported per folder with on_error
+def test_expand_folders_errors():
+    roots = [StorageElement(**make_element("/x", folder=True)), StorageElement(**make_element("/a", folder=True))]
+    failed = []
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/storage/folder/list", json=folder_callback)
+        files = list(expand_folders(make_client(), roots, on_error=lambda folder, e: failed.append((folder.path, e))))
+        with pytest.raises(EOSCClientError):
+            list(expand_folders(make_client(), roots))
+
+    assert len(files) == 3
+    assert [path for path, _ in failed] == ["/x"]
+    assert isinstance(failed[0][1], EOSCClientError)
+
+# A custom lister is called for each folder, with at most max_in_flight running at once
+def test_expand_folders_custom_lister():
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    def lister(folder):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        children = [make_element(f"{folder.path}/{i}.txt") for i in range(3)]
+        return StorageContent(kind="StorageContent", count=3, elements=children)
+
+    roots = (StorageElement(**make_element(f"/f{i}", folder=True)) for i in range(20))
+    files = list(expand_folders(make_client(), roots, max_in_flight=3, lister=lister))
+
+    assert len(files) == 60
+    assert peak[0] <= 3
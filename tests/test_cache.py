@@ -0,0 +1,155 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import re
+import pytest
+import requests_mock
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.endpoints import parse_doi, get_transfer_status, cancel_transfer, list_transfers
+from eosc_data_transfer_client.cache import DOICache, StatusCache
+from eosc_data_transfer_client.utils import normalize_doi
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+PARSER_URL = f"{BASE_URL}/parser"
+
+def make_content(count=2):
+    return {
+        "kind": "StorageContent",
+        "count": count,
+        "elements": [
+            {
+                "kind": "StorageElement",
+                "name": f"file-{i}.txt",
+                "path": f"/file-{i}.txt",
+                "isFolder": False,
+                "isAccessible": True,
+                "size": 100 + i,
+                "mediaType": "text/plain",
+                "accessUrl": f"https://zenodo.org/records/1/files/file-{i}.txt",
+                "downloadUrl": f"https://zenodo.org/records/1/files/file-{i}.txt?download=1",
+                "checksum": f"md5:{i:032x}"
+            }
+            for i in range(count)
+        ]
+    }
+
+# Different spellings of the same DOI share one key
+def test_normalize_doi():
+    assert normalize_doi("doi:10.5281/Zenodo.10157504") == "10.5281/zenodo.10157504"
+    assert normalize_doi(" https://doi.org/10.5281/zenodo.10157504 ") == "10.5281/zenodo.10157504"
+    assert normalize_doi("https://example.org/Data") == "https://example.org/Data"
+
+# Fresh entries are served from memory
+def test_parse_doi_cache_hit():
+    cache = DOICache(ttl=60)
+    client = EOSCClient(BASE_URL, token=TOKEN, doi_cache=cache)
+    with requests_mock.Mocker() as m:
+        m.get(PARSER_URL, json=make_content())
+        first = parse_doi(client, "doi:10.5281/zenodo.1")
+        second = parse_doi(client, "https://doi.org/10.5281/ZENODO.1")
+        assert m.call_count == 1
+    assert second is first
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+# Expired entries are revalidated with the ETag
+def test_parse_doi_cache_revalidation():
+    cache = DOICache(ttl=0)
+    client = EOSCClient(BASE_URL, token=TOKEN, doi_cache=cache)
+    with requests_mock.Mocker() as m:
+        m.get(PARSER_URL, [
+            {"json": make_content(), "headers": {"ETag": '"v1"'}},
+            {"status_code": 304},
+        ])
+        first = parse_doi(client, "10.5281/zenodo.1")
+        second = parse_doi(client, "10.5281/zenodo.1")
+        assert m.last_request.headers["If-None-Match"] == '"v1"'
+    assert second is first
+    assert (cache.stats.stale, cache.stats.revalidations) == (1, 1)
+
+# Entries survive a restart through the on-disk store
+def test_doi_cache_persistence(tmp_path):
+    path = str(tmp_path / "doi-cache.sqlite")
+    with requests_mock.Mocker() as m:
+        m.get(PARSER_URL, json=make_content(3))
+        parse_doi(EOSCClient(BASE_URL, token=TOKEN, doi_cache=DOICache(path=path)), "10.5281/zenodo.1")
+
+        cache = DOICache(path=path)
+        content = parse_doi(EOSCClient(BASE_URL, token=TOKEN, doi_cache=cache), "10.5281/zenodo.1")
+        assert m.call_count == 1
+    assert content.count == 3
+    assert content.elements[2].name == "file-2.txt"
+    assert cache.stats.hits == 1
+
+# The least recently used entry is evicted first
+def test_doi_cache_lru_eviction():
+    cache = DOICache(max_size=2)
+    client = EOSCClient(BASE_URL, token=TOKEN, doi_cache=cache)
+    with requests_mock.Mocker() as m:
+        m.get(PARSER_URL, json=make_content())
+        parse_doi(client, "10.1/a")
+        parse_doi(client, "10.1/b")
+        parse_doi(client, "10.1/a")
+        parse_doi(client, "10.1/c")
+    assert cache.stats.evictions == 1
+    assert cache.get("10.1/a") is not None
+    assert cache.get("10.1/b") is None
+
+@pytest.fixture
+def status_callback(make_status):
+    def callback(request, context):
+        job_id = request.path.rsplit("/", 1)[-1]
+        return make_status(job_id, "FINISHED" if job_id.startswith("done") else "ACTIVE")
+    return callback
+
+# Terminal jobs are cached forever, active jobs only for the TTL
+def test_status_cache_terminal_and_active(status_callback):
+    cache = StatusCache(active_ttl=0)
+    client = EOSCClient(BASE_URL, token=TOKEN, status_cache=cache)
+    with requests_mock.Mocker() as m:
+        m.get(re.compile(f"{BASE_URL}/transfer/.*"), json=status_callback)
+        for _ in range(3):
+            get_transfer_status(client, "done-1")
+            get_transfer_status(client, "active-1")
+        assert m.call_count == 4
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.stale) == (2, 2, 2)
+
+# Cancel and list responses refresh the cache
+def test_status_cache_updated_by_cancel_and_list(make_status):
+    cache = StatusCache(active_ttl=60)
+    client = EOSCClient(BASE_URL, token=TOKEN, status_cache=cache)
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/transfers", json={"kind": "transfer-list", "count": 2,
+                                              "transfers": [make_status("job-1", "ACTIVE"), make_status("job-2", "ACTIVE")]})
+        m.delete(f"{BASE_URL}/transfer/job-1", json=make_status("job-1", "CANCELED"))
+        list_transfers(client)
+        cancel_transfer(client, "job-1")
+        assert get_transfer_status(client, "job-1").jobState == "CANCELED"
+        assert get_transfer_status(client, "job-2").jobState == "ACTIVE"
+        assert m.call_count == 2
+    assert cache.stats.hit_rate == 1.0
+
+# The cache is bounded
+def test_status_cache_lru_bound(status_callback):
+    cache = StatusCache(max_size=2)
+    client = EOSCClient(BASE_URL, token=TOKEN, status_cache=cache)
+    with requests_mock.Mocker() as m:
+        m.get(re.compile(f"{BASE_URL}/transfer/.*"), json=status_callback)
+        for job_id in ("done-1", "done-2", "done-3"):
+            get_transfer_status(client, job_id)
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    assert cache.get("done-1") is None
@@ -0,0 +1,187 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import asyncio
+import threading
+import time
+import pytest
+import requests
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.endpoints import get_transfer_field
+from eosc_data_transfer_client.coalesce import RequestCoalescer
+from eosc_data_transfer_client.exceptions import EOSCServerError
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+
+def wait_for_requests(coalescer, count):
+    deadline = time.monotonic() + 5
+    while coalescer.stats.requests < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+def run_threads(client, coalescer, job_ids, release):
+    results = {}
+
+    def call(i, job_id):
+        try:
+            results[i] = get_transfer_field(client, job_id, "priority")
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i, job_id)) for i, job_id in enumerate(job_ids)]
+    for thread in threads:
+        thread.start()
+    wait_for_requests(coalescer, len(job_ids))
+    release.set()
+    for thread in threads:
+        thread.join()
+    return results
+
+# Identical concurrent GETs from threads share one request
+def test_coalesce_threads():
+    coalescer = RequestCoalescer()
+    client = EOSCClient(BASE_URL, token=TOKEN, coalescer=coalescer)
+    release = threading.Event()
+    urls = []
+
+    def send(method, url, **kwargs):
+        urls.append(url)
+        release.wait()
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"entity": 3}'
+        return response
+
+    # requests_mock serializes calls, so stub the session to observe real concurrency
+    client.session.request = send
+    results = run_threads(client, coalescer, ["job-1"] * 5 + ["job-2"] * 3, release)
+
+    assert sorted(urls) == [f"{BASE_URL}/transfer/job-1/priority", f"{BASE_URL}/transfer/job-2/priority"]
+    assert list(results.values()) == [3] * 8
+    assert coalescer.stats.requests == 8
+    assert coalescer.stats.saved == 6
+
+# Errors of the shared request are raised in every caller
+def test_coalesce_threads_error():
+    coalescer = RequestCoalescer()
+    client = EOSCClient(BASE_URL, token=TOKEN, coalescer=coalescer)
+    release = threading.Event()
+
+    def send(method, url, **kwargs):
+        release.wait()
+        response = requests.Response()
+        response.status_code = 503
+        response._content = b'{"message": "down"}'
+        return response
+
+    client.session.request = send
+    results = run_threads(client, coalescer, ["job-1"] * 4, release)
+
+    assert all(isinstance(result, EOSCServerError) for result in results.values())
+    assert coalescer.stats.saved == 3
+
+# Only plain GETs are coalesced
+def test_coalesce_key():
+    assert RequestCoalescer.key("GET", "/transfers", {"params": {"b": 1, "a": 2}}) == \
+        RequestCoalescer.key("get", "/transfers", {"params": {"a": 2, "b": 1}})
+    assert RequestCoalescer.key("GET", "/transfers", {}) != RequestCoalescer.key("GET", "/transfers", {"params": {"a": 1}})
+    assert RequestCoalescer.key("POST", "/transfers", {}) is None
+    assert RequestCoalescer.key("GET", "/transfers", {"stream": True}) is None
+    assert RequestCoalescer.key("GET", "/parser", {"params": {"doi": "x"}, "headers": {"If-None-Match": "e"}}) is None
+    assert RequestCoalescer.key("GET", "/user/info", {}, ("url", "Bearer a")) != \
+        RequestCoalescer.key("GET", "/user/info", {}, ("url", "Bearer b"))
+
+# Identical concurrent GETs from tasks share one request
+def test_coalesce_async():
+    httpx = pytest.importorskip("httpx")
+    from eosc_data_transfer_client.async_client import AsyncEOSCClient
+    from eosc_data_transfer_client import async_endpoints
+
+    coalescer = RequestCoalescer()
+    calls = []
+
+    async def handler(request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"entity": 5})
+
+    async def main():
+        async with AsyncEOSCClient(BASE_URL, token=TOKEN, coalescer=coalescer,
+                                   transport=httpx.MockTransport(handler)) as client:
+            return await asyncio.gather(*[async_endpoints.get_transfer_field(client, "job-1", "priority") for _ in range(6)])
+
+    assert asyncio.run(main()) == [5] * 6
+    assert len(calls) == 1
+    assert coalescer.stats.saved == 5
+
+    # Requests made after the shared one completed are sent again
+    asyncio.run(main())
+    assert len(calls) == 2
+
+# Clients with different credentials never share a response
+def test_coalesce_async_per_client():
+    httpx = pytest.importorskip("httpx")
+    from eosc_data_transfer_client.async_client import AsyncEOSCClient
+    from eosc_data_transfer_client import async_endpoints
+
+    coalescer = RequestCoalescer()
+    tokens = []
+
+    async def handler(request):
+        tokens.append(request.headers["Authorization"])
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"entity": len(request.headers["Authorization"])})
+
+    async def main():
+        async with AsyncEOSCClient(BASE_URL, token="a", coalescer=coalescer, transport=httpx.MockTransport(handler)) as a, \
+                AsyncEOSCClient(BASE_URL, token="bb", coalescer=coalescer, transport=httpx.MockTransport(handler)) as b:
+            return await asyncio.gather(async_endpoints.get_transfer_field(a, "job-1", "priority"),
+                                        async_endpoints.get_transfer_field(b, "job-1", "priority"))
+
+    assert asyncio.run(main()) == [len("Bearer a"), len("Bearer bb")]
+    assert sorted(tokens) == ["Bearer a", "Bearer bb"]
+    assert coalescer.stats.saved == 0
+
+# Cancelling the task that sends the request does not cancel the tasks waiting for it
+def test_coalesce_async_leader_cancelled():
+    httpx = pytest.importorskip("httpx")
+    from eosc_data_transfer_client.async_client import AsyncEOSCClient
+    from eosc_data_transfer_client import async_endpoints
+
+    coalescer = RequestCoalescer()
+    calls = []
+
+    async def handler(request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"entity": 5})
+
+    async def main():
+        async with AsyncEOSCClient(BASE_URL, token=TOKEN, coalescer=coalescer,
+                                   transport=httpx.MockTransport(handler)) as client:
+            leader = asyncio.create_task(async_endpoints.get_transfer_field(client, "job-1", "priority"))
+            await asyncio.sleep(0.01)
+            followers = [asyncio.create_task(async_endpoints.get_transfer_field(client, "job-1", "priority"))
+                         for _ in range(3)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await asyncio.gather(*followers)
+
+    assert asyncio.run(main()) == [5] * 3
+    assert len(calls) == 2
+    assert coalescer.stats.saved == 2
@@ -0,0 +1,117 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import pytest
+import requests_mock
+from datetime import datetime, timezone
+
+np = pytest.importorskip("numpy")
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.columnar import MISSING_TIME, to_columns
+from eosc_data_transfer_client.endpoints import iter_transfers
+from eosc_data_transfer_client.models import TransferStatus, TransferStatusList
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+
+def make_job(make_status, i, state, source="src-a", vo="vo-1", queued=None):
+    return make_status(
+        f"job-{i}", state, source_se=source, destination_se=None, priority=i % 5, cancel=state == "CANCELED",
+        submittedAt="2025-01-01T00:00:00", finishedAt=f"2025-01-01T00:{queued:02d}:00" if queued is not None else None,
+        vo_name=vo
+    )
+
+@pytest.fixture
+def statuses(make_status):
+    return [
+        make_job(make_status, 0, "FINISHED", queued=1),
+        make_job(make_status, 1, "FAILED", queued=2),
+        make_job(make_status, 2, "FINISHED", source="src-b", vo="vo-2", queued=10),
+        make_job(make_status, 3, "ACTIVE", source="src-b"),
+        make_job(make_status, 4, "CANCELED", vo="vo-2", queued=5),
+        make_job(make_status, 5, "FAILED", source="src-b", queued=3),
+    ]
+
+@pytest.fixture
+def listing(statuses):
+    return TransferStatusList(kind="transfer-list", count=len(statuses), transfers=[TransferStatus(**s) for s in statuses])
+
+# Statuses become typed, dictionary-encoded and int64 time columns
+def test_to_columns(listing):
+    columns = to_columns(listing)
+
+    assert len(columns) == 6
+    assert list(columns["jobId"]) == [f"job-{i}" for i in range(6)]
+    assert columns["jobState"].categories == ["FINISHED", "FAILED", "ACTIVE", "CANCELED"]
+    assert columns["jobState"].codes.dtype == np.int32
+    assert list(columns["source_se"].values()) == ["src-a", "src-a", "src-b", "src-b", "src-a", "src-b"]
+    assert columns["destination_se"].categories == [""]
+    assert columns["priority"].tolist() == [0, 1, 2, 3, 4, 0]
+    assert columns["cancel"].tolist() == [False, False, False, False, True, False]
+    submitted = columns["submittedAt"]
+    assert submitted.dtype == np.int64
+    assert submitted[0] == int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()) * 1000000
+    assert columns["finishedAt"][3] == MISSING_TIME
+    assert np.isnat(columns.times("finishedAt")[3])
+
+# Aware datetimes are converted to UTC
+def test_to_columns_aware_datetimes(make_status):
+    status = TransferStatus(**dict(make_job(make_status, 0, "FINISHED", queued=1), submittedAt="2025-01-01T01:00:00+01:00"))
+    columns = to_columns([status])
+    assert columns["submittedAt"][0] == int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()) * 1000000
+
+# Queue time statistics, overall and per group
+def test_queue_time_stats(listing):
+    columns = to_columns(listing)
+
+    assert np.isnan(columns.queue_time()[3])
+    stats = columns.queue_time_stats()
+    assert stats["count"] == 5
+    assert stats["min"] == 60 and stats["max"] == 600
+    assert stats["p50"] == 180
+    by_vo = columns.queue_time_stats(by="vo_name", percentiles=[50])
+    assert by_vo["vo-1"] == {"count": 3, "mean": 120.0, "min": 60.0, "max": 180.0, "p50": 120.0}
+    assert by_vo["vo-2"]["count"] == 2
+    assert columns.counts(by="vo_name") == {"vo-1": 4, "vo-2": 2}
+
+# Failure rates only count ended jobs
+def test_failure_rates(listing):
+    rates = to_columns(listing).failure_rates(by="source_se")
+    assert rates == {
+        "src-a": {"failed": 1, "succeeded": 1, "failure_rate": 0.5},
+        "src-b": {"failed": 1, "succeeded": 1, "failure_rate": 0.5},
+    }
+    assert to_columns(listing).failure_rates(by="vo_name")["vo-2"]["failure_rate"] == 0.0
+
+# Streamed listings are converted in a single pass
+def test_to_columns_from_stream(statuses):
+    client = EOSCClient(BASE_URL, token=TOKEN)
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/transfers", json={"kind": "transfer-list", "count": len(statuses), "transfers": statuses})
+        columns = to_columns(iter_transfers(client))
+    assert len(columns) == 6
+    assert columns.counts(by="jobState") == {"FINISHED": 2, "FAILED": 2, "ACTIVE": 1, "CANCELED": 1}
+
+# Columns convert to an Arrow table with dictionary and timestamp columns
+def test_to_arrow(listing):
+    pa = pytest.importorskip("pyarrow")
+    table = to_columns(listing).to_arrow()
+
+    assert table.num_rows == 6
+    assert pa.types.is_dictionary(table.schema.field("jobState").type)
+    assert table.schema.field("submittedAt").type == pa.timestamp("us", tz="UTC")
+    assert table.column("finishedAt").null_count == 1
+    assert table.column("vo_name").to_pylist()[2] == "vo-2"
@@ -0,0 +1,91 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import time
+import pytest
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.emulator import APIEmulator, EmulatorConfig, fixed_latency, lognormal_latency
+from eosc_data_transfer_client.endpoints import (
+    create_transfer,
+    get_transfer_status,
+    get_transfer_field,
+    cancel_transfer,
+    list_transfers,
+    parse_doi,
+    get_user_info,
+)
+from eosc_data_transfer_client.exceptions import EOSCClientError, EOSCServerError
+from eosc_data_transfer_client.models import TransferRequest, FileTransfer, TransferParameters
+from eosc_data_transfer_client.retry import RetryPolicy
+
+def make_request(count=2):
+    files = [FileTransfer(sources=[f"https://zenodo.org/files/{i}"], destinations=[f"s3s://play.min.io/bucket/{i}"],
+                          checksum="ADLER32:deadbeef", filesize=10) for i in range(count)]
+    return TransferRequest(files=files, params=TransferParameters(priority=4))
+
+# Jobs go through their lifecycle as time passes
+def test_emulator_job_lifecycle():
+    config = EmulatorConfig(queued=fixed_latency(0.0), active=fixed_latency(0.3), token="secret")
+    with APIEmulator(config) as emulator:
+        client = EOSCClient(emulator.url, token="secret")
+        job_id = create_transfer(client, make_request()).jobId
+        status = get_transfer_status(client, job_id)
+        assert status.jobState == "ACTIVE"
+        assert status.source_se == "zenodo.org" and status.priority == 4
+
+        other = create_transfer(client, make_request()).jobId
+        assert cancel_transfer(client, other).jobState == "CANCELED"
+
+        time.sleep(0.35)
+        assert get_transfer_status(client, job_id).jobState == "FINISHED"
+        assert get_transfer_field(client, job_id, "finishedAt") is not None
+        assert get_transfer_field(client, other, "jobState") == "CANCELED"
+
+        listing = list_transfers(client, jobState="CANCELED")
+        assert [t.jobId for t in listing.transfers] == [other]
+        assert list_transfers(client, offset=1, limit=5).count == 1
+
+        with pytest.raises(EOSCClientError):
+            get_transfer_status(client, "no-such-job")
+        with pytest.raises(EOSCClientError):
+            get_transfer_status(EOSCClient(emulator.url, token="wrong"), job_id)
+    assert emulator.stats.submitted == 2
+
+# DOIs return the configured number of files, and user info is served
+def test_emulator_parser_and_user_info():
+    config = EmulatorConfig(files_per_doi=lambda doi: 1000 if doi.endswith("big") else 3, latency=lognormal_latency(0.001))
+    with APIEmulator(config) as emulator:
+        client = EOSCClient(emulator.url)
+        assert parse_doi(client, "10.5281/zenodo.small").count == 3
+        big = parse_doi(client, "10.5281/zenodo.big")
+        assert len(big.elements) == 1000
+        assert big.elements[0].size == 1 << 20
+        assert get_user_info(client).base_id == "emulator"
+
+# Injected 429s carry Retry-After and are retried; injected errors surface
+def test_emulator_injection():
+    config = EmulatorConfig(throttle_rate=0.5, retry_after=0.0, seed=1)
+    with APIEmulator(config) as emulator:
+        client = EOSCClient(emulator.url, retry=RetryPolicy(max_retries=20, backoff_factor=0.0))
+        for _ in range(20):
+            get_user_info(client)
+        assert emulator.stats.throttled > 0
+        assert emulator.stats.requests == 20 + emulator.stats.throttled
+
+    with APIEmulator(EmulatorConfig(error_rate=1.0, error_status=503)) as emulator:
+        with pytest.raises(EOSCServerError):
+            get_user_info(EOSCClient(emulator.url))
+        assert emulator.stats.errors == 1
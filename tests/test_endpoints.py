@@ -12,9 +12,13 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+import io
+import json
 import pytest
+import threading
 import requests_mock
 from datetime import datetime
+from pydantic import ValidationError
 
 from eosc_data_transfer_client.client import EOSCClient
 from eosc_data_transfer_client.endpoints import (
@@ -23,6 +27,9 @@ from eosc_data_transfer_client.endpoints import (
     get_transfer_field,
     cancel_transfer,
     list_transfers,
+    iter_transfers,
+    iter_transfer_pages,
+    iter_storage_elements,
 )
 from eosc_data_transfer_client.models import (
     TransferRequest,
@@ -165,3 +172,126 @@ def test_cancel_transfer_success():
         result = cancel_transfer(client, "job-123")
         assert result.jobId == "job-123"
         assert result.jobState == "CANCELED"
+
+# Requests get the default timeout unless one is given
+def test_default_timeout():
+    client = make_client()
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/transfer/job-abc/priority", json={"entity": 1})
+        get_transfer_field(client, "job-abc", "priority")
+        assert m.last_request.timeout == (10.0, 60.0)
+
+# Per-thread sessions share one connection pool
+def test_per_thread_session_shares_pool():
+    client = EOSCClient(BASE_URL, token=TOKEN, pool_maxsize=32, per_thread_session=True)
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(client.session))
+    thread.start()
+    thread.join()
+    assert sessions[0] is not client.session
+    assert sessions[0].get_adapter(BASE_URL) is client.session.get_adapter(BASE_URL) is client.adapter
+    assert sessions[0].headers["Authorization"] == f"Bearer {TOKEN}"
+
+# Streaming a listing yields validated transfers one at a time
+def test_iter_transfers_streams_items(make_status):
+    client = make_client()
+    body = json.dumps({"kind": "transfer-list", "count": 3,
+                       "transfers": [make_status(f"job-{i}") for i in range(3)]}).encode()
+
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/transfers", body=io.BytesIO(body))
+        transfers = iter_transfers(client, vo_name="my-vo", state=None)
+        first = next(transfers)
+        assert first.jobId == "job-0"
+        assert first.submittedAt == datetime(2023, 1, 1)
+        assert [t.jobId for t in transfers] == ["job-1", "job-2"]
+        assert m.last_request.qs == {"vo_name": ["my-vo"]}
+
+# Streaming a DOI yields its storage elements
+def test_iter_storage_elements():
+    client = make_client()
+    element = {
+        "kind": "StorageElement", "path": "/", "isFolder": False, "isAccessible": True, "size": 1,
+        "mediaType": "text/plain", "accessUrl": "https://a", "downloadUrl": "https://d", "checksum": "md5:0"
+    }
+    body = {"kind": "StorageContent", "count": 2, "elements": [dict(element, name="a"), dict(element, name="b")]}
+
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/parser", json=body)
+        assert [e.name for e in iter_storage_elements(client, "10.5281/zenodo.1")] == ["a", "b"]
+
+# Pages follow offset/limit until a short page, with and without prefetching
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_transfer_pages(prefetch, make_status):
+    client = make_client()
+
+    def callback(request, context):
+        offset, limit = int(request.qs["offset"][0]), int(request.qs["limit"][0])
+        jobs = [make_status(f"job-{i}", "FINISHED") for i in range(offset, min(offset + limit, 5))]
+        return {"kind": "transfer-list", "count": len(jobs), "transfers": jobs}
+
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/transfers", json=callback)
+        pages = list(iter_transfer_pages(client, page_size=2, prefetch=prefetch, vo_name="my-vo"))
+        assert m.call_count == 3
+        assert m.last_request.qs["vo_name"] == ["my-vo"]
+
+    assert [[t.jobId for t in page.transfers] for page in pages] == [["job-0", "job-1"], ["job-2", "job-3"], ["job-4"]]
+
+# Paging stops when the server ignores the offset and repeats the first page
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_transfer_pages_stops_on_repeated_page(prefetch, make_status):
+    client = make_client()
+    jobs = [make_status(f"job-{i}", "FINISHED") for i in range(2)]
+
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/transfers", json={"kind": "transfer-list", "count": 2, "transfers": jobs})
+        pages = list(iter_transfer_pages(client, page_size=2, prefetch=prefetch))
+        assert m.call_count <= 3
+
+    assert [[t.jobId for t in page.transfers] for page in pages] == [["job-0", "job-1"]]
+
+# A job submitted during the scan shifts the window; its repeated neighbour is dropped and paging goes on
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_transfer_pages_shifted_window(prefetch, make_status):
+    client = make_client()
+    jobs = [f"job-{i}" for i in range(9, -1, -1)]
+
+    def callback(request, context):
+        offset, limit = int(request.qs["offset"][0]), int(request.qs["limit"][0])
+        if offset == 3:
+            # Newest first: a new job appears at the top after the first page
+            jobs.insert(0, "job-new")
+        page = [make_status(job_id) for job_id in jobs[offset:offset + limit]]
+        return {"kind": "transfer-list", "count": len(page), "transfers": page}
+
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/transfers", json=callback)
+        pages = list(iter_transfer_pages(client, page_size=3, prefetch=prefetch))
+
+    job_ids = [t.jobId for page in pages for t in page.transfers]
+    assert job_ids == [f"job-{i}" for i in range(9, -1, -1)]
+
+# Trusted responses build the same models straight from the raw body
+def test_trusted_responses_match_default(make_status):
+    transfer = make_status("job-1", "FINISHED", finishedAt="2023-01-01T00:01:00", jobType="copy")
+    trusted = EOSCClient(BASE_URL, token=TOKEN, trusted_responses=True)
+
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/transfer/job-1", json=transfer)
+        m.get(f"{BASE_URL}/transfers", json={"kind": "transfer-list", "count": 1, "transfers": [transfer]})
+        assert get_transfer_status(trusted, "job-1") == get_transfer_status(make_client(), "job-1")
+        listing = list_transfers(trusted)
+        assert listing == list_transfers(make_client())
+        assert isinstance(listing.transfers[0].finishedAt, datetime)
+
+        m.get(f"{BASE_URL}/transfer/job-2", text="not json")
+        with pytest.raises(ValidationError):
+            get_transfer_status(trusted, "job-2")
+
+# Optional fields are converted to their inner type
+def test_get_transfer_field_parses_optional_datetime():
+    client = make_client()
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/transfer/job-abc/finishedAt", json={"entity": "2023-01-01T00:01:00"})
+        assert get_transfer_field(client, "job-abc", "finishedAt") == datetime(2023, 1, 1, 0, 1)
@@ -0,0 +1,121 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import re
+import time
+import pytest
+import requests
+import requests_mock
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.endpoints import create_transfer, get_transfer_status, list_transfers
+from eosc_data_transfer_client.exceptions import EOSCClientError, EOSCRequestError
+from eosc_data_transfer_client.journal import TransferJournal
+from eosc_data_transfer_client.models import TransferRequest, FileTransfer, TransferParameters, TransferStatus
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+
+def make_request(name):
+    files = [FileTransfer(sources=[f"mock://source/{name}"], destinations=[f"mock://destination/{name}"],
+                          checksum="ADLER32:deadbeef", filesize=10)]
+    return TransferRequest(files=files, params=TransferParameters(priority=5))
+
+def submit(client, m, name, job_id):
+    m.post(f"{BASE_URL}/transfers", json={"kind": "TransferResponse", "jobId": job_id})
+    return create_transfer(client, make_request(name))
+
+# Submissions and statuses are recorded and survive reopening the file
+def test_journal_records_jobs(tmp_path, make_status):
+    path = str(tmp_path / "journal.sqlite")
+    client = EOSCClient(BASE_URL, token=TOKEN, journal=TransferJournal(path))
+
+    with requests_mock.Mocker() as m:
+        submit(client, m, "a", "job-1")
+        submit(client, m, "b", "job-2")
+        m.get(f"{BASE_URL}/transfer/job-1", json=make_status("job-1", "FINISHED"))
+        get_transfer_status(client, "job-1")
+        # Jobs not submitted through the journal are ignored
+        m.get(f"{BASE_URL}/transfers", json={"kind": "TransferStatusList", "count": 2,
+                                             "transfers": [make_status("job-2", vo_name="other-vo"), make_status("job-9")]})
+        list_transfers(client)
+    client.journal.close()
+
+    journal = TransferJournal(path)
+    assert len(journal) == 2
+    entry = journal.get("job-1")
+    assert entry.state == "FINISHED" and entry.terminal
+    assert entry.status.jobState == "FINISHED"
+    assert entry.digest == TransferJournal.digest(make_request("a"))
+    assert journal.get("job-9") is None
+    assert [e.job_id for e in journal.find(make_request("b"))] == ["job-2"]
+    assert [e.job_id for e in journal.query(vo_name="other-vo")] == ["job-2"]
+    assert [e.job_id for e in journal.query(state="FINISHED")] == ["job-1"]
+    assert [e.job_id for e in journal.query(since=time.time() - 60)] == ["job-1", "job-2"]
+    assert journal.query(until=time.time() - 60) == []
+    journal.close()
+
+# Resuming only polls jobs that are not terminal yet
+def test_journal_resume(make_status):
+    journal = TransferJournal(":memory:")
+    client = EOSCClient(BASE_URL, token=TOKEN, journal=journal)
+
+    with requests_mock.Mocker() as m:
+        for i, name in enumerate("abc"):
+            submit(client, m, name, f"job-{i}")
+        m.get(f"{BASE_URL}/transfer/job-0", json=make_status("job-0", "FAILED"))
+        get_transfer_status(client, "job-0")
+        assert journal.pending() == ["job-1", "job-2"]
+
+        m.get(re.compile(f"{BASE_URL}/transfer/job-.*"),
+              json=lambda request, context: make_status(request.path.rsplit("/", 1)[-1], "FINISHED"))
+        results = dict(journal.resume(EOSCClient(BASE_URL, token=TOKEN)))
+        polled = [request.path for request in m.request_history if request.method == "GET"]
+
+    assert sorted(results) == ["job-1", "job-2"]
+    assert all(isinstance(status, TransferStatus) for status in results.values())
+    # Only the first poll asked for the terminal job
+    assert polled[0] == "/transfer/job-0"
+    assert sorted(polled[1:]) == ["/transfer/job-1", "/transfer/job-2"]
+    assert journal.pending() == []
+
+# Submissions are recorded before the request is sent, and dropped only when rejected
+def test_journal_records_before_sending():
+    journal = TransferJournal(":memory:")
+    client = EOSCClient(BASE_URL, token=TOKEN, journal=journal)
+    seen = []
+
+    def callback(request, context):
+        seen.extend(journal.find(make_request("a")))
+        return {"kind": "TransferResponse", "jobId": "job-1"}
+
+    with requests_mock.Mocker() as m:
+        m.post(f"{BASE_URL}/transfers", json=callback)
+        create_transfer(client, make_request("a"))
+
+        m.post(f"{BASE_URL}/transfers", status_code=400, json={"error": "Bad request"})
+        with pytest.raises(EOSCClientError):
+            create_transfer(client, make_request("b"))
+
+        m.post(f"{BASE_URL}/transfers", exc=requests.exceptions.ConnectionError)
+        with pytest.raises(EOSCRequestError):
+            create_transfer(client, make_request("c"))
+
+    assert [entry.job_id for entry in seen] == [None]
+    assert [entry.job_id for entry in journal.find(make_request("a"))] == ["job-1"]
+    assert journal.find(make_request("b")) == []
+    # The outcome of a request lost on the way is unknown, so its entry is kept
+    assert [entry.job_id for entry in journal.find(make_request("c"))] == [None]
+    assert journal.pending() == ["job-1"]
@@ -0,0 +1,122 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import asyncio
+import pytest
+import requests
+import requests_mock
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.endpoints import get_transfer_status, get_transfer_field, get_user_info
+from eosc_data_transfer_client.exceptions import EOSCClientError, EOSCRequestError
+from eosc_data_transfer_client.metrics import Metrics, MetricsSink
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+USER_INFO = {"kind": "UserInfo", "base_id": "id", "user_dn": "dn"}
+
+def labels(method, endpoint, status="200", exception=""):
+    return {"method": method, "endpoint": endpoint, "status": status, "exception": exception}
+
+# Requests are recorded by templated endpoint, status and exception
+def test_metrics_requests():
+    metrics = Metrics()
+    client = EOSCClient(BASE_URL, token=TOKEN, metrics=metrics)
+
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/transfer/job-1/jobState", json={"entity": "ACTIVE"})
+        m.get(f"{BASE_URL}/transfer/job-2/jobState", json={"entity": "FAILED"})
+        m.get(f"{BASE_URL}/transfer/job-3", status_code=404, json={"message": "Not found"})
+        m.get(f"{BASE_URL}/user/info", exc=requests.exceptions.ConnectTimeout)
+        get_transfer_field(client, "job-1", "jobState")
+        get_transfer_field(client, "job-2", "jobState")
+        with pytest.raises(EOSCClientError):
+            get_transfer_status(client, "job-3")
+        with pytest.raises(EOSCRequestError):
+            get_user_info(client)
+
+    assert metrics.get("request", **labels("GET", "/transfer/{id}/{field}")).count == 2
+    assert metrics.get("headers", **labels("GET", "/transfer/{id}/{field}")).count == 2
+    assert metrics.get("request", **labels("GET", "/transfer/{id}", "404")).count == 1
+    assert metrics.get("request", **labels("GET", "/user/info", "", "ConnectTimeout")).count == 1
+    assert metrics.get("decode", endpoint="/transfer/{id}/{field}").count == 2
+    assert metrics.get("validate", model="TransferStatus", endpoint="/transfer/{id}") is None
+
+# Validation is timed per model, also for trusted responses
+def test_metrics_validation():
+    metrics = Metrics()
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/user/info", json=USER_INFO)
+        get_user_info(EOSCClient(BASE_URL, token=TOKEN, metrics=metrics))
+        get_user_info(EOSCClient(BASE_URL, token=TOKEN, metrics=metrics, trusted_responses=True))
+
+    assert metrics.get("validate", model="UserInfo", endpoint="/user/info").count == 2
+    # Trusted responses are validated from the raw body without decoding
+    assert metrics.get("decode", endpoint="/user/info").count == 1
+
+# Histograms are exported in the Prometheus text format
+def test_metrics_prometheus():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.observe("request", 0.05, method="GET", endpoint="/transfers", status="200", exception="")
+    metrics.observe("request", 0.5, method="GET", endpoint="/transfers", status="200", exception="")
+    metrics.observe("decode", 2.0, endpoint='/odd"path')
+
+    text = metrics.to_prometheus()
+
+    assert "# TYPE eosc_client_request_seconds histogram" in text
+    prefix = 'eosc_client_request_seconds_bucket{method="GET",endpoint="/transfers",status="200",exception=""'
+    assert f'{prefix},le="0.1"}} 1' in text
+    assert f'{prefix},le="1"}} 2' in text
+    assert f'{prefix},le="+Inf"}} 2' in text
+    assert 'eosc_client_request_seconds_count{method="GET",endpoint="/transfers",status="200",exception=""} 2' in text
+    assert 'eosc_client_decode_seconds_sum{endpoint="/odd\\"path"} 2' in text
+    assert "eosc_client_validate_seconds" not in text
+    metrics.reset()
+    assert metrics.to_prometheus() == ""
+
+# Sinks receive every observation
+def test_metrics_sink():
+    class ListSink(MetricsSink):
+        def __init__(self):
+            self.observations = []
+
+        def observe(self, name, labels, seconds):
+            self.observations.append((name, labels["endpoint"]))
+
+    sink = ListSink()
+    client = EOSCClient(BASE_URL, token=TOKEN, metrics=Metrics(sinks=[sink]))
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/user/info", json=USER_INFO)
+        get_user_info(client)
+
+    assert sink.observations == [("request", "/user/info"), ("headers", "/user/info"), ("download", "/user/info"),
+                                 ("decode", "/user/info"), ("validate", "/user/info")]
+
+# The async client records the same metrics
+def test_metrics_async():
+    httpx = pytest.importorskip("httpx")
+    from eosc_data_transfer_client.async_client import AsyncEOSCClient
+    from eosc_data_transfer_client import async_endpoints
+
+    metrics = Metrics()
+
+    async def main():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=USER_INFO))
+        async with AsyncEOSCClient(BASE_URL, token=TOKEN, metrics=metrics, transport=transport) as client:
+            await async_endpoints.get_user_info(client)
+
+    asyncio.run(main())
+    assert metrics.get("request", **labels("GET", "/user/info")).count == 1
+    assert metrics.get("validate", model="UserInfo", endpoint="/user/info").count == 1
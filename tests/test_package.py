@@ -0,0 +1,42 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import subprocess
+import sys
+
+import eosc_data_transfer_client
+
+# Importing the package does not load its dependencies
+def test_import_is_lazy():
+    code = (
+        "import sys, eosc_data_transfer_client; "
+        "print(sorted(m for m in ('requests', 'pydantic', 'eosc_data_transfer_client.client') if m in sys.modules))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    assert output.strip() == "[]"
+
+# Every name in __all__ resolves, so star-imports work
+def test_all_names_resolve():
+    namespace = {}
+    exec("from eosc_data_transfer_client import *", namespace)
+    assert set(eosc_data_transfer_client.__all__) <= set(namespace)
+
+# Lazy attributes are the objects defined in the submodules
+def test_lazy_attributes():
+    from eosc_data_transfer_client.endpoints import get_transfer_field
+    from eosc_data_transfer_client.models import FileTransfer
+    assert eosc_data_transfer_client.get_transfer_field is get_transfer_field
+    assert eosc_data_transfer_client.FileTransfer is FileTransfer
+    assert "EOSCClient" in dir(eosc_data_transfer_client)
@@ -0,0 +1,122 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import itertools
+import pytest
+import requests_mock
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.pipeline import run_pipeline, build_transfer_request
+from eosc_data_transfer_client.models import StorageContent, TransferParameters
+from eosc_data_transfer_client.exceptions import EOSCClientError, EOSCServerError
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+
+def make_content(record, count=2, folder=False):
+    elements = [
+        {
+            "kind": "StorageElement",
+            "name": f"file-{i}.txt",
+            "path": f"/data/file-{i}.txt",
+            "isFolder": False,
+            "isAccessible": True,
+            "size": 100 + i,
+            "mediaType": "text/plain",
+            "accessUrl": f"https://zenodo.org/records/{record}/files/file-{i}.txt",
+            "downloadUrl": f"https://zenodo.org/records/{record}/files/file-{i}.txt?download=1",
+            "checksum": f"md5:{i:032x}"
+        }
+        for i in range(count)
+    ]
+    if folder:
+        elements.append(dict(elements[0], name="data", path="/data", isFolder=True))
+    return {"kind": "StorageContent", "count": len(elements), "elements": elements}
+
+def parser_callback(request, context):
+    record = request.qs["doi"][0].rsplit(".", 1)[-1]
+    if record == "404":
+        context.status_code = 404
+        return {"error": "Not found"}
+    return make_content(record, count=0 if record == "0" else 2)
+
+def submit_callback(request, context):
+    if "records/500/" in request.text:
+        context.status_code = 500
+        return {"error": "Server error"}
+    return {"kind": "TransferResponse", "jobId": "job-" + request.json()["files"][0]["sources"][0].split("/")[4]}
+
+# Templates are formatted per file, and folders are skipped
+def test_build_transfer_request():
+    content = StorageContent(**make_content("7", folder=True))
+    request = build_transfer_request("doi:10.5281/zenodo.7", content, "s3s://bucket/{record}/{path}",
+                                     TransferParameters(priority=5))
+    assert [f.destinations for f in request.files] == [["s3s://bucket/zenodo.7/data/file-0.txt"],
+                                                       ["s3s://bucket/zenodo.7/data/file-1.txt"]]
+    assert request.files[1].filesize == 101
+    assert request.params.priority == 5
+
+    prefixed = build_transfer_request("10.5281/zenodo.7", content, "s3s://bucket/")
+    assert prefixed.files[0].destinations == ["s3s://bucket/file-0.txt"]
+
+# Every DOI gets a result and failures stay with their DOI
+def test_run_pipeline_isolates_errors():
+    client = EOSCClient(BASE_URL, token=TOKEN)
+    dois = [f"10.5281/zenodo.{i}" for i in [1, 2, 404, 0, 500, 3]]
+
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/parser", json=parser_callback)
+        m.post(f"{BASE_URL}/transfers", json=submit_callback)
+        results = {r.doi: r for r in run_pipeline(client, iter(dois), "s3s://bucket/{record}/{name}",
+                                                  parse_workers=3, submit_workers=2, queue_size=2)}
+
+    assert sorted(results) == sorted(dois)
+    assert [results[f"10.5281/zenodo.{i}"].response.jobId for i in [1, 2, 3]] == ["job-1", "job-2", "job-3"]
+    assert isinstance(results["10.5281/zenodo.404"].error, EOSCClientError)
+    assert results["10.5281/zenodo.404"].stage == "parse"
+    assert isinstance(results["10.5281/zenodo.0"].error, ValueError)
+    assert results["10.5281/zenodo.0"].stage == "build"
+    assert isinstance(results["10.5281/zenodo.500"].error, EOSCServerError)
+    assert results["10.5281/zenodo.500"].stage == "submit"
+    assert not results["10.5281/zenodo.500"].ok and results["10.5281/zenodo.1"].ok
+
+# Stopping early does not read the whole DOI stream
+def test_run_pipeline_stops_early():
+    client = EOSCClient(BASE_URL, token=TOKEN)
+    dois = (f"10.5281/zenodo.{i}" for i in itertools.count(1))
+
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/parser", json=parser_callback)
+        m.post(f"{BASE_URL}/transfers", json=submit_callback)
+        pipeline = run_pipeline(client, dois, "s3s://bucket/", parse_workers=2, submit_workers=1, queue_size=2)
+        first = [next(pipeline) for _ in range(3)]
+        pipeline.close()
+
+    assert all(result.ok for result in first)
+    # Bounded by the workers and queues, not by the length of the stream
+    assert m.call_count < 20
+
+# Errors of the DOI stream itself are raised
+def test_run_pipeline_stream_error():
+    def dois():
+        yield "10.5281/zenodo.1"
+        raise RuntimeError("broken stream")
+
+    client = EOSCClient(BASE_URL, token=TOKEN)
+    with requests_mock.Mocker() as m:
+        m.get(f"{BASE_URL}/parser", json=parser_callback)
+        m.post(f"{BASE_URL}/transfers", json=submit_callback)
+        with pytest.raises(RuntimeError, match="broken stream"):
+            list(run_pipeline(client, dois(), "s3s://bucket/"))
@@ -0,0 +1,104 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import requests_mock
+from pydantic import ValidationError
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.models import FileTransfer, TransferParameters
+from eosc_data_transfer_client.planner import plan_transfers, small_jobs_first, submit_plan
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+
+def make_file(i, size, source="https://zenodo.org", destination="s3s://play.min.io", activity="default"):
+    return FileTransfer(sources=[f"{source}/files/{i}"], destinations=[f"{destination}/bucket/{i}"],
+                        checksum="ADLER32:deadbeef", filesize=size, activity=activity)
+
+# Jobs never mix endpoints or activities
+def test_plan_groups_by_hosts_and_activity():
+    files = [make_file(0, 10), make_file(1, 10, source="https://Other.org:8443"), make_file(2, 10),
+             make_file(3, 10, activity="express"), make_file(4, 10, destination="root://eos.cern.ch")]
+
+    plan = plan_transfers(files)
+
+    groups = [(job.source_host, job.destination_host, job.activity, len(job.files)) for job in plan.jobs]
+    assert groups == [
+        ("zenodo.org", "play.min.io", "default", 2),
+        ("other.org:8443", "play.min.io", "default", 1),
+        ("zenodo.org", "play.min.io", "express", 1),
+        ("zenodo.org", "eos.cern.ch", "default", 1),
+    ]
+    assert [job.index for job in plan.jobs] == [0, 1, 2, 3]
+
+# Each group is packed into balanced jobs within the limits
+def test_plan_balances_sizes():
+    files = [make_file(0, 1000)] + [make_file(i, 1) for i in range(1, 2001)]
+
+    plan = plan_transfers(files, max_files=1000)
+
+    assert len(plan.jobs) == 3
+    assert all(len(job.files) <= 1000 for job in plan.jobs)
+    assert sum(len(job.files) for job in plan.jobs) == 2001
+    # The huge file is not lumped together with a full job of tiny ones
+    assert sorted(job.total_bytes for job in plan.jobs) == [1000, 1000, 1000]
+
+    # A file larger than max_bytes gets a job of its own
+    by_size = plan_transfers([make_file(i, size) for i, size in enumerate([500, 400, 300, 200, 100, 900])], max_bytes=800)
+    assert sorted(job.total_bytes for job in by_size.jobs) == [700, 800, 900]
+
+# Priorities come from the policy and are explained
+def test_plan_priority_policy():
+    files = [make_file(i, 10) for i in range(3)] + [make_file(i, 500, activity="bulk") for i in range(3, 5)]
+    params = TransferParameters(priority=2, overwrite=True)
+
+    plan = plan_transfers(files, params=params, priority=small_jobs_first(small_bytes=100, large_bytes=2000))
+    default = plan_transfers(files, params=params)
+
+    assert [job.priority for job in plan.jobs] == [5, 3]
+    assert [job.priority for job in default.jobs] == [2, 2]
+    requests = plan.requests()
+    assert [request.params.priority for request in requests] == [5, 3]
+    assert all(request.params.overwrite for request in requests)
+    explanation = plan.explain()
+    assert explanation.splitlines()[0] == "2 jobs, 5 files, 1030 bytes"
+    assert "job 1: zenodo.org -> play.min.io [bulk] 2 files, 1000 bytes, priority 3" in explanation
+    assert "priority from policy" in explanation
+
+# Every job of the plan is submitted
+def test_submit_plan():
+    client = EOSCClient(BASE_URL, token=TOKEN)
+    plan = plan_transfers([make_file(i, 10) for i in range(5)], max_files=2)
+
+    with requests_mock.Mocker() as m:
+        m.post(f"{BASE_URL}/transfers", json=lambda request, context: {
+            "kind": "TransferResponse", "jobId": f"job-{len(request.json()['files'])}-{request.json()['params']['priority']}"})
+        submission = submit_plan(client, plan)
+
+    assert submission.ok
+    assert sorted(submission.job_ids.values()) == ["job-1-3", "job-2-3", "job-2-3"]
+
+# A malformed response fails its job only, keeping the jobs already accepted
+def test_submit_plan_invalid_response():
+    client = EOSCClient(BASE_URL, token=TOKEN)
+    plan = plan_transfers([make_file(i, 10) for i in range(3)], max_files=2)
+
+    with requests_mock.Mocker() as m:
+        m.post(f"{BASE_URL}/transfers", json=lambda request, context: (
+            {"kind": "TransferResponse"} if len(request.json()["files"]) == 1 else {"kind": "TransferResponse", "jobId": "job-1"}))
+        submission = submit_plan(client, plan)
+
+    assert len(submission.job_ids) == 1
+    assert isinstance(submission.failed[0].error, ValidationError)
@@ -0,0 +1,138 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import asyncio
+import threading
+import time
+import requests
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.endpoints import get_transfer_field
+from eosc_data_transfer_client.ratelimit import RateLimiter, EndpointLimit, TokenBucket
+from eosc_data_transfer_client.utils import endpoint_template
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+
+# Paths are grouped by templated endpoint
+def test_endpoint_template():
+    assert endpoint_template("/transfers") == "/transfers"
+    assert endpoint_template("/transfer/abc-123") == "/transfer/{id}"
+    assert endpoint_template("/transfer/abc-123/jobState") == "/transfer/{id}/{field}"
+    assert endpoint_template("/user/info") == "/user/info"
+
+# The most specific group wins, then the default
+def test_rate_limiter_groups():
+    submit, status, default = EndpointLimit(rate=1), EndpointLimit(rate=2), EndpointLimit(rate=3)
+    limiter = RateLimiter({"POST /transfers": submit, "/transfer/{id}": status}, default=default)
+    assert limiter.limit_for("post", "/transfers") is submit
+    assert limiter.limit_for("GET", "/transfers") is default
+    assert limiter.limit_for("GET", "/transfer/abc") is status
+    assert limiter.limit_for("DELETE", "/transfer/abc") is status
+    assert RateLimiter().limit_for("GET", "/parser") is None
+
+# The token bucket spaces out requests beyond the burst
+def test_token_bucket_rate():
+    bucket = TokenBucket(rate=100, burst=1)
+    start = time.monotonic()
+    for _ in range(11):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.09
+
+# The concurrency limit holds across threads sharing one client
+def test_max_in_flight_across_threads():
+    limiter = RateLimiter({"GET /transfer/{id}/{field}": EndpointLimit(max_in_flight=2)})
+    client = EOSCClient(BASE_URL, token=TOKEN, rate_limiter=limiter)
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    def send(method, url, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.02)
+        with lock:
+            in_flight[0] -= 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"entity": 1}'
+        return response
+
+    # requests_mock serializes calls, so stub the session to observe real concurrency
+    client.session.request = send
+    threads = [threading.Thread(target=get_transfer_field, args=(client, f"job-{i}", "priority")) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
+
+# Async slots limit concurrent tasks
+def test_async_limit():
+    limiter = RateLimiter(default=EndpointLimit(rate=1000, max_in_flight=3))
+    in_flight, peak = [0], [0]
+
+    async def task():
+        async with limiter.async_limit("GET", "/transfer/abc"):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+
+    async def run():
+        await asyncio.gather(*(task() for _ in range(10)))
+
+    asyncio.run(run())
+    assert peak[0] == 3
+
+# Threads and asyncio tasks sharing one limit share its concurrency slots
+def test_max_in_flight_sync_and_async():
+    limit = EndpointLimit(max_in_flight=2)
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    def enter():
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+
+    def leave():
+        with lock:
+            in_flight[0] -= 1
+
+    def thread_request():
+        with limit.slot():
+            enter()
+            time.sleep(0.02)
+            leave()
+
+    async def task_request():
+        async with limit.async_slot():
+            enter()
+            await asyncio.sleep(0.02)
+            leave()
+
+    async def run():
+        await asyncio.gather(*(task_request() for _ in range(8)))
+
+    threads = [threading.Thread(target=thread_request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    asyncio.run(run())
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
@@ -0,0 +1,122 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import pytest
+import requests
+import requests_mock
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.endpoints import create_transfer, get_transfer_field
+from eosc_data_transfer_client.models import TransferRequest, FileTransfer, TransferParameters
+from eosc_data_transfer_client.retry import RetryPolicy
+from eosc_data_transfer_client.exceptions import EOSCClientError, EOSCServerError, EOSCRequestError
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+FIELD_URL = f"{BASE_URL}/transfer/job-abc/priority"
+
+def make_client(**kwargs):
+    return EOSCClient(BASE_URL, token=TOKEN, retry=RetryPolicy(backoff_factor=0, **kwargs))
+
+def make_dummy_request():
+    transfer = FileTransfer(sources=["mock://source"], destinations=["mock://destination"],
+                            checksum="ADLER32:deadbeef", filesize=42)
+    return TransferRequest(files=[transfer], params=TransferParameters())
+
+# Transient 5xx errors and network failures are retried for GET
+def test_retry_get_until_success():
+    client = make_client()
+    with requests_mock.Mocker() as m:
+        m.get(FIELD_URL, [
+            {"status_code": 503, "json": {"error": "Unavailable"}},
+            {"exc": requests.exceptions.ConnectionError},
+            {"json": {"entity": 42}},
+        ])
+        assert get_transfer_field(client, "job-abc", "priority") == 42
+
+    stats = client.last_retry_stats
+    assert (stats.attempts, stats.retries) == (3, 2)
+    assert client.retry.stats.retries == 2
+
+# Giving up after max_retries raises the last error
+def test_retry_exhausted():
+    client = make_client(max_retries=2)
+    with requests_mock.Mocker() as m:
+        m.get(FIELD_URL, status_code=502, json={"error": "Bad gateway"})
+        with pytest.raises(EOSCServerError):
+            get_transfer_field(client, "job-abc", "priority")
+        assert m.call_count == 3
+
+# Non-retryable client errors fail immediately
+def test_no_retry_on_404():
+    client = make_client()
+    with requests_mock.Mocker() as m:
+        m.get(FIELD_URL, status_code=404, json={"error": "Not found"})
+        with pytest.raises(EOSCClientError):
+            get_transfer_field(client, "job-abc", "priority")
+        assert m.call_count == 1
+
+# POST is only retried when opted in
+@pytest.mark.parametrize("methods, calls", [(("GET", "DELETE"), 1), (("GET", "DELETE", "POST"), 2)])
+def test_retry_post_opt_in(methods, calls):
+    client = make_client(methods=methods)
+    with requests_mock.Mocker() as m:
+        m.post(f"{BASE_URL}/transfers", [
+            {"status_code": 500, "json": {"error": "Internal Server Error"}},
+            {"json": {"kind": "transferStatus", "jobId": "abc-123"}},
+        ])
+        try:
+            create_transfer(client, make_dummy_request())
+        except EOSCServerError:
+            pass
+        assert m.call_count == calls
+
+# Retry-After headers set the delay
+def test_retry_after_header(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("eosc_data_transfer_client.client.time.sleep", sleeps.append)
+    client = make_client()
+    with requests_mock.Mocker() as m:
+        m.get(FIELD_URL, [
+            {"status_code": 429, "headers": {"Retry-After": "7"}, "json": {"error": "Slow down"}},
+            {"json": {"entity": 1}},
+        ])
+        get_transfer_field(client, "job-abc", "priority")
+
+    assert sleeps == [7.0]
+    assert client.last_retry_stats.backoff == 7.0
+
+# A Retry-After longer than max_backoff raises instead of sleeping
+def test_retry_after_beyond_max_backoff(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("eosc_data_transfer_client.client.time.sleep", sleeps.append)
+    client = make_client(max_backoff=30)
+    with requests_mock.Mocker() as m:
+        m.get(FIELD_URL, [
+            {"status_code": 429, "headers": {"Retry-After": "3600"}, "json": {"error": "Slow down"}},
+            {"json": {"entity": 1}},
+        ])
+        with pytest.raises(EOSCClientError):
+            get_transfer_field(client, "job-abc", "priority")
+        assert m.call_count == 1
+
+    assert sleeps == []
+
+# Backoff grows exponentially and stays within the jittered bounds
+def test_backoff_bounds():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+    error = EOSCRequestError("boom")
+    for attempt, bound in [(1, 1), (2, 2), (3, 4), (6, 5)]:
+        assert 0 <= policy.get_delay(attempt, error) <= bound
@@ -0,0 +1,75 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import pytest
+import requests_mock
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.endpoints import create_transfer
+from eosc_data_transfer_client.models import TransferRequest, FileTransfer, TransferParameters
+from eosc_data_transfer_client.serialization import JSONBackend, OrjsonBackend, default_backend, orjson
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+
+class RecordingBackend(JSONBackend):
+    def __init__(self):
+        self.calls = []
+
+    def loads(self, data):
+        self.calls.append("loads")
+        return super().loads(data)
+
+    def dumps(self, value):
+        self.calls.append("dumps")
+        return super().dumps(value)
+
+# Transfer requests are sent pre-encoded, responses go through the backend
+def test_create_transfer_sends_pre_encoded_body():
+    backend = RecordingBackend()
+    client = EOSCClient(BASE_URL, token=TOKEN, json_backend=backend)
+    transfer = FileTransfer(sources=["mock://source"], destinations=["mock://destination"],
+                            checksum="ADLER32:deadbeef", filesize=42)
+    request = TransferRequest(files=[transfer], params=TransferParameters())
+
+    with requests_mock.Mocker() as m:
+        m.post(f"{BASE_URL}/transfers", json={"kind": "transferStatus", "jobId": "abc-123"})
+        assert create_transfer(client, request).jobId == "abc-123"
+        assert m.last_request.body == request.model_dump_json().encode()
+        assert m.last_request.headers["Content-Type"] == "application/json"
+
+    assert backend.calls == ["loads"]
+
+# Explicit json bodies are encoded with the backend
+def test_request_json_uses_backend():
+    backend = RecordingBackend()
+    client = EOSCClient(BASE_URL, token=TOKEN, json_backend=backend)
+    with requests_mock.Mocker() as m:
+        m.post(f"{BASE_URL}/transfers", json={"ok": True})
+        assert client.request("POST", "/transfers", json={"a": "é"}) == {"ok": True}
+        assert m.last_request.json() == {"a": "é"}
+    assert backend.calls == ["dumps", "loads"]
+
+# orjson is picked when it is installed
+def test_default_backend():
+    expected = OrjsonBackend if orjson is not None else JSONBackend
+    assert type(default_backend()) is expected
+
+@pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+def test_orjson_backend_round_trip():
+    backend = OrjsonBackend()
+    value = {"files": [{"filesize": 1, "sources": ["é"]}], "ok": None}
+    assert backend.loads(backend.dumps(value)) == value
+    assert JSONBackend().loads(backend.dumps(value)) == value
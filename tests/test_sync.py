@@ -0,0 +1,115 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import requests_mock
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.models import StorageElement
+from eosc_data_transfer_client.sync import SyncManifest, commit_sync, diff_storage_content, sync_doi
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+DOI = "10.5281/zenodo.7"
+DESTINATION = "s3s://bucket/{record}/{name}"
+
+def make_element(name, size=10, checksum="md5:0", folder=False):
+    return {
+        "kind": "StorageElement", "name": name, "path": f"/{name}", "isFolder": folder, "isAccessible": True,
+        "size": size, "mediaType": "text/plain", "accessUrl": f"https://zenodo.org/files/{name}",
+        "downloadUrl": f"https://zenodo.org/files/{name}?download=1", "checksum": checksum
+    }
+
+def make_content(*elements):
+    return {"kind": "StorageContent", "count": len(elements), "elements": list(elements)}
+
+def sync(client, m, manifest, content, **kwargs):
+    m.get(f"{BASE_URL}/parser", json=content)
+    m.post(f"{BASE_URL}/transfers", json={"kind": "TransferResponse", "jobId": "job-1"})
+    return sync_doi(client, DOI, DESTINATION, manifest, **kwargs)
+
+def submitted(m):
+    posts = [request for request in m.request_history if request.method == "POST"]
+    return posts[-1].json() if posts else None
+
+def submitted_files(m):
+    body = submitted(m)
+    return [f["destinations"][0] for f in body["files"]] if body else []
+
+def finish(client, m, manifest, result, status):
+    m.get(f"{BASE_URL}/transfer/job-1", json=status)
+    return commit_sync(client, manifest, result)
+
+# Only new and changed files are submitted on each sync
+def test_sync_doi(tmp_path, make_status):
+    client = EOSCClient(BASE_URL, token=TOKEN)
+    manifest = SyncManifest(str(tmp_path / "manifest.sqlite"))
+
+    with requests_mock.Mocker() as m:
+        first = sync(client, m, manifest, make_content(make_element("a"), make_element("b"), make_element("d", folder=True)))
+        assert first.response.jobId == "job-1"
+        assert len(first.diff.new) == 2
+        assert submitted_files(m) == ["s3s://bucket/zenodo.7/a", "s3s://bucket/zenodo.7/b"]
+        assert submitted(m)["params"]["overwrite"] is False
+        assert finish(client, m, manifest, first, make_status("job-1", "FINISHED"))
+
+    with requests_mock.Mocker() as m:
+        unchanged = sync(client, m, manifest, make_content(make_element("a"), make_element("b")))
+        assert unchanged.response is None and unchanged.request is None
+        assert unchanged.diff.unchanged == 2
+        assert submitted_files(m) == []
+        assert commit_sync(client, manifest, unchanged)
+
+    with requests_mock.Mocker() as m:
+        changed = sync(client, m, manifest, make_content(make_element("a", checksum="md5:1"), make_element("c")))
+        assert [e.name for e in changed.diff.new] == ["c"]
+        assert [e.name for e in changed.diff.changed] == ["a"]
+        assert changed.diff.removed == ["/b"]
+        assert submitted_files(m) == ["s3s://bucket/zenodo.7/c", "s3s://bucket/zenodo.7/a"]
+        assert submitted(m)["params"]["overwrite"] is True
+        assert finish(client, m, manifest, changed, make_status("job-1", "FINISHED"))
+
+    assert manifest.load("doi:" + DOI, DESTINATION) == {"/a": (10, "md5:1"), "/c": (10, "md5:0")}
+    assert manifest.load(DOI, "s3s://other/{name}") == {}
+    manifest.close()
+
+# Files of a failed job stay pending, while commit=True records them on submission
+def test_sync_doi_commit(make_status):
+    client = EOSCClient(BASE_URL, token=TOKEN)
+    manifest = SyncManifest(":memory:")
+
+    with requests_mock.Mocker() as m:
+        result = sync(client, m, manifest, make_content(make_element("a")))
+        assert manifest.load(DOI, DESTINATION) == {}
+        assert not finish(client, m, manifest, result, make_status("job-1", "FAILED"))
+        assert sync(client, m, manifest, make_content(make_element("a"))).diff.new
+
+        assert sync(client, m, manifest, make_content(make_element("a")), commit=True).response is not None
+        assert sync(client, m, manifest, make_content(make_element("a"))).response is None
+
+    manifest.forget(DOI, DESTINATION)
+    assert manifest.load(DOI, DESTINATION) == {}
+
+# Large listings are diffed by path in one pass
+def test_diff_storage_content_large():
+    count = 100000
+    previous = {f"/f{i}": (10, "md5:0") for i in range(count)}
+    elements = [StorageElement(**make_element(f"f{i}", size=11 if i % 1000 == 0 else 10)) for i in range(1, count + 1)]
+
+    diff = diff_storage_content(previous, elements)
+
+    assert [e.path for e in diff.new] == [f"/f{count}"]
+    assert len(diff.changed) == count // 1000 - 1
+    assert diff.removed == ["/f0"]
+    assert diff.unchanged == count - len(diff.changed) - 1
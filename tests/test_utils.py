@@ -0,0 +1,44 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import json
+import pytest
+
+from eosc_data_transfer_client.utils import iter_json_array
+
+DOC = {
+    "kind": "transfer-list",
+    "nested": {"a": [1, {"b": "é]}"}]},
+    "transfers": [{"id": 1, "s": "é,}"}, {"id": 22}, 12345, -1.5e3, "x", None, True],
+    "after": "y"
+}
+
+# Items are decoded correctly whatever the chunk boundaries
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 4096])
+def test_iter_json_array_chunk_boundaries(size):
+    raw = json.dumps(DOC, ensure_ascii=False).encode()
+    chunks = [raw[i:i + size] for i in range(0, len(raw), size)]
+    assert list(iter_json_array(chunks, "transfers")) == DOC["transfers"]
+
+# Missing or empty arrays yield nothing
+@pytest.mark.parametrize("raw", [b"{}", b'{"count": 0}', b'{"transfers": []}'])
+def test_iter_json_array_empty(raw):
+    assert list(iter_json_array([raw], "transfers")) == []
+
+# Truncated or invalid bodies raise ValueError
+@pytest.mark.parametrize("raw", [b'{"transfers": [1, 2', b'{"transfers": 5}', b'{"transfers": [1 2]}'])
+def test_iter_json_array_invalid(raw):
+    with pytest.raises(ValueError):
+        list(iter_json_array([raw], "transfers"))
@@ -0,0 +1,108 @@
+#   Copyright 2025 CERN
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import re
+import threading
+import time
+import pytest
+import requests_mock
+
+from eosc_data_transfer_client.client import EOSCClient
+from eosc_data_transfer_client.watcher import TransferWatcher
+from eosc_data_transfer_client.exceptions import EOSCClientError
+
+BASE_URL = "https://data-transfer.service.eosc-beyond.eu"
+TOKEN = "fake-token"
+
+def make_client():
+    return EOSCClient(BASE_URL, token=TOKEN)
+
+def lifecycle_callback(make_status, polls_to_finish):
+    """Jobs report SUBMITTED, then ACTIVE, then FINISHED after `polls_to_finish[job_id]` polls."""
+    polls = {}
+    lock = threading.Lock()
+
+    def callback(request, context):
+        job_id = request.path.rsplit("/", 1)[-1]
+        if job_id not in polls_to_finish:
+            context.status_code = 404
+            return {"error": "Not found"}
+        with lock:
+            polls[job_id] = polls.get(job_id, 0) + 1
+            count = polls[job_id]
+        if count >= polls_to_finish[job_id]:
+            return make_status(job_id, "FINISHED")
+        return make_status(job_id, "SUBMITTED" if count == 1 else "ACTIVE")
+
+    return callback
+
+# All jobs are polled until terminal, unknown jobs are dropped with their error
+def test_watcher_wait_all(make_status):
+    client = make_client()
+    completed = []
+
+    with requests_mock.Mocker() as m:
+        m.get(re.compile(f"{BASE_URL}/transfer/.*"), json=lifecycle_callback(make_status, {"job-1": 2, "job-2": 4}))
+        with TransferWatcher(client, min_interval=0.01, max_interval=0.05, max_rate=1000,
+                             on_complete=lambda job_id, result: completed.append(job_id)) as watcher:
+            watcher.watch("job-1", "job-2", "job-missing")
+            results = watcher.wait_all(timeout=5)
+
+    assert set(results) == {"job-1", "job-2", "job-missing"}
+    assert results["job-2"].jobState == "FINISHED"
+    assert isinstance(results["job-missing"], EOSCClientError)
+    assert sorted(completed) == sorted(results)
+    assert watcher.pending == []
+
+# Completed jobs are yielded as they finish
+def test_watcher_as_completed(make_status):
+    client = make_client()
+
+    with requests_mock.Mocker() as m:
+        m.get(re.compile(f"{BASE_URL}/transfer/.*"), json=lifecycle_callback(make_status, {"job-fast": 1, "job-slow": 5}))
+        with TransferWatcher(client, min_interval=0.01, max_interval=0.05, max_rate=1000) as watcher:
+            watcher.watch("job-slow", "job-fast")
+            assert "job-fast" in watcher.wait_any(timeout=5)
+            order = [job_id for job_id, _ in watcher.as_completed(timeout=5)]
+
+    assert order == ["job-fast", "job-slow"]
+
+# wait_all gives up after the timeout
+def test_watcher_timeout(make_status):
+    client = make_client()
+
+    with requests_mock.Mocker() as m:
+        m.get(re.compile(f"{BASE_URL}/transfer/.*"), json=lifecycle_callback(make_status, {"job-1": 10 ** 6}))
+        with TransferWatcher(client, min_interval=0.01, max_rate=1000) as watcher:
+            watcher.watch("job-1")
+            with pytest.raises(TimeoutError):
+                watcher.wait_all(timeout=0.1)
+
+# A job watched again after unwatch is polled on a single schedule, not once per watch
+def test_watcher_rewatch(make_status):
+    client = make_client()
+
+    with requests_mock.Mocker() as m:
+        m.get(re.compile(f"{BASE_URL}/transfer/.*"), json=lifecycle_callback(make_status, {"job-1": 10 ** 6}))
+        with TransferWatcher(client, min_interval=0.1, max_interval=0.1, max_rate=1000) as watcher:
+            for _ in range(5):
+                watcher.watch("job-1")
+                watcher.unwatch("job-1")
+            watcher.watch("job-1")
+            time.sleep(0.5)
+        polls = m.call_count
+
+    assert watcher.pending == ["job-1"]
+    assert polls <= 8